@@ -1,902 +1,751 @@
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.slide import SlidePart
 from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.oxml.ns import nsmap
+import argparse
+import copy
 import os
+from collections import OrderedDict
+
+import deck_charts
+import deck_colors
+import deck_images
+import deck_layout
+import deck_media
+import deck_profile
+import deck_reproducible
+import deck_shapes
+import deck_spec
+import deck_theme
+import deck_trend_stats
+import deck_trends
+import text_fit
+
+# 슬라이드 크기 (16:9)
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+
+# 기본 저장 경로
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'iRUSH_Homepage_Concept.pptx')
+
+# 프로세스 안의 모든 덱이 공유하는 이미지 레지스트리
+MEDIA = deck_media.MediaRegistry()
+
+def theme_of(spec):
+    """슬라이드 스펙의 테마 (deck_spec이 컴파일 때 theme 경로를 넣어 둠)"""
+    return deck_theme.load_theme(spec.get("theme") or deck_spec.theme_path(deck_spec.DEFAULT_THEME))
+
+def new_presentation():
+    """빈 16:9 프레젠테이션 생성"""
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    return prs
+
+def save_deck(prs, file):
+    """덱 저장 — 같은 입력이면 바이트까지 같은 파일 (deck_reproducible)"""
+    deck_reproducible.save(prs, file)
+
+def _fast_add_slide_supported():
+    """add_blank_slide가 쓰는 python-pptx 내부 API가 있는지 (없으면 prs.slides.add_slide 사용)"""
+    from pptx.opc.package import _Relationships
+    from pptx.oxml.presentation import CT_SlideIdList
+    from pptx.parts.presentation import PresentationPart
+
+    return (isinstance(getattr(PresentationPart, "_next_slide_partname", None), property)
+            and hasattr(_Relationships, "_add_relationship")
+            and hasattr(CT_SlideIdList, "_add_sldId"))
+
+
+FAST_ADD_SLIDE = _fast_add_slide_supported()
+
+def _next_slide_id(prs, sld_id_lst):
+    """새 슬라이드 id (지금까지 쓴 가장 큰 id + 1)
+
+    최댓값은 덱마다 기억해 두고, 마지막 sldId 요소나 슬라이드 수가 바뀌었으면(다른 코드가
+    슬라이드를 추가/삭제/재배치함) 전체를 다시 훑는다.
+    """
+    last = sld_id_lst[-1] if len(sld_id_lst) else None
+    cached = getattr(prs, "_deck_slide_ids", None)
+    if cached is not None and cached[0] is last and cached[1] == len(sld_id_lst):
+        return cached[2]
+    return max([255] + [int(sld_id.get("id")) for sld_id in sld_id_lst]) + 1
+
+def add_blank_slide(prs):
+    """빈 레이아웃 슬라이드 추가
+
+    스트리밍 저장(deck_stream) 중이면 새 슬라이드를 만들기 전에 완성된 슬라이드를 먼저 내보낸다.
+    """
+    before_add_slide = getattr(prs, "before_add_slide", None)
+    if before_add_slide is not None:
+        before_add_slide()
+
+    layout = prs.slide_layouts[6]
+    sld_id_lst = getattr(prs.slides, "_sldIdLst", None) if FAST_ADD_SLIDE else None
+    if sld_id_lst is None:
+        return prs.slides.add_slide(layout)
+
+    # prs.slides.add_slide()와 같은 결과지만, relate_to()가 기존 관계를 모두 훑고 새 슬라이드
+    # id를 구할 때 sldId를 모두 읽어 슬라이드 수에 비례하는 시간이 들기 때문에
+    # 수천 장짜리 덱에서는 전체가 제곱 시간이 된다. 새 파트라 찾을 관계가 없으므로 바로
+    # 관계를 추가하고, id는 _next_slide_id가 기억해 둔 최댓값으로 정한다.
+    prs_part = prs.part
+    slide_part = SlidePart.new(prs_part._next_slide_partname, prs_part.package, layout.part)
+    rId = prs_part.rels._add_relationship(RT.SLIDE, slide_part)
+    slide = slide_part.slide
+    slide.shapes.clone_layout_placeholders(layout)
+    next_id = _next_slide_id(prs, sld_id_lst)
+    sld_id = sld_id_lst._add_sldId(id=next_id, rId=rId)
+    prs._deck_slide_ids = (sld_id, len(sld_id_lst), next_id + 1)
+    return slide
+
+def _draw_gradient_background(slide, theme):
+    """화려한 그라디언트 배경 도형 생성"""
+    c = theme.colors
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        # 메인 배경
+        shapes.rect(0, 0, SLIDE_WIDTH, SLIDE_HEIGHT, c["DARK_BG"])
+
+        # 좌상단 장식 원 (더 어둡게)
+        shapes.oval(Inches(-3), Inches(-3), Inches(5), Inches(5), c["GLOW_RED"])
+
+        # 우하단 장식 원 (더 어둡게)
+        shapes.oval(Inches(11), Inches(5), Inches(4), Inches(4), c["GLOW_CYAN"])
+
+        # 중앙 하단 악센트 (더 어둡게, 위치 조정)
+        shapes.oval(Inches(4), Inches(5.5), Inches(3), Inches(3), c["GLOW_GOLD"])
+
+def _draw_simple_dark_bg(slide, theme):
+    """심플한 다크 배경 도형 생성"""
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        shapes.rect(0, 0, SLIDE_WIDTH, SLIDE_HEIGHT, theme.colors["DARK_BG"])
+
+def add_accent_line(shapes, x, y, width, color):
+    """악센트 라인 추가 (shapes는 deck_shapes.ShapeBatch)"""
+    shapes.rect(Inches(x), Inches(y), Inches(width), Pt(4), color)
+
+def _draw_decorative_elements(slide, theme):
+    """장식 요소 도형 생성"""
+    c = theme.colors
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        # 우측 상단 작은 사각형들
+        for i in range(3):
+            shapes.rect(
+                Inches(11.5 + i * 0.4), Inches(0.5 + i * 0.3),
+                Inches(0.15), Inches(0.15),
+                c["ACCENT_YELLOW"] if i == 0 else (c["ACCENT_RED"] if i == 1 else c["ACCENT_CYAN"])
+            )
 
-# 프레젠테이션 생성
-prs = Presentation()
-prs.slide_width = Inches(13.333)  # 16:9
-prs.slide_height = Inches(7.5)
-
-# 색상 정의
-BLACK = RGBColor(0, 0, 0)
-DARK_BG = RGBColor(15, 15, 15)
-WHITE = RGBColor(255, 255, 255)
-ACCENT_YELLOW = RGBColor(255, 255, 0)
-ACCENT_RED = RGBColor(255, 107, 107)
-ACCENT_CYAN = RGBColor(78, 205, 196)
-ACCENT_GOLD = RGBColor(255, 230, 109)
-GRAY = RGBColor(128, 128, 128)
-DARK_GRAY = RGBColor(40, 40, 40)
-LIGHT_GRAY = RGBColor(200, 200, 200)
-
-def add_gradient_background(slide):
+        # 좌측 하단 라인
+        for i in range(2):
+            shapes.rect(Inches(0.5), Inches(6.5 + i * 0.2), Inches(1.5 - i * 0.5), Pt(2), c["GRAY"])
+
+# 배경 도형 XML 캐시 ((그리기 함수 이름, 테마 색상) -> p:sp 요소 목록, 오래 안 쓴 순)
+# Theme 객체를 키로 두면 테마를 다시 읽을 때마다 이전 Theme과 조각이 계속 남으므로 색상 값으로 찾는다
+_FRAGMENT_CACHE = OrderedDict()
+FRAGMENT_CACHE_SIZE = 32
+
+def _shape_fragment(draw, theme):
+    """그리기 함수의 결과 도형을 테마 색상마다 한 번만 만들어 XML 조각으로 캐시"""
+    key = (draw.__name__, tuple(sorted(theme.colors.items())))
+    fragment = _FRAGMENT_CACHE.get(key)
+    if fragment is not None:
+        _FRAGMENT_CACHE.move_to_end(key)
+        return fragment
+    slide = add_blank_slide(new_presentation())
+    draw(slide, theme)
+    fragment = [copy.deepcopy(elm) for elm in slide.shapes._spTree.iter_shape_elms()]
+    _FRAGMENT_CACHE[key] = fragment
+    if len(_FRAGMENT_CACHE) > FRAGMENT_CACHE_SIZE:
+        _FRAGMENT_CACHE.popitem(last=False)
+    return fragment
+
+def _clone_fragment(slide, fragment):
+    """캐시된 도형 조각을 슬라이드에 복제 (도형 id/이름은 슬라이드 기준으로 재부여)"""
+    sp_tree = slide.shapes._spTree
+    shape_id = sp_tree.max_shape_id
+    for elm in fragment:
+        shape_id += 1
+        sp = copy.deepcopy(elm)
+        c_nv_pr = sp.xpath("./*[1]/p:cNvPr")[0]
+        c_nv_pr.set("id", str(shape_id))
+        c_nv_pr.set("name", "%s %d" % (c_nv_pr.get("name").rsplit(" ", 1)[0], shape_id - 1))
+        sp_tree.insert_element_before(sp, "p:extLst")
+
+def add_gradient_background(slide, theme):
     """화려한 그라디언트 배경 추가"""
-    # 메인 배경
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = DARK_BG
-    bg.line.fill.background()
-
-    # 좌상단 장식 원 (더 어둡게)
-    circle1 = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(-3), Inches(-3), Inches(5), Inches(5))
-    circle1.fill.solid()
-    circle1.fill.fore_color.rgb = RGBColor(80, 30, 30)
-    circle1.line.fill.background()
-
-    # 우하단 장식 원 (더 어둡게)
-    circle2 = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(11), Inches(5), Inches(4), Inches(4))
-    circle2.fill.solid()
-    circle2.fill.fore_color.rgb = RGBColor(25, 60, 60)
-    circle2.line.fill.background()
-
-    # 중앙 하단 악센트 (더 어둡게, 위치 조정)
-    circle3 = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(4), Inches(5.5), Inches(3), Inches(3))
-    circle3.fill.solid()
-    circle3.fill.fore_color.rgb = RGBColor(60, 60, 20)
-    circle3.line.fill.background()
-
-def add_simple_dark_bg(slide):
+    _clone_fragment(slide, _shape_fragment(_draw_gradient_background, theme))
+
+def add_simple_dark_bg(slide, theme):
     """심플한 다크 배경"""
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = DARK_BG
-    bg.line.fill.background()
-
-def add_accent_line(slide, x, y, width, color):
-    """악센트 라인 추가"""
-    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(y), Inches(width), Pt(4))
-    line.fill.solid()
-    line.fill.fore_color.rgb = color
-    line.line.fill.background()
-
-def add_decorative_elements(slide):
+    _clone_fragment(slide, _shape_fragment(_draw_simple_dark_bg, theme))
+
+def add_decorative_elements(slide, theme):
     """장식 요소 추가"""
-    # 우측 상단 작은 사각형들
-    for i in range(3):
-        sq = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(11.5 + i * 0.4), Inches(0.5 + i * 0.3),
-            Inches(0.15), Inches(0.15)
-        )
-        sq.fill.solid()
-        sq.fill.fore_color.rgb = ACCENT_YELLOW if i == 0 else (ACCENT_RED if i == 1 else ACCENT_CYAN)
-        sq.line.fill.background()
-
-    # 좌측 하단 라인
-    for i in range(2):
-        ln = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(6.5 + i * 0.2),
-            Inches(1.5 - i * 0.5), Pt(2)
-        )
-        ln.fill.solid()
-        ln.fill.fore_color.rgb = GRAY
-        ln.line.fill.background()
-
-def add_number_badge(slide, number, x, y, color):
-    """숫자 배지 추가"""
+    _clone_fragment(slide, _shape_fragment(_draw_decorative_elements, theme))
+
+def add_number_badge(shapes, theme, number, x, y, color):
+    """숫자 배지 추가 (shapes는 deck_shapes.ShapeBatch)"""
     # 배경 원
-    circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x), Inches(y), Inches(0.6), Inches(0.6))
-    circle.fill.solid()
-    circle.fill.fore_color.rgb = color
-    circle.line.fill.background()
+    shapes.oval(Inches(x), Inches(y), Inches(0.6), Inches(0.6), color)
 
     # 숫자
-    num_box = slide.shapes.add_textbox(Inches(x), Inches(y + 0.12), Inches(0.6), Inches(0.4))
-    tf = num_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = str(number)
-    p.font.size = Pt(18)
-    p.font.bold = True
-    p.font.color.rgb = BLACK
-    p.alignment = PP_ALIGN.CENTER
+    shapes.textbox(Inches(x), Inches(y + 0.12), Inches(0.6), Inches(0.4), str(number), theme.style("badge"))
+
+def add_section_title(shapes, theme, number, title, color):
+    """섹션 번호 배지 + 타이틀 + 악센트 라인"""
+    add_number_badge(shapes, theme, number, 0.8, 0.5, color)
+    shapes.textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1), title, theme.style("title"))
+    add_accent_line(shapes, 1.6, 1.2, 2, color)
+
+# 이어지는 슬라이드의 섹션 타이틀 뒤에 붙는 표시
+CONTINUED = " (계속)"
+
+def section_slides(prs, spec, theme, pages, decorative=False):
+    """페이지마다 배경과 섹션 타이틀이 있는 슬라이드를 만들어 (ShapeBatch, 페이지)를 넘겨줌
+
+    pages는 deck_layout.paginate()/overflow_pages()가 만드는 슬라이드 단위 스트림이다.
+    두 번째 슬라이드부터는 타이틀 뒤에 CONTINUED를 붙인다.
+    """
+    for n, page in enumerate(pages):
+        slide = add_blank_slide(prs)
+        add_simple_dark_bg(slide, theme)
+        if decorative:
+            add_decorative_elements(slide, theme)
+        with deck_shapes.ShapeBatch(slide) as shapes:
+            title = spec["title"] if n == 0 else spec["title"] + CONTINUED
+            add_section_title(shapes, theme, spec["number"], title, theme.color(spec["color"]))
+            yield shapes, page
 
 # === 슬라이드 1: 표지 ===
-def create_cover_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_gradient_background(slide)
-
-    # 대형 타이틀
-    title_box = slide.shapes.add_textbox(Inches(0.8), Inches(2), Inches(12), Inches(2))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "iRUSH"
-    p.font.size = Pt(120)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.CENTER
-
-    # 서브타이틀
-    sub_box = slide.shapes.add_textbox(Inches(0.8), Inches(4.3), Inches(12), Inches(1))
-    tf = sub_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "DIGITAL CREATIVE AGENCY"
-    p.font.size = Pt(28)
-    p.font.color.rgb = ACCENT_YELLOW
-    p.alignment = PP_ALIGN.CENTER
-    p.font.bold = True
-
-    # 하단 설명
-    desc_box = slide.shapes.add_textbox(Inches(0.8), Inches(5.5), Inches(12), Inches(1))
-    tf = desc_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Homepage Concept Presentation"
-    p.font.size = Pt(16)
-    p.font.color.rgb = GRAY
-    p.alignment = PP_ALIGN.CENTER
-
-    # 장식 라인
-    add_accent_line(slide, 5.5, 5.2, 2.3, ACCENT_YELLOW)
-
-    # 연도 표시
-    year_box = slide.shapes.add_textbox(Inches(11.5), Inches(6.8), Inches(1.5), Inches(0.5))
-    tf = year_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "2024"
-    p.font.size = Pt(14)
-    p.font.color.rgb = GRAY
+def create_cover_slide(prs, spec):
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_gradient_background(slide, theme)
+
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        # 대형 타이틀
+        shapes.textbox(Inches(0.8), Inches(2), Inches(12), Inches(2), spec["title"], theme.style("display"),
+                       name="cover.title")
+
+        # 서브타이틀
+        shapes.textbox(Inches(0.8), Inches(4.3), Inches(12), Inches(1), spec["subtitle"],
+                       theme.style("display", size=28, color="ACCENT_YELLOW"), name="cover.subtitle")
+
+        # 하단 설명
+        shapes.textbox(Inches(0.8), Inches(5.5), Inches(12), Inches(1), spec["description"],
+                       theme.style("caption", size=16, align="center"), name="cover.description")
+
+        # 장식 라인
+        add_accent_line(shapes, 5.5, 5.2, 2.3, theme.colors["ACCENT_YELLOW"])
+
+        # 연도 표시
+        shapes.textbox(Inches(11.5), Inches(6.8), Inches(1.5), Inches(0.5), spec["year"],
+                       theme.style("caption", size=14), name="cover.year")
 
 # === 슬라이드 2: 프로젝트 개요 ===
-def create_overview_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-    add_decorative_elements(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "01", 0.8, 0.5, ACCENT_YELLOW)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "PROJECT OVERVIEW"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_YELLOW)
-
-    # 좌측 컬럼 - 프로젝트 정보
-    info_items = [
-        ("PROJECT", "iRUSH 홈페이지 리뉴얼"),
-        ("CLIENT", "iRUSH"),
-        ("TYPE", "Corporate Website"),
-        ("YEAR", "2024")
-    ]
-
-    y_pos = 1.8
-    for label, value in info_items:
-        # 라벨
-        lbl_box = slide.shapes.add_textbox(Inches(1.6), Inches(y_pos), Inches(2), Inches(0.4))
-        tf = lbl_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = label
-        p.font.size = Pt(12)
-        p.font.color.rgb = ACCENT_YELLOW
-        p.font.bold = True
-
-        # 값
-        val_box = slide.shapes.add_textbox(Inches(1.6), Inches(y_pos + 0.35), Inches(4), Inches(0.5))
-        tf = val_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(18)
-        p.font.color.rgb = WHITE
-
-        y_pos += 1
-
-    # 우측 컬럼 - 목적 및 타겟
-    # 박스 배경
-    box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(6.5), Inches(1.8), Inches(6), Inches(4.5))
-    box.fill.solid()
-    box.fill.fore_color.rgb = DARK_GRAY
-    box.line.color.rgb = RGBColor(60, 60, 60)
-    box.line.width = Pt(1)
-
-    # 목적
-    obj_title = slide.shapes.add_textbox(Inches(7), Inches(2.1), Inches(5), Inches(0.5))
-    tf = obj_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "OBJECTIVE"
-    p.font.size = Pt(14)
-    p.font.color.rgb = ACCENT_RED
-    p.font.bold = True
-
-    obj_text = slide.shapes.add_textbox(Inches(7), Inches(2.6), Inches(5.2), Inches(1.5))
-    tf = obj_text.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "24년간의 경험과 전문성을 현대적인 디자인으로 표현하고, 자동화된 IT 트렌드 뉴스 서비스로 업계 선도 기업 이미지 강화"
-    p.font.size = Pt(15)
-    p.font.color.rgb = LIGHT_GRAY
-
-    # 핵심 메시지
-    msg_title = slide.shapes.add_textbox(Inches(7), Inches(4.3), Inches(5), Inches(0.5))
-    tf = msg_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "KEY MESSAGE"
-    p.font.size = Pt(14)
-    p.font.color.rgb = ACCENT_CYAN
-    p.font.bold = True
-
-    msg_text = slide.shapes.add_textbox(Inches(7), Inches(4.8), Inches(5.2), Inches(1))
-    tf = msg_text.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "FEVER to Create • BLISS to Deliver • FAITH to Succeed"
-    p.font.size = Pt(16)
-    p.font.color.rgb = WHITE
-    p.font.bold = True
+OVERVIEW_INFO = deck_layout.Grid(left=1.6, top=1.8, cell_width=4, cell_height=1, gap=0, columns=1)
+
+def create_overview_slide(prs, spec):
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_simple_dark_bg(slide, theme)
+    add_decorative_elements(slide, theme)
+
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        add_section_title(shapes, theme, spec["number"], spec["title"], theme.color(spec["color"]))
+
+        # 좌측 컬럼 - 프로젝트 정보
+        for item, box in zip(spec["info_items"], OVERVIEW_INFO.cells(len(spec["info_items"]))):
+            # 라벨
+            shapes.textbox(Inches(box.x), Inches(box.y), Inches(2), Inches(0.4), item["label"],
+                           theme.style("label", size=12, color="ACCENT_YELLOW"))
+
+            # 값
+            shapes.textbox(Inches(box.x), Inches(box.y + 0.35), Inches(box.w), Inches(0.5), item["value"],
+                           theme.style("body", size=18, color="WHITE"))
+
+        # 우측 컬럼 - 목적 및 타겟
+        # 박스 배경
+        shapes.rounded_rect(Inches(6.5), Inches(1.8), Inches(6), Inches(4.5), theme.colors["DARK_GRAY"],
+                            line=theme.colors["DIVIDER"], line_width=Pt(1))
+
+        # 목적
+        shapes.textbox(Inches(7), Inches(2.1), Inches(5), Inches(0.5), spec["objective_title"],
+                       theme.style("label", color="ACCENT_RED"))
+        shapes.textbox(Inches(7), Inches(2.6), Inches(5.2), Inches(1.5), spec["objective"],
+                       theme.style("body", size=15), wrap=True)
+
+        # 핵심 메시지
+        shapes.textbox(Inches(7), Inches(4.3), Inches(5), Inches(0.5), spec["message_title"],
+                       theme.style("label", color="ACCENT_CYAN"))
+        shapes.textbox(Inches(7), Inches(4.8), Inches(5.2), Inches(1), spec["message"],
+                       theme.style("heading"), wrap=True)
 
 # === 슬라이드 3: 핵심 가치 ===
-def create_values_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "02", 0.8, 0.5, ACCENT_RED)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "CORE VALUES"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_RED)
-
-    values = [
-        ("FEVER", "to Create", "창작에 대한 뜨거운 열정.\n매 프로젝트에 혼신의 열정을\n쏟아붓습니다.", ACCENT_RED),
-        ("BLISS", "to Deliver", "전달하는 기쁨.\n완벽한 결과물을 전달할 때\n느끼는 충만한 행복.", ACCENT_CYAN),
-        ("FAITH", "to Succeed", "성공에 대한 믿음.\n고객과 함께 성공할 수 있다는\n굳건한 신념.", ACCENT_GOLD)
-    ]
-
-    start_x = 1
-    for i, (title, subtitle, desc, color) in enumerate(values):
-        x = start_x + i * 4
-
-        # 카드 배경
-        card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(x), Inches(1.8), Inches(3.8), Inches(5)
-        )
-        card.fill.solid()
-        card.fill.fore_color.rgb = RGBColor(25, 25, 25)
-        card.line.color.rgb = color
-        card.line.width = Pt(3)
-
-        # 상단 악센트 바
-        accent_bar = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(x), Inches(1.8), Inches(3.8), Inches(0.15)
-        )
-        accent_bar.fill.solid()
-        accent_bar.fill.fore_color.rgb = color
-        accent_bar.line.fill.background()
-
-        # 번호
-        num_box = slide.shapes.add_textbox(Inches(x + 0.3), Inches(2.2), Inches(1), Inches(0.5))
-        tf = num_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"0{i+1}"
-        p.font.size = Pt(14)
-        p.font.color.rgb = color
-
-        # 타이틀
-        t_box = slide.shapes.add_textbox(Inches(x + 0.3), Inches(2.7), Inches(3.2), Inches(1))
-        tf = t_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(42)
-        p.font.bold = True
-        p.font.color.rgb = color
+VALUES_GRID = deck_layout.Grid(left=1, top=1.8, cell_width=3.8, cell_height=5, gap=0.2)
 
-        # 서브타이틀
-        s_box = slide.shapes.add_textbox(Inches(x + 0.3), Inches(3.8), Inches(3.2), Inches(0.5))
-        tf = s_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = subtitle
-        p.font.size = Pt(18)
-        p.font.color.rgb = WHITE
-        p.font.italic = True
+def create_values_slide(prs, spec):
+    theme = theme_of(spec)
+    for shapes, page in section_slides(prs, spec, theme, deck_layout.paginate(spec["values"], VALUES_GRID)):
+        for i, value, box in page:
+            color = theme.color(value["color"])
+            text_width = box.w - 0.6
 
-        # 설명
-        d_box = slide.shapes.add_textbox(Inches(x + 0.3), Inches(4.5), Inches(3.2), Inches(2))
-        tf = d_box.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = desc
-        p.font.size = Pt(14)
-        p.font.color.rgb = GRAY
-        p.line_spacing = 1.5
+            # 카드 배경
+            shapes.rounded_rect(Inches(box.x), Inches(box.y), Inches(box.w), Inches(box.h), theme.colors["CARD_BG"],
+                                line=color, line_width=Pt(3))
+
+            # 상단 악센트 바
+            shapes.rect(Inches(box.x), Inches(box.y), Inches(box.w), Inches(0.15), color)
+
+            # 번호
+            shapes.textbox(Inches(box.x + 0.3), Inches(box.y + 0.4), Inches(1), Inches(0.5), f"0{i+1}",
+                           theme.style("body", color=color))
+
+            # 타이틀
+            shapes.textbox(Inches(box.x + 0.3), Inches(box.y + 0.9), Inches(text_width), Inches(1), value["title"],
+                           theme.style("title", size=42, color=color))
+
+            # 서브타이틀
+            shapes.textbox(Inches(box.x + 0.3), Inches(box.y + 2), Inches(text_width), Inches(0.5), value["subtitle"],
+                           theme.style("body", size=18, color="WHITE", italic=True))
+
+            # 설명
+            size = text_fit.fit_font_size(value["description"], text_width, 2, 14, min_size=10,
+                                          line_spacing=1.2 * 1.5)
+            shapes.textbox(Inches(box.x + 0.3), Inches(box.y + 2.7), Inches(text_width), Inches(2),
+                           value["description"], theme.style("caption", size=size, line_spacing=1.5), wrap=True)
 
 # === 슬라이드 4: 통계 ===
-def create_stats_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-
-    # 큰 배경 텍스트
-    bg_text = slide.shapes.add_textbox(Inches(-1), Inches(1.5), Inches(15), Inches(5))
-    tf = bg_text.text_frame
-    p = tf.paragraphs[0]
-    p.text = "STATISTICS"
-    p.font.size = Pt(150)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(30, 30, 30)
-    p.alignment = PP_ALIGN.CENTER
-
-    # 섹션 번호
-    add_number_badge(slide, "03", 0.8, 0.5, ACCENT_CYAN)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "KEY STATISTICS"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    stats = [
-        ("24", "+", "YEARS", "2002년부터 시작된 여정", ACCENT_YELLOW),
-        ("500", "+", "PROJECTS", "다양한 프로젝트 경험", ACCENT_RED),
-        ("100", "%", "PASSION", "고객 만족 최우선", ACCENT_CYAN)
-    ]
-
-    start_x = 1.2
-    for i, (num, suffix, label, desc, color) in enumerate(stats):
-        x = start_x + i * 4
-
-        # 숫자
-        num_box = slide.shapes.add_textbox(Inches(x), Inches(2.5), Inches(3.5), Inches(2))
-        tf = num_box.text_frame
-        p = tf.paragraphs[0]
-        run = p.add_run()
-        run.text = num
-        run.font.size = Pt(100)
-        run.font.bold = True
-        run.font.color.rgb = color
-
-        # suffix
-        run2 = p.add_run()
-        run2.text = suffix
-        run2.font.size = Pt(50)
-        run2.font.bold = True
-        run2.font.color.rgb = WHITE
-
-        # 라벨
-        lbl_box = slide.shapes.add_textbox(Inches(x), Inches(4.7), Inches(3.5), Inches(0.5))
-        tf = lbl_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = label
-        p.font.size = Pt(20)
-        p.font.bold = True
-        p.font.color.rgb = WHITE
-
-        # 구분선
-        line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(5.3), Inches(2), Pt(2))
-        line.fill.solid()
-        line.fill.fore_color.rgb = color
-        line.line.fill.background()
+STATS_GRID = deck_layout.Grid(left=1.2, top=2.5, cell_width=3.5, cell_height=4, gap=0.5)
 
-        # 설명
-        desc_box = slide.shapes.add_textbox(Inches(x), Inches(5.5), Inches(3.5), Inches(1))
-        tf = desc_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = desc
-        p.font.size = Pt(14)
-        p.font.color.rgb = GRAY
+def create_stats_slide(prs, spec):
+    theme = theme_of(spec)
+    for n, page in enumerate(deck_layout.paginate(spec["stats"], STATS_GRID)):
+        slide = add_blank_slide(prs)
+        add_simple_dark_bg(slide, theme)
+
+        with deck_shapes.ShapeBatch(slide) as shapes:
+            # 큰 배경 텍스트
+            shapes.textbox(Inches(-1), Inches(1.5), Inches(15), Inches(5), spec["background_text"],
+                           theme.style("display", size=150, color="WATERMARK"))
+
+            # 섹션 번호
+            add_number_badge(shapes, theme, spec["number"], 0.8, 0.5, theme.color(spec["color"]))
+
+            # 타이틀
+            title = spec["title"] if n == 0 else spec["title"] + CONTINUED
+            shapes.textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1), title, theme.style("title"))
+
+            for i, stat, box in page:
+                color = theme.color(stat["color"])
+
+                # 숫자 + suffix
+                shapes.rich_textbox(Inches(box.x), Inches(box.y), Inches(box.w), Inches(2), [
+                    (stat["value"], theme.style("display", size=100, color=color)),
+                    (stat["suffix"], theme.style("display", size=50)),
+                ], name=f"stats.{i}.value")
+
+                # 라벨
+                shapes.textbox(Inches(box.x), Inches(box.y + 2.2), Inches(box.w), Inches(0.5), stat["label"],
+                               theme.style("heading", size=20), name=f"stats.{i}.label")
+
+                # 구분선
+                shapes.rect(Inches(box.x), Inches(box.y + 2.8), Inches(2), Pt(2), color)
+
+                # 설명
+                shapes.textbox(Inches(box.x), Inches(box.y + 3), Inches(box.w), Inches(1), stat["description"],
+                               theme.style("caption", size=14), name=f"stats.{i}.description")
 
 # === 슬라이드 5: 기술 스택 ===
-def create_tech_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-    add_decorative_elements(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "04", 0.8, 0.5, ACCENT_GOLD)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "TECH STACK"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_GOLD)
-
-    tech_items = [
-        ("FRONTEND", [
-            ("React 19", "최신 UI 라이브러리"),
-            ("Vite", "초고속 빌드 도구"),
-            ("GSAP", "프리미엄 애니메이션"),
-            ("Framer Motion", "부드러운 트랜지션")
-        ], ACCENT_RED),
-        ("BACKEND", [
-            ("GitHub Actions", "자동화 워크플로우"),
-            ("Cheerio", "웹 크롤링 엔진"),
-            ("Node.js", "서버 스크립트")
-        ], ACCENT_CYAN),
-        ("DEPLOY", [
-            ("Vercel", "자동 배포"),
-            ("GitHub", "버전 관리"),
-            ("CDN", "글로벌 배포")
-        ], ACCENT_GOLD)
-    ]
-
-    start_x = 0.8
-    for i, (category, items, color) in enumerate(tech_items):
-        x = start_x + i * 4.2
-
-        # 카테고리 헤더
-        cat_box = slide.shapes.add_textbox(Inches(x), Inches(1.7), Inches(3.8), Inches(0.5))
-        tf = cat_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = category
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = color
-
-        # 아이템들
-        y = 2.3
-        for name, desc in items:
-            # 배경 박스
-            item_bg = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x), Inches(y), Inches(3.8), Inches(1)
-            )
-            item_bg.fill.solid()
-            item_bg.fill.fore_color.rgb = DARK_GRAY
-            item_bg.line.fill.background()
+TECH_GRID = deck_layout.Grid(left=0.8, top=1.7, cell_width=3.8, cell_height=5.3, gap=0.4)
 
-            # 이름
-            name_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(y + 0.15), Inches(3.4), Inches(0.4))
-            tf = name_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = name
-            p.font.size = Pt(16)
-            p.font.bold = True
-            p.font.color.rgb = WHITE
+def tech_item_rows(box):
+    """기술 카테고리 칸 안의 아이템 목록 배치"""
+    return deck_layout.Grid(box.x, box.y + 0.6, box.w, 1, gap=0.15, columns=1, bottom=box.bottom)
 
-            # 설명
-            desc_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(y + 0.55), Inches(3.4), Inches(0.4))
-            tf = desc_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = desc
-            p.font.size = Pt(11)
-            p.font.color.rgb = GRAY
+def create_tech_slide(prs, spec):
+    theme = theme_of(spec)
+    pages = deck_layout.overflow_pages(spec["tech_items"], TECH_GRID, lambda tech: tech["items"], tech_item_rows)
+    for shapes, page in section_slides(prs, spec, theme, pages, decorative=True):
+        for _, tech, box, rows in page:
+            color = theme.color(tech["color"])
+
+            # 카테고리 헤더
+            shapes.textbox(Inches(box.x), Inches(box.y), Inches(box.w), Inches(0.5), tech["category"],
+                           theme.style("heading", color=color))
 
-            y += 1.15
+            # 아이템들
+            for item, row in rows:
+                # 배경 박스
+                shapes.rounded_rect(Inches(row.x), Inches(row.y), Inches(row.w), Inches(row.h),
+                                    theme.colors["DARK_GRAY"])
+
+                # 이름
+                shapes.textbox(Inches(row.x + 0.2), Inches(row.y + 0.15), Inches(row.w - 0.4), Inches(0.4),
+                               item["name"], theme.style("heading"))
+
+                # 설명
+                shapes.textbox(Inches(row.x + 0.2), Inches(row.y + 0.55), Inches(row.w - 0.4), Inches(0.4),
+                               item["description"], theme.style("caption"))
 
 # === 슬라이드 6: 디자인 컨셉 ===
-def create_design_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "05", 0.8, 0.5, ACCENT_RED)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "DESIGN CONCEPT"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_RED)
-
-    # 컬러 팔레트
-    colors_title = slide.shapes.add_textbox(Inches(0.8), Inches(1.7), Inches(3), Inches(0.5))
-    tf = colors_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "COLOR PALETTE"
-    p.font.size = Pt(14)
-    p.font.color.rgb = ACCENT_YELLOW
-    p.font.bold = True
-
-    palette = [
-        (DARK_BG, "Dark BG", "#0F0F0F"),
-        (ACCENT_YELLOW, "Accent", "#FFFF00"),
-        (ACCENT_RED, "Energy", "#FF6B6B"),
-        (ACCENT_CYAN, "Trust", "#4ECDC4"),
-        (WHITE, "Text", "#FFFFFF")
-    ]
-
-    for i, (color, name, hex_code) in enumerate(palette):
-        x = 0.8 + i * 1.3
-        # 컬러 박스
-        box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(2.2), Inches(1.1), Inches(1.1))
-        box.fill.solid()
-        box.fill.fore_color.rgb = color
-        box.line.color.rgb = RGBColor(60, 60, 60)
-        box.line.width = Pt(1)
-
-        # 이름
-        n_box = slide.shapes.add_textbox(Inches(x), Inches(3.4), Inches(1.1), Inches(0.3))
-        tf = n_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = name
-        p.font.size = Pt(10)
-        p.font.color.rgb = WHITE
-        p.alignment = PP_ALIGN.CENTER
-
-        # HEX
-        h_box = slide.shapes.add_textbox(Inches(x), Inches(3.7), Inches(1.1), Inches(0.3))
-        tf = h_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = hex_code
-        p.font.size = Pt(8)
-        p.font.color.rgb = GRAY
-        p.alignment = PP_ALIGN.CENTER
-
-    # 타이포그래피
-    typo_title = slide.shapes.add_textbox(Inches(7.5), Inches(1.7), Inches(5), Inches(0.5))
-    tf = typo_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "TYPOGRAPHY"
-    p.font.size = Pt(14)
-    p.font.color.rgb = ACCENT_CYAN
-    p.font.bold = True
-
-    fonts = [
-        ("Bebas Neue", "DISPLAY", "대형 타이틀용"),
-        ("Inter", "BODY", "본문 가독성"),
-        ("Noto Sans KR", "KOREAN", "한글 최적화")
-    ]
-
-    y = 2.2
-    for font, role, desc in fonts:
-        # 폰트 박스
-        f_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(7.5), Inches(y), Inches(5), Inches(0.9))
-        f_box.fill.solid()
-        f_box.fill.fore_color.rgb = DARK_GRAY
-        f_box.line.fill.background()
-
-        # 폰트명
-        fn_box = slide.shapes.add_textbox(Inches(7.7), Inches(y + 0.1), Inches(3), Inches(0.4))
-        tf = fn_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = font
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = WHITE
-
-        # 역할
-        r_box = slide.shapes.add_textbox(Inches(7.7), Inches(y + 0.5), Inches(2), Inches(0.3))
-        tf = r_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = role
-        p.font.size = Pt(10)
-        p.font.color.rgb = ACCENT_YELLOW
+DESIGN_PALETTE = deck_layout.Grid(left=0.8, top=2.2, cell_width=1.1, cell_height=1.8, gap=0.2, right=7.3)
+DESIGN_FONTS = deck_layout.Grid(left=7.5, top=2.2, cell_width=5, cell_height=0.9, gap=0.15, columns=1)
+DESIGN_STYLES = deck_layout.Grid(left=0.8, top=4.8, cell_width=6, cell_height=0.4, gap=0.05, columns=1)
 
-        # 설명
-        d_box = slide.shapes.add_textbox(Inches(10), Inches(y + 0.3), Inches(2.3), Inches(0.4))
-        tf = d_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = desc
-        p.font.size = Pt(11)
-        p.font.color.rgb = GRAY
-
-        y += 1.05
-
-    # 비주얼 스타일
-    style_title = slide.shapes.add_textbox(Inches(0.8), Inches(4.3), Inches(5), Inches(0.5))
-    tf = style_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "VISUAL STYLE"
-    p.font.size = Pt(14)
-    p.font.color.rgb = ACCENT_RED
-    p.font.bold = True
-
-    styles = [
-        "다크 테마 기반의 프리미엄 디자인",
-        "대형 타이포그래피와 충분한 여백",
-        "스크롤 트리거 애니메이션",
-        "인터랙티브 파티클 효과"
-    ]
-
-    y = 4.8
-    for style in styles:
-        s_box = slide.shapes.add_textbox(Inches(0.8), Inches(y), Inches(6), Inches(0.4))
-        tf = s_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"→  {style}"
-        p.font.size = Pt(14)
-        p.font.color.rgb = LIGHT_GRAY
-        y += 0.45
+def create_design_slide(prs, spec):
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_simple_dark_bg(slide, theme)
+
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        add_section_title(shapes, theme, spec["number"], spec["title"], theme.color(spec["color"]))
+
+        # 컬러 팔레트
+        shapes.textbox(Inches(0.8), Inches(1.7), Inches(3), Inches(0.5), spec["palette_title"],
+                       theme.style("label", color="ACCENT_YELLOW"))
+
+        for swatch, box in zip(spec["palette"], DESIGN_PALETTE.cells(len(spec["palette"]))):
+            # 컬러 박스
+            shapes.rect(Inches(box.x), Inches(box.y), Inches(box.w), Inches(box.w), theme.color(swatch["color"]),
+                        line=theme.colors["DIVIDER"], line_width=Pt(1))
+
+            # 이름
+            shapes.textbox(Inches(box.x), Inches(box.y + 1.2), Inches(box.w), Inches(0.3), swatch["name"],
+                           theme.style("caption", size=10, color="WHITE", align="center"))
+
+            # HEX
+            shapes.textbox(Inches(box.x), Inches(box.y + 1.5), Inches(box.w), Inches(0.3), swatch["hex"],
+                           theme.style("caption", size=8, align="center"))
+
+        # 타이포그래피
+        shapes.textbox(Inches(7.5), Inches(1.7), Inches(5), Inches(0.5), spec["fonts_title"],
+                       theme.style("label", color="ACCENT_CYAN"))
+
+        for font, box in zip(spec["fonts"], DESIGN_FONTS.cells(len(spec["fonts"]))):
+            # 폰트 박스
+            shapes.rounded_rect(Inches(box.x), Inches(box.y), Inches(box.w), Inches(box.h), theme.colors["DARK_GRAY"])
+
+            # 폰트명
+            shapes.textbox(Inches(box.x + 0.2), Inches(box.y + 0.1), Inches(3), Inches(0.4), font["name"],
+                           theme.style("heading"))
+
+            # 역할
+            shapes.textbox(Inches(box.x + 0.2), Inches(box.y + 0.5), Inches(2), Inches(0.3), font["role"],
+                           theme.style("caption", size=10, color="ACCENT_YELLOW"))
+
+            # 설명
+            shapes.textbox(Inches(box.x + 2.5), Inches(box.y + 0.3), Inches(2.3), Inches(0.4), font["description"],
+                           theme.style("caption"))
+
+        # 비주얼 스타일
+        shapes.textbox(Inches(0.8), Inches(4.3), Inches(5), Inches(0.5), spec["styles_title"],
+                       theme.style("label", color="ACCENT_RED"))
+
+        for style, box in zip(spec["styles"], DESIGN_STYLES.cells(len(spec["styles"]))):
+            shapes.textbox(Inches(box.x), Inches(box.y), Inches(box.w), Inches(box.h), f"→  {style}",
+                           theme.style("body"))
 
 # === 슬라이드 7: 사이트 구조 ===
-def create_structure_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "06", 0.8, 0.5, ACCENT_CYAN)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "SITE STRUCTURE"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_CYAN)
-
-    pages = [
-        ("MAIN", "메인 페이지", ["히어로 비디오 섹션", "핵심 가치 소개", "서비스 영역", "프로젝트 미리보기"], ACCENT_YELLOW),
-        ("ABOUT", "회사 소개", ["Since 2002 히스토리", "철학 및 비전", "팀 구성", "클라이언트"], ACCENT_RED),
-        ("WORK", "프로젝트", ["Featured 슬라이드쇼", "프로젝트 아카이브", "스와이프 네비게이션"], ACCENT_CYAN),
-        ("TREND", "트렌드 데스크", ["자동 수집 IT 뉴스", "파티클 배경", "아코디언 UI"], ACCENT_GOLD)
-    ]
-
-    start_x = 0.6
-    for i, (name, title, features, color) in enumerate(pages):
-        x = start_x + i * 3.2
-
-        # 페이지 카드
-        card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(x), Inches(1.7), Inches(3), Inches(5)
-        )
-        card.fill.solid()
-        card.fill.fore_color.rgb = RGBColor(25, 25, 25)
-        card.line.color.rgb = color
-        card.line.width = Pt(2)
-
-        # 페이지 이름
-        name_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(1.9), Inches(2.6), Inches(0.6))
-        tf = name_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = name
-        p.font.size = Pt(28)
-        p.font.bold = True
-        p.font.color.rgb = color
-
-        # 한글 타이틀
-        kr_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(2.5), Inches(2.6), Inches(0.4))
-        tf = kr_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(12)
-        p.font.color.rgb = WHITE
-
-        # 구분선
-        line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x + 0.2), Inches(3), Inches(2.6), Pt(1))
-        line.fill.solid()
-        line.fill.fore_color.rgb = RGBColor(60, 60, 60)
-        line.line.fill.background()
-
-        # 기능 목록
-        y = 3.2
-        for feature in features:
-            f_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(y), Inches(2.6), Inches(0.5))
-            tf = f_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = f"• {feature}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = GRAY
-            y += 0.5
+STRUCTURE_GRID = deck_layout.Grid(left=0.6, top=1.7, cell_width=3, cell_height=5, gap=0.2)
+
+def structure_feature_rows(box):
+    """페이지 카드 안의 기능 목록 배치"""
+    return deck_layout.Grid(box.x + 0.2, box.y + 1.5, box.w - 0.4, 0.5, gap=0, columns=1, bottom=box.bottom)
+
+def create_structure_slide(prs, spec):
+    theme = theme_of(spec)
+    pages = deck_layout.overflow_pages(spec["pages"], STRUCTURE_GRID, lambda page: page["features"],
+                                       structure_feature_rows)
+    for shapes, page in section_slides(prs, spec, theme, pages):
+        for _, site_page, box, rows in page:
+            color = theme.color(site_page["color"])
+            text_width = box.w - 0.4
+
+            # 페이지 카드
+            shapes.rounded_rect(Inches(box.x), Inches(box.y), Inches(box.w), Inches(box.h), theme.colors["CARD_BG"],
+                                line=color, line_width=Pt(2))
+
+            # 페이지 이름
+            shapes.textbox(Inches(box.x + 0.2), Inches(box.y + 0.2), Inches(text_width), Inches(0.6),
+                           site_page["name"], theme.style("title", size=28, color=color))
+
+            # 한글 타이틀
+            shapes.textbox(Inches(box.x + 0.2), Inches(box.y + 0.8), Inches(text_width), Inches(0.4),
+                           site_page["title"], theme.style("caption", size=12, color="WHITE"))
+
+            # 구분선
+            shapes.rect(Inches(box.x + 0.2), Inches(box.y + 1.3), Inches(text_width), Pt(1), theme.colors["DIVIDER"])
+
+            # 기능 목록
+            for feature, row in rows:
+                shapes.textbox(Inches(row.x), Inches(row.y), Inches(row.w), Inches(row.h), f"• {feature}",
+                               theme.style("caption"))
 
 # === 슬라이드 8: 주요 기능 ===
-def create_features_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-    add_decorative_elements(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "07", 0.8, 0.5, ACCENT_YELLOW)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "KEY FEATURES"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_YELLOW)
-
-    features = [
-        ("AUTO CRAWLING", "자동 뉴스 크롤링", "매일 오전 9시 GitHub Actions로\nZDNet Korea, ITWorld Korea에서\n최신 IT 뉴스를 자동 수집", ACCENT_RED),
-        ("ANIMATIONS", "인터랙티브 애니메이션", "GSAP & Framer Motion 기반\n스크롤 트리거, 패럴랙스,\n마우스 반응형 파티클", ACCENT_CYAN),
-        ("RESPONSIVE", "반응형 디자인", "모바일, 태블릿, 데스크톱\n모든 디바이스에 최적화된\n사용자 경험 제공", ACCENT_GOLD)
-    ]
-
-    start_x = 0.8
-    for i, (title, subtitle, desc, color) in enumerate(features):
-        x = start_x + i * 4.2
-
-        # 아이콘 영역
-        icon_bg = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x + 1.3), Inches(1.8), Inches(1), Inches(1))
-        icon_bg.fill.solid()
-        icon_bg.fill.fore_color.rgb = color
-        icon_bg.line.fill.background()
-
-        # 아이콘 텍스트
-        icon_text = slide.shapes.add_textbox(Inches(x + 1.3), Inches(2.05), Inches(1), Inches(0.6))
-        tf = icon_text.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"0{i+1}"
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = BLACK
-        p.alignment = PP_ALIGN.CENTER
-
-        # 타이틀
-        t_box = slide.shapes.add_textbox(Inches(x), Inches(3), Inches(3.8), Inches(0.5))
-        tf = t_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(20)
-        p.font.bold = True
-        p.font.color.rgb = color
-        p.alignment = PP_ALIGN.CENTER
+FEATURES_GRID = deck_layout.Grid(left=0.8, top=1.8, cell_width=3.8, cell_height=4.5, gap=0.4)
 
-        # 서브타이틀
-        s_box = slide.shapes.add_textbox(Inches(x), Inches(3.5), Inches(3.8), Inches(0.4))
-        tf = s_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = subtitle
-        p.font.size = Pt(14)
-        p.font.color.rgb = WHITE
-        p.alignment = PP_ALIGN.CENTER
-
-        # 설명 박스
-        desc_bg = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(x), Inches(4.1), Inches(3.8), Inches(2.2)
-        )
-        desc_bg.fill.solid()
-        desc_bg.fill.fore_color.rgb = DARK_GRAY
-        desc_bg.line.fill.background()
+def create_features_slide(prs, spec):
+    theme = theme_of(spec)
+    pages = deck_layout.paginate(spec["features"], FEATURES_GRID)
+    for shapes, page in section_slides(prs, spec, theme, pages, decorative=True):
+        for i, feature, box in page:
+            color = theme.color(feature["color"])
+            icon_x = box.x + box.w / 2 - 0.6
 
-        # 설명
-        d_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(4.3), Inches(3.4), Inches(1.8))
-        tf = d_box.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = desc
-        p.font.size = Pt(13)
-        p.font.color.rgb = LIGHT_GRAY
-        p.line_spacing = 1.4
+            # 아이콘 영역
+            shapes.oval(Inches(icon_x), Inches(box.y), Inches(1), Inches(1), color)
+
+            # 아이콘 텍스트
+            shapes.textbox(Inches(icon_x), Inches(box.y + 0.25), Inches(1), Inches(0.6), f"0{i+1}",
+                           theme.style("badge", size=24))
+
+            # 타이틀
+            shapes.textbox(Inches(box.x), Inches(box.y + 1.2), Inches(box.w), Inches(0.5), feature["title"],
+                           theme.style("heading", size=20, color=color, align="center"))
+
+            # 서브타이틀
+            shapes.textbox(Inches(box.x), Inches(box.y + 1.7), Inches(box.w), Inches(0.4), feature["subtitle"],
+                           theme.style("body", color="WHITE", align="center"))
+
+            # 설명 박스
+            shapes.rounded_rect(Inches(box.x), Inches(box.y + 2.3), Inches(box.w), Inches(2.2),
+                                theme.colors["DARK_GRAY"])
+
+            # 설명
+            shapes.textbox(Inches(box.x + 0.2), Inches(box.y + 2.5), Inches(box.w - 0.4), Inches(1.8),
+                           feature["description"], theme.style("body", size=13, line_spacing=1.4), wrap=True)
 
 # === 슬라이드 9: 클라이언트 ===
-def create_clients_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_simple_dark_bg(slide)
-
-    # 섹션 번호
-    add_number_badge(slide, "08", 0.8, 0.5, ACCENT_RED)
-
-    # 타이틀
-    title_box = slide.shapes.add_textbox(Inches(1.6), Inches(0.5), Inches(10), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "MAJOR CLIENTS"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    add_accent_line(slide, 1.6, 1.2, 2, ACCENT_RED)
-
-    clients = [
-        ("대기업", ["LG전자", "LG헬로비전", "삼성전자", "삼성SDS", "SK텔레콤", "현대자동차"], ACCENT_YELLOW),
-        ("금융", ["신한은행", "신한금융지주", "KB국민은행"], ACCENT_CYAN),
-        ("IT / 플랫폼", ["카카오", "네이버", "CJ ENM", "CJ올리브네트웍스"], ACCENT_RED),
-        ("기타", ["국립암센터", "삼성문화재단", "두산", "하나제약"], ACCENT_GOLD)
-    ]
-
-    start_x = 0.8
-    for i, (category, names, color) in enumerate(clients):
-        x = start_x + i * 3.2
-
-        # 카테고리 헤더
-        cat_bg = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(x), Inches(1.7), Inches(3), Inches(0.6)
-        )
-        cat_bg.fill.solid()
-        cat_bg.fill.fore_color.rgb = color
-        cat_bg.line.fill.background()
-
-        cat_box = slide.shapes.add_textbox(Inches(x), Inches(1.8), Inches(3), Inches(0.5))
-        tf = cat_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = category
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = BLACK
-        p.alignment = PP_ALIGN.CENTER
-
-        # 클라이언트 목록
-        y = 2.5
-        for name in names:
-            n_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(y), Inches(2.6), Inches(0.5))
-            tf = n_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = name
-            p.font.size = Pt(14)
-            p.font.color.rgb = WHITE
-            y += 0.55
-
-# === 슬라이드 10: 마무리 ===
-def create_ending_slide():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_gradient_background(slide)
-
-    # 대형 Thank You
-    thanks_box = slide.shapes.add_textbox(Inches(0.8), Inches(2), Inches(12), Inches(2))
-    tf = thanks_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "THANK YOU"
-    p.font.size = Pt(90)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.CENTER
-
-    # 회사명
-    company_box = slide.shapes.add_textbox(Inches(0.8), Inches(4.2), Inches(12), Inches(0.8))
-    tf = company_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "iRUSH - Digital Creative Agency"
-    p.font.size = Pt(24)
-    p.font.color.rgb = ACCENT_YELLOW
-    p.alignment = PP_ALIGN.CENTER
-
-    # 연락처
-    contact_box = slide.shapes.add_textbox(Inches(0.8), Inches(5.2), Inches(12), Inches(0.5))
-    tf = contact_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "info@irush.co.kr"
-    p.font.size = Pt(16)
-    p.font.color.rgb = LIGHT_GRAY
-    p.alignment = PP_ALIGN.CENTER
-
-    # 하단 핵심 가치
-    values_box = slide.shapes.add_textbox(Inches(0.8), Inches(6.2), Inches(12), Inches(0.5))
-    tf = values_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "FEVER  •  BLISS  •  FAITH"
-    p.font.size = Pt(14)
-    p.font.color.rgb = GRAY
-    p.alignment = PP_ALIGN.CENTER
-
-# === 슬라이드 생성 실행 ===
-create_cover_slide()
-create_overview_slide()
-create_values_slide()
-create_stats_slide()
-create_tech_slide()
-create_design_slide()
-create_structure_slide()
-create_features_slide()
-create_clients_slide()
-create_ending_slide()
-
-# PPT 저장
-output_path = os.path.join(os.path.dirname(__file__), '..', 'iRUSH_Homepage_Concept.pptx')
-prs.save(output_path)
-print(f"PPT 생성 완료: {os.path.abspath(output_path)}")
+CLIENTS_GRID = deck_layout.Grid(left=0.8, top=1.7, cell_width=3, cell_height=5.3, gap=0.2)
+
+def client_name_rows(box):
+    """클라이언트 카테고리 칸 안의 이름 목록 배치"""
+    return deck_layout.Grid(box.x + 0.2, box.y + 0.8, box.w - 0.4, 0.5, gap=0.05, columns=1, bottom=box.bottom)
+
+def create_clients_slide(prs, spec):
+    theme = theme_of(spec)
+    pages = deck_layout.overflow_pages(spec["clients"], CLIENTS_GRID, lambda group: group["names"], client_name_rows)
+    for shapes, page in section_slides(prs, spec, theme, pages):
+        for _, group, box, rows in page:
+            color = theme.color(group["color"])
+
+            # 카테고리 헤더
+            shapes.rounded_rect(Inches(box.x), Inches(box.y), Inches(box.w), Inches(0.6), color)
+            shapes.textbox(Inches(box.x), Inches(box.y + 0.1), Inches(box.w), Inches(0.5), group["category"],
+                           theme.style("badge", size=16))
+
+            # 클라이언트 목록
+            for name, row in rows:
+                size = text_fit.fit_font_size(name, row.w, row.h, 14, min_size=9, wrap=False)
+                shapes.textbox(Inches(row.x), Inches(row.y), Inches(row.w), Inches(row.h), name,
+                               theme.style("body", size=size, color="WHITE"))
+
+# === 포트폴리오 ===
+def create_portfolio_slide(prs, spec):
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_simple_dark_bg(slide, theme)
+
+    accent = theme.color(spec["color"])
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        add_section_title(shapes, theme, spec["number"], spec["title"], accent)
+
+    # 대표 이미지 (배치 박스 크기로 축소/재압축한 파일 사용)
+    image = deck_images.prepare_image(spec["image"], 7.2, 4.8)
+    MEDIA.add_picture(slide, image, Inches(0.8), Inches(1.7), Inches(7.2), Inches(4.8))
+
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        # 서브타이틀
+        shapes.textbox(Inches(8.4), Inches(1.7), Inches(4.2), Inches(0.4), spec["subtitle"],
+                       theme.style("label", size=12, color=accent))
+
+        # 프로젝트명
+        size = text_fit.fit_font_size(spec["project"], 4.2, 1.3, 24, min_size=16, bold=True)
+        shapes.textbox(Inches(8.4), Inches(2.1), Inches(4.2), Inches(1.3), spec["project"],
+                       theme.style("heading", size=size), wrap=True)
+
+        # 클라이언트 / 연도
+        shapes.textbox(Inches(8.4), Inches(3.5), Inches(4.2), Inches(0.4), f"{spec['client']}  |  {spec['year']}",
+                       theme.style("caption", size=12))
+
+        add_accent_line(shapes, 8.4, 4.0, 1, accent)
+
+        # 설명
+        size = text_fit.fit_font_size(spec["description"], 4.2, 2.3, 13, min_size=10, line_spacing=1.2 * 1.4)
+        shapes.textbox(Inches(8.4), Inches(4.2), Inches(4.2), Inches(2.3), spec["description"],
+                       theme.style("body", size=size, line_spacing=1.4), wrap=True)
+
+# === 슬라이드 10~: IT 트렌드 ===
+def create_trends_slide(prs, spec, articles, page):
+    """트렌드 기사 목록 한 페이지"""
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_simple_dark_bg(slide, theme)
+
+    accent = theme.color(spec["color"])
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        add_section_title(shapes, theme, spec["number"], spec["title"], accent)
+
+        # 페이지 번호
+        shapes.textbox(Inches(11.5), Inches(0.7), Inches(1.2), Inches(0.4), f"PAGE {page:02d}",
+                       theme.style("caption", size=12, align="right"))
+
+        # 기사 목록
+        row_height = 5.4 / max(1, spec["per_slide"])
+        y = 1.7
+        first = (page - 1) * max(1, spec["per_slide"])
+        for i, article in enumerate(articles, start=first):
+            # 번호
+            shapes.textbox(Inches(0.8), Inches(y), Inches(0.9), Inches(0.5), str(article.get("number", "")),
+                           theme.style("label", size=24, color=accent), name=f"trends.{i}.number")
+
+            # 기사 제목
+            title = article.get("title", "")
+            size = text_fit.fit_font_size(title, 8.2, 0.4, 15, min_size=12, bold=True, wrap=False)
+            shapes.textbox(Inches(1.8), Inches(y), Inches(8.2), Inches(0.4),
+                           text_fit.truncate_to_width(title, size, 8.2, bold=True), theme.style("heading", size=size),
+                           name=f"trends.{i}.title")
+
+            # 출처 / 날짜
+            shapes.textbox(Inches(10.1), Inches(y), Inches(2.4), Inches(0.4),
+                           f"{article.get('source', '')}  {article.get('date', '')}",
+                           theme.style("caption", size=10, align="right"), name=f"trends.{i}.meta")
+
+            # 요약
+            summary = deck_trends.truncate(article.get("summary", ""), spec["summary_length"])
+            size = text_fit.fit_font_size(summary, 10.7, row_height - 0.5, 11, min_size=9)
+            shapes.textbox(Inches(1.8), Inches(y + 0.4), Inches(10.7), Inches(row_height - 0.5), summary,
+                           theme.style("body", size=size), wrap=True, name=f"trends.{i}.summary")
+
+            # 구분선
+            shapes.rect(Inches(0.8), Inches(y + row_height - 0.1), Inches(11.7), Pt(1), theme.colors["DIVIDER"])
+
+            y += row_height
+
+def create_trends_slides(prs, spec):
+    """trends.json을 스트리밍으로 읽어 per_slide건씩 트렌드 슬라이드 생성"""
+    per_slide = max(1, spec["per_slide"])
+    page = []
+    page_number = 0
+    for article in deck_trends.iter_trends(spec["source"]):
+        page.append(article)
+        if len(page) == per_slide:
+            page_number += 1
+            create_trends_slide(prs, spec, page, page_number)
+            page = []
+    if page:
+        create_trends_slide(prs, spec, page, page_number + 1)
+
+# === 트렌드 차트 ===
+def create_chart_slide(prs, spec):
+    """trends.json 기사를 출처/분류/날짜별로 센 네이티브 차트 (막대, 꺾은선, 도넛)"""
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_simple_dark_bg(slide, theme)
+
+    accent = theme.color(spec["color"])
+    categories, values = deck_trend_stats.count_by(spec["source"], spec["group_by"], spec["limit"])
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        add_section_title(shapes, theme, spec["number"], spec["title"], accent)
+
+        # 집계한 기사 수
+        shapes.textbox(Inches(9.5), Inches(0.7), Inches(3.2), Inches(0.4), f"{sum(values):,} ARTICLES",
+                       theme.style("caption", size=12, align="right"))
+
+    if categories:
+        deck_charts.add_chart(slide, spec["chart"], Inches(0.8), Inches(1.7), Inches(11.7), Inches(5.3),
+                              categories, values, theme, accent, spec["title"])
+
+# === 마지막 슬라이드: 마무리 ===
+def create_ending_slide(prs, spec):
+    theme = theme_of(spec)
+    slide = add_blank_slide(prs)
+    add_gradient_background(slide, theme)
+
+    with deck_shapes.ShapeBatch(slide) as shapes:
+        # 대형 Thank You
+        shapes.textbox(Inches(0.8), Inches(2), Inches(12), Inches(2), spec["title"],
+                       theme.style("display", size=90), name="ending.title")
+
+        # 회사명
+        shapes.textbox(Inches(0.8), Inches(4.2), Inches(12), Inches(0.8), spec["company"],
+                       theme.style("body", size=24, color="ACCENT_YELLOW", align="center"), name="ending.company")
+
+        # 연락처
+        shapes.textbox(Inches(0.8), Inches(5.2), Inches(12), Inches(0.5), spec["contact"],
+                       theme.style("body", size=16, align="center"), name="ending.contact")
+
+        # 하단 핵심 가치
+        shapes.textbox(Inches(0.8), Inches(6.2), Inches(12), Inches(0.5), spec["values_line"],
+                       theme.style("caption", size=14, align="center"), name="ending.values_line")
+
+# === 덱 생성 ===
+# 스펙의 슬라이드 타입 -> 생성 함수
+SLIDE_RENDERERS = {
+    "cover": create_cover_slide,
+    "overview": create_overview_slide,
+    "values": create_values_slide,
+    "stats": create_stats_slide,
+    "tech": create_tech_slide,
+    "design": create_design_slide,
+    "structure": create_structure_slide,
+    "features": create_features_slide,
+    "clients": create_clients_slide,
+    "portfolio": create_portfolio_slide,
+    "trends": create_trends_slides,
+    "chart": create_chart_slide,
+    "ending": create_ending_slide,
+}
+
+def load_deck_spec(spec=None):
+    """덮어쓰기 값을 적용한 컴파일된 덱 스펙 반환 (deck_spec 캐시 사용)"""
+    return deck_spec.load_spec(spec, color_names=deck_colors.PALETTE)
+
+def build_deck(spec=None, prs=None, profile=None):
+    """스펙으로 전체 슬라이드를 생성해 Presentation 반환
+
+    spec은 기본 스펙 파일(specs/irush_concept.json)에 덮어쓸 최상위 값이다.
+    prs를 넘기지 않으면 새 프레젠테이션을 만든다. 모듈을 한 번 임포트한
+    워커 프로세스에서 반복 호출해 여러 덱을 만들 수 있다.
+    profile(deck_profile.BuildProfile)을 넘기면 슬라이드 함수별 기록을 남긴다.
+    """
+    compiled = load_deck_spec(spec)
+    if prs is None:
+        prs = new_presentation()
+    for slide_spec in compiled["slides"]:
+        render = SLIDE_RENDERERS[slide_spec["type"]]
+        if profile is None:
+            render(prs, slide_spec)
+        else:
+            with profile.measure(f"{render.__name__}()", prs, type=slide_spec["type"]):
+                render(prs, slide_spec)
+    return prs
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="iRUSH 컨셉 덱 생성")
+    parser.add_argument("--profile", action="store_true",
+                        help="슬라이드 함수와 prs.save()별 시간, 도형 수, 메모리 최대치를 표로 출력")
+    parser.add_argument("--profile-json", help="프로파일 결과 JSON 저장 경로 (--profile 포함)")
+    args = parser.parse_args(argv)
+
+    profile = None
+    if args.profile or args.profile_json:
+        profile = deck_profile.BuildProfile(memory=True)
+    prs = build_deck(profile=profile)
+    if profile is None:
+        save_deck(prs, DEFAULT_OUTPUT)
+    else:
+        with profile.measure("prs.save()", prs, new_slides=False):
+            save_deck(prs, DEFAULT_OUTPUT)
+        profile.stop()
+    print(f"PPT 생성 완료: {os.path.abspath(DEFAULT_OUTPUT)}")
+    if profile is not None:
+        print(profile.format_table())
+        if args.profile_json:
+            profile.save_json(args.profile_json)
+
+if __name__ == "__main__":
+    main()
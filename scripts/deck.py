@@ -0,0 +1,277 @@
+"""iRUSH 덱 빌더 명령줄 도구
+
+렌더링하지 않는 명령(validate, list)은 python-pptx/lxml을 임포트하지 않아 바로 끝난다.
+python-pptx를 쓰는 모듈(create_ppt 등)은 build가 실제로 렌더링을 시작할 때 임포트한다.
+
+사용 예:
+    python scripts/deck.py validate --spec-file specs/irush_portfolio.json
+    python scripts/deck.py list
+    python scripts/deck.py build --client LG전자 --output out.pptx
+    python scripts/deck.py build --theme irush_midnight --output midnight.pptx
+    python scripts/deck.py build --stream --output - > deck.pptx
+    python scripts/deck.py build --incremental --profile
+    python scripts/deck.py build --cached
+    python scripts/deck.py build --pdf handout.pdf --png-dir thumbs
+    python scripts/deck.py build --locales en-US,ja-JP
+    python scripts/deck.py export iRUSH_Homepage_Concept.pptx --pdf handout.pdf
+    python scripts/deck.py patch iRUSH_Homepage_Concept.pptx --set cover.year=2025
+    python scripts/deck.py patch delivered.pptx --from-spec --client LG전자
+    python scripts/deck.py diff old.pptx iRUSH_Homepage_Concept.pptx
+    python scripts/deck.py diff --quiet deck.manifest.json iRUSH_Homepage_Concept.pptx --manifest deck.manifest.json
+"""
+import argparse
+import os
+import sys
+import time
+
+import deck_colors
+import deck_spec
+
+
+def _overrides(args):
+    """--spec-file, --client, --theme 옵션을 load_spec 덮어쓰기 값으로 변환"""
+    spec = {}
+    if args.spec_file:
+        spec["spec_file"] = args.spec_file
+    if args.client:
+        spec["client"] = args.client
+    if args.theme:
+        # 테마 경로는 스펙 파일이 아니라 현재 폴더 기준
+        spec["theme"] = os.path.abspath(args.theme) if os.path.isfile(args.theme) else args.theme
+    return spec
+
+
+def _load(args):
+    return deck_spec.load_spec(_overrides(args), color_names=deck_colors.PALETTE)
+
+
+def _slide_label(slide):
+    """목록에 보여 줄 슬라이드 제목"""
+    for key in ("title", "project", "company"):
+        if slide.get(key):
+            return slide[key]
+    return ""
+
+
+def cmd_validate(args):
+    compiled = _load(args)
+    print(f"스펙 OK: 슬라이드 스펙 {len(compiled['slides'])}개 ({compiled['digest'][:12]})")
+
+
+def cmd_list(args):
+    compiled = _load(args)
+    for i, slide in enumerate(compiled["slides"], start=1):
+        line = f"{i:>3}  {slide['type']:<10} {slide.get('number', ''):<3} {_slide_label(slide)}"
+        if slide["type"] == "trends":
+            import deck_trends
+
+            articles = sum(1 for _ in deck_trends.iter_trends(slide["source"]))
+            pages = -(-articles // max(1, slide["per_slide"]))
+            line += f"  (기사 {articles}건, {pages}장)"
+        elif slide["type"] == "chart":
+            import deck_trend_stats
+
+            categories, _ = deck_trend_stats.count_by(slide["source"], slide["group_by"], slide["limit"])
+            line += f"  ({slide['chart']}, {slide['group_by']}별 {len(categories)}개 항목)"
+        print(line)
+
+
+def _export(args, prs):
+    """--pdf, --png-dir 옵션대로 덱을 내보내기 (deck_export)"""
+    import deck_export
+
+    if args.pdf:
+        stats = deck_export.export_pdf(prs, args.pdf, workers=args.workers)
+        print(f"PDF 저장: {os.path.abspath(args.pdf)} (슬라이드 {stats['slides']}장, {stats['cached']}장 캐시 사용)")
+    if args.png_dir:
+        stats = deck_export.export_pngs(prs, args.png_dir, args.png_width or deck_export.THUMB_WIDTH, workers=args.workers)
+        print(f"PNG 저장: {os.path.abspath(args.png_dir)} (슬라이드 {stats['slides']}장, {stats['cached']}장 캐시 사용)")
+
+
+def cmd_export(args):
+    from pptx import Presentation
+
+    _export(args, Presentation(args.deck))
+
+
+def cmd_patch(args):
+    # 패치는 python-pptx 없이 zip과 슬라이드 XML만 다룸
+    import deck_patch
+
+    values = deck_patch.spec_values(_load(args)) if args.from_spec else {}
+    if args.values:
+        import json
+
+        with open(args.values, encoding="utf-8") as f:
+            values.update(json.load(f))
+    values.update(deck_patch.parse_assignments(args.set))
+    stats = deck_patch.patch_deck(args.deck, values, args.output)
+    print(f"패치 완료: {os.path.abspath(args.output or args.deck)} "
+          f"(파트 {stats['parts']}개 중 {stats['rewritten']}개 다시 씀, 텍스트 {stats['changed']}곳 바뀜, "
+          f"{stats['seconds'] * 1000:.0f} ms)")
+    if stats["missing"]:
+        print(f"덱에 없는 이름 {len(stats['missing'])}개: {', '.join(stats['missing'][:10])}"
+              + (" ..." if len(stats["missing"]) > 10 else ""), file=sys.stderr)
+
+
+def cmd_diff(args):
+    import deck_diff
+
+    return deck_diff.run(args)
+
+
+def cmd_build(args):
+    # 여기서부터 python-pptx를 임포트
+    import create_ppt
+
+    output = args.output or create_ppt.DEFAULT_OUTPUT
+    spec = _overrides(args)
+    profile = None
+    if args.profile or args.profile_json:
+        import deck_profile
+
+        profile = deck_profile.BuildProfile(memory=True)
+
+    if args.stream:
+        import deck_stream
+
+        target = sys.stdout.buffer if output == "-" else output
+        count = deck_stream.stream_deck(spec, target)
+        message = f"PPT 생성 완료: {output} (슬라이드 {count}장)"
+    elif args.cached:
+        import deck_cache
+
+        started = time.perf_counter()
+        data, hit = deck_cache.deck_bytes(spec)
+        with open(output, "wb") as f:
+            f.write(data)
+        message = (f"PPT 생성 완료: {os.path.abspath(output)} "
+                   f"({'캐시 사용' if hit else '렌더링 후 캐시에 저장'}, {(time.perf_counter() - started) * 1000:.0f} ms)")
+        prs = None
+    elif args.incremental:
+        import deck_incremental
+
+        stats = deck_incremental.rebuild_deck(spec, output, args.cache_dir or deck_incremental.CACHE_DIR)
+        message = (f"PPT 생성 완료: {os.path.abspath(output)} "
+                   f"(슬라이드 {stats['slides']}개 중 {stats['rendered']}개 렌더링, {stats['reused']}개 캐시 사용)")
+        prs = None
+    elif args.locales:
+        import deck_locale
+
+        result = deck_locale.build_locales(spec, deck_locale.parse_locales(args.locales), output, args.messages)
+        message = deck_locale.format_result(result)
+        prs = None
+    else:
+        prs = create_ppt.build_deck(spec, profile=profile)
+        if profile is None:
+            create_ppt.save_deck(prs, output)
+        else:
+            with profile.measure("prs.save()", prs, new_slides=False):
+                create_ppt.save_deck(prs, output)
+        message = f"PPT 생성 완료: {os.path.abspath(output)}"
+
+    # --output - 이면 표준 출력은 덱 데이터용
+    print(message, file=sys.stderr if output == "-" else sys.stdout)
+    if profile is not None:
+        profile.stop()
+        print(profile.format_table(), file=sys.stderr if output == "-" else sys.stdout)
+        if args.profile_json:
+            profile.save_json(args.profile_json)
+
+    if args.pdf or args.png_dir:
+        if prs is None:
+            # 증분 빌드, 결과 캐시, 언어별 빌드는 Presentation을 만들지 않으므로 저장한 (원문) 덱을 다시 읽음
+            from pptx import Presentation
+
+            prs = Presentation(output)
+        _export(args, prs)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="deck", description="iRUSH 덱 빌더")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_export_options(p):
+        p.add_argument("--pdf", help="PDF로도 저장할 경로")
+        p.add_argument("--png-dir", help="슬라이드별 PNG 썸네일 저장 폴더")
+        p.add_argument("--png-width", type=int, help="PNG 폭 (픽셀, 기본 480)")
+        p.add_argument("--workers", type=int, help="PDF/PNG 렌더링 프로세스 수 (기본: CPU 코어 수)")
+
+    def add_spec_options(p):
+        p.add_argument("--spec-file", help="덱 스펙 파일 (기본: specs/irush_concept.json)")
+        p.add_argument("--client", help="클라이언트 이름 덮어쓰기")
+        p.add_argument("--theme", help="테마 이름(scripts/themes) 또는 테마 JSON 경로 (기본: 스펙의 theme, 없으면 irush_dark)")
+
+    p = sub.add_parser("validate", help="스펙 검증만 하고 종료")
+    add_spec_options(p)
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("list", help="스펙의 슬라이드 목록 출력")
+    add_spec_options(p)
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("build", help="덱 렌더링 후 저장")
+    add_spec_options(p)
+    p.add_argument("--output", help="저장 경로 (기본: 저장소 루트의 iRUSH_Homepage_Concept.pptx, --stream이면 - 로 표준 출력)")
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument("--stream", action="store_true", help="슬라이드 단위로 흘려 쓰며 저장 (deck_stream)")
+    mode.add_argument("--incremental", action="store_true", help="바뀐 슬라이드만 다시 렌더링 (deck_incremental)")
+    mode.add_argument("--cached", action="store_true", help="같은 스펙으로 만든 덱이 있으면 그대로 사용 (deck_cache)")
+    mode.add_argument("--locales", help="원문 덱과 함께 언어별 덱도 생성, 쉼표로 구분한 언어 태그 또는 all (deck_locale)")
+    p.add_argument("--messages", help="--locales 메시지 카탈로그 (기본: locales/<스펙 파일 이름>.json)")
+    p.add_argument("--cache-dir", help="--incremental 슬라이드 캐시 폴더")
+    p.add_argument("--profile", action="store_true", help="슬라이드 함수와 prs.save()별 프로파일 표 출력")
+    p.add_argument("--profile-json", help="프로파일 결과 JSON 저장 경로")
+    add_export_options(p)
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("export", help="저장된 덱을 PDF/PNG로 내보내기")
+    p.add_argument("deck", help="내보낼 .pptx 파일")
+    add_export_options(p)
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("patch", help="저장된 덱의 태그된 텍스트만 바꿔 저장 (deck_patch)")
+    p.add_argument("deck", help="패치할 .pptx 파일")
+    p.add_argument("--output", help="저장 경로 (기본: 원본 파일에 덮어쓰기)")
+    p.add_argument("--set", action="append", default=[], metavar="이름=값",
+                   help="도형 이름(또는 {{이름}} 토큰)과 새 텍스트, 여러 번 지정 가능")
+    p.add_argument("--values", help="이름 -> 값 JSON 파일 (값이 목록이면 run별로 바꿈)")
+    p.add_argument("--from-spec", action="store_true", help="스펙의 현재 값으로 태그를 모두 바꿈")
+    add_spec_options(p)
+    p.set_defaults(func=cmd_patch)
+
+    p = sub.add_parser("diff", help="두 덱의 구조 해시를 비교해 바뀐 슬라이드와 도형 출력 (같으면 0, 다르면 1)")
+    p.add_argument("old", nargs="?", help="이전 덱 .pptx 또는 manifest JSON (없으면 new의 해시만 출력)")
+    p.add_argument("new", help="새 덱 .pptx 또는 manifest JSON")
+    p.add_argument("--quiet", action="store_true", help="출력 없이 종료 코드만")
+    p.add_argument("--manifest", help="새 덱의 manifest JSON 저장 경로")
+    p.set_defaults(func=cmd_diff)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        if (args.profile or args.profile_json) and (args.stream or args.incremental or args.cached or args.locales):
+            parser.error("--profile은 --stream/--incremental/--cached/--locales와 함께 쓸 수 없습니다")
+        if args.output == "-" and not args.stream:
+            parser.error("표준 출력(--output -)은 --stream에서만 쓸 수 있습니다")
+        if (args.pdf or args.png_dir) and args.stream:
+            parser.error("--pdf/--png-dir은 --stream과 함께 쓸 수 없습니다")
+    if args.command == "export" and not (args.pdf or args.png_dir):
+        parser.error("--pdf 또는 --png-dir 중 하나는 지정해야 합니다")
+    if args.command == "patch":
+        if not (args.set or args.values or args.from_spec):
+            parser.error("--set, --values, --from-spec 중 하나는 지정해야 합니다")
+        if any("=" not in item for item in args.set):
+            parser.error("--set은 이름=값 형식이어야 합니다")
+    try:
+        return args.func(args) or 0
+    except deck_spec.SpecError as e:
+        print(f"스펙 오류: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""여러 덱 스펙을 프로세스 풀에서 병렬로 생성하는 배치 스크립트
+
+사용 예:
+    python scripts/deck_batch.py --out-dir out --client LG전자 --client 삼성전자
+    python scripts/deck_batch.py --specs specs.json --workers 8
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import create_ppt
+import deck_profile
+
+
+def _warm_worker():
+    """워커 시작 시 빈 덱을 한 번 만들어 python-pptx 초기화 비용을 미리 지불"""
+    create_ppt.new_presentation()
+
+
+def render_spec(spec):
+    """스펙 하나를 생성해 저장하고 (저장 경로, 소요 시간, 프로파일) 반환
+
+    프로파일은 시간과 도형 수만 세는 가벼운 모드라 항상 켜 둔다.
+    """
+    started = time.perf_counter()
+    deck_spec = {k: v for k, v in spec.items() if k != "output"}
+    profile = deck_profile.BuildProfile()
+    prs = create_ppt.build_deck(deck_spec, profile=profile)
+    with profile.measure("prs.save()", prs, new_slides=False):
+        create_ppt.save_deck(prs, spec["output"])
+    return spec["output"], time.perf_counter() - started, profile.records
+
+
+def _slug(client):
+    return re.sub(r"[^\w.-]+", "_", client).strip("_") or "client"
+
+
+def client_specs(clients, out_dir):
+    """클라이언트별 변형 덱 스펙 목록 생성 (같은 클라이언트는 한 번만)
+
+    파일 이름은 클라이언트 이름의 슬러그를 쓴다. 다른 클라이언트가 같은 슬러그가 되면
+    ("A&B", "A B" -> A_B, 대소문자를 구분하지 않는 파일 시스템을 위해 대소문자 무시)
+    그 클라이언트들은 슬러그 뒤에 이름 해시 6자리를 붙여 서로 덮어쓰지 않게 한다.
+    """
+    clients = list(dict.fromkeys(clients))
+    shared = {}
+    for client in clients:
+        shared.setdefault(_slug(client).casefold(), []).append(client)
+    specs = []
+    for client in clients:
+        slug = _slug(client)
+        if len(shared[slug.casefold()]) > 1:
+            slug += "_" + hashlib.sha1(client.encode("utf-8")).hexdigest()[:6]
+        specs.append({
+            "client": client,
+            "output": os.path.join(out_dir, f"iRUSH_Homepage_Concept_{slug}.pptx"),
+        })
+    return specs
+
+
+def render_batch(specs, workers=None, chunksize=1):
+    """스펙 목록을 프로세스 풀에서 생성하고 타이밍 리포트 반환
+
+    workers가 1이면 풀 없이 현재 프로세스에서 순서대로 생성한다.
+    """
+    outputs = set()
+    for spec in specs:
+        if "output" not in spec:
+            raise ValueError(f"스펙에 output 경로가 없습니다: {spec}")
+        output = os.path.normcase(os.path.abspath(spec["output"]))
+        if output in outputs:
+            raise ValueError(f"여러 스펙의 output 경로가 같습니다: {spec['output']}")
+        outputs.add(output)
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    if workers == 1:
+        _warm_worker()
+        results = [render_spec(spec) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as pool:
+            results = list(pool.map(render_spec, specs, chunksize=chunksize))
+    wall = time.perf_counter() - started
+
+    deck_seconds = [seconds for _, seconds, _ in results]
+    busy = sum(deck_seconds)
+    return {
+        "workers": workers,
+        "decks": len(results),
+        "wall_seconds": wall,
+        "busy_seconds": busy,
+        "decks_per_second": len(results) / wall if wall else 0.0,
+        "speedup": busy / wall if wall else 0.0,
+        "max_deck_seconds": max(deck_seconds, default=0.0),
+        "results": [{"output": output, "seconds": seconds, "profile": records}
+                    for output, seconds, records in results],
+    }
+
+
+def format_report(report):
+    """타이밍 리포트를 사람이 읽는 문자열로 변환"""
+    lines = [f"{os.path.relpath(r['output'])}  {r['seconds'] * 1000:8.1f} ms" for r in report["results"]]
+    lines.append(
+        f"덱 {report['decks']}개 / 워커 {report['workers']}개: "
+        f"총 {report['wall_seconds']:.2f}s, 작업 합계 {report['busy_seconds']:.2f}s, "
+        f"{report['decks_per_second']:.1f} decks/s, 병렬 효율 x{report['speedup']:.2f}"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="iRUSH 컨셉 덱 배치 생성")
+    parser.add_argument("--specs", help="덱 스펙 목록 JSON 파일 (각 항목에 output 경로 포함)")
+    parser.add_argument("--client", action="append", default=[], help="클라이언트별 변형 덱 생성 (여러 번 지정 가능)")
+    parser.add_argument("--out-dir", default="decks", help="--client 덱 저장 폴더")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--chunksize", type=int, default=1, help="워커에 한 번에 넘길 스펙 수")
+    parser.add_argument("--report", help="타이밍 리포트 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    specs = []
+    if args.specs:
+        with open(args.specs, encoding="utf-8") as f:
+            specs.extend(json.load(f))
+    specs.extend(client_specs(args.client, args.out_dir))
+    if not specs:
+        parser.error("--specs 또는 --client 중 하나는 필요합니다")
+
+    report = render_batch(specs, workers=args.workers, chunksize=args.chunksize)
+    print(format_report(report))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
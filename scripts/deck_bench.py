@@ -0,0 +1,276 @@
+"""덱 생성 처리량/지연 시간 벤치마크
+
+시나리오마다 새 파이썬 프로세스에서 실행해 최대 RSS가 시나리오끼리 섞이지 않게 하고,
+p50/p95 지연 시간(ms), decks/s, 최대 RSS를 보고한다. 결과를 기준선으로 저장해 두면
+--compare로 다음 실행과 비교해 허용 범위를 넘게 느려지거나 메모리가 늘어난 항목을 찾는다.
+기준선(scripts/bench/baseline.json)은 저장소에 커밋해 같은 환경(CI 러너 등)의 실행끼리 비교한다.
+
+시나리오:
+    cold_start      새 프로세스에서 create_ppt 임포트부터 덱 저장까지
+    warm_rebuild    한 프로세스에서 같은 덱 반복 생성
+    batch_100       덱 100개 배치 (deck_batch, CPU 코어 수만큼 워커)
+    batch_1000      덱 1,000개 배치
+    trends_10       기사 10건 / 1,000건 / 10,000건 트렌드 다이제스트 덱
+    trends_1000
+    trends_10000
+    image_heavy     포트폴리오 이미지 슬라이드 24장 덱
+
+사용 예:
+    python scripts/deck_bench.py --scenario warm_rebuild --scenario trends_1000
+    python scripts/deck_bench.py --save-baseline
+    python scripts/deck_bench.py --compare
+"""
+import argparse
+import io
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(SCRIPTS_DIR, "bench", "baseline.json")
+
+# 기준선보다 이 비율 이상 나빠지면 회귀로 봄
+DEFAULT_TOLERANCE = 0.15
+
+# 지표 이름 -> 값이 클수록 나쁜지 여부
+METRICS = {
+    "p50_ms": True,
+    "p95_ms": True,
+    "decks_per_second": False,
+    "peak_rss_bytes": True,
+}
+
+SCENARIOS = ["cold_start", "warm_rebuild", "batch_100", "batch_1000",
+             "trends_10", "trends_1000", "trends_10000", "image_heavy"]
+
+IMAGES = ["01_portfolio_bg.jpg", "03_portfolio_bg.jpg", "01_portfolio_view.jpg"]
+
+
+def _max_rss_bytes(who):
+    """자기 자신 또는 자식 프로세스들의 최대 RSS (바이트)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(who).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return rss if rss > 1 << 32 else rss * 1024
+
+
+def _percentile(values, pct):
+    """최근접 순위 백분위수"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _trends_spec(work_dir, articles):
+    """기사 articles건짜리 trends.json과 그것만 다이제스트하는 스펙 파일 생성"""
+    import deck_trends
+
+    samples = list(deck_trends.iter_trends(deck_trends.TRENDS_FILE))
+    trends = []
+    for i, article in enumerate(itertools.islice(itertools.cycle(samples), articles), start=1):
+        trends.append(dict(article, id=i, number=f"{i:02d}"))
+    source = os.path.join(work_dir, f"trends_{articles}.json")
+    _write_json(source, {"totalCount": articles, "trends": trends})
+
+    spec_file = os.path.join(work_dir, f"trends_{articles}_spec.json")
+    _write_json(spec_file, {"client": "iRUSH", "year": "2024", "slides": [{
+        "type": "trends", "number": "01", "color": "ACCENT_GOLD", "title": "IT TRENDS",
+        "source": source, "per_slide": 5, "summary_length": 90,
+    }]})
+    return {"spec_file": spec_file}
+
+
+def _image_spec(work_dir, slides=24):
+    """원본 포트폴리오 이미지를 돌려 쓰는 이미지 슬라이드 slides장짜리 스펙 파일 생성"""
+    image_dir = os.path.join(SCRIPTS_DIR, "..", "src", "assets", "images")
+    entries = []
+    for i in range(slides):
+        entries.append({
+            "type": "portfolio", "number": f"{i + 1:02d}", "color": "ACCENT_RED",
+            "title": "FEATURED WORK", "image": os.path.abspath(os.path.join(image_dir, IMAGES[i % len(IMAGES)])),
+            "project": f"Project {i + 1}", "subtitle": "Benchmark", "client": "iRUSH",
+            "year": "2025", "description": "이미지 위주 덱 벤치마크용 슬라이드.",
+        })
+    spec_file = os.path.join(work_dir, "image_heavy_spec.json")
+    _write_json(spec_file, {"client": "iRUSH", "year": "2025", "slides": entries})
+    return {"spec_file": spec_file}
+
+
+def _timed_builds(spec, repeat):
+    """한 프로세스에서 덱을 repeat번 생성해 메모리에 저장 (첫 빌드는 준비 운동으로 제외)
+
+    저장은 CLI, 배치, 서버와 같은 create_ppt.save_deck (재현 가능한 저장)을 쓴다.
+    """
+    import create_ppt
+
+    latencies = []
+    for i in range(repeat + 1):
+        started = time.perf_counter()
+        create_ppt.save_deck(create_ppt.build_deck(spec), io.BytesIO())
+        if i:
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _cold_start(work_dir, repeat):
+    latencies = []
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); import create_ppt; "
+            "create_ppt.save_deck(create_ppt.build_deck(), sys.argv[2])")
+    output = os.path.join(work_dir, "cold.pptx")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, SCRIPTS_DIR, output], check=True)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _batch(work_dir, decks):
+    import deck_batch
+
+    clients = [f"Client {i:04d}" for i in range(decks)]
+    report = deck_batch.render_batch(deck_batch.client_specs(clients, work_dir))
+    return [result["seconds"] for result in report["results"]], report["wall_seconds"]
+
+
+def run_scenario(name, repeat=None):
+    """현재 프로세스에서 시나리오 하나를 실행해 결과 지표 반환"""
+    with tempfile.TemporaryDirectory(prefix="deck-bench-") as work_dir:
+        started = time.perf_counter()
+        wall = None
+        if name == "cold_start":
+            latencies = _cold_start(work_dir, repeat or 5)
+        elif name == "warm_rebuild":
+            latencies = _timed_builds({}, repeat or 20)
+        elif name.startswith("batch_"):
+            latencies, wall = _batch(work_dir, int(name.split("_")[1]))
+        elif name.startswith("trends_"):
+            latencies = _timed_builds(_trends_spec(work_dir, int(name.split("_")[1])), repeat or 3)
+        elif name == "image_heavy":
+            latencies = _timed_builds(_image_spec(work_dir), repeat or 5)
+        else:
+            raise ValueError(f"알 수 없는 시나리오: {name}")
+        if wall is None:
+            wall = sum(latencies)
+        elapsed = time.perf_counter() - started
+
+    rss = [_max_rss_bytes(resource.RUSAGE_SELF), _max_rss_bytes(resource.RUSAGE_CHILDREN)] if resource else []
+    return {
+        "decks": len(latencies),
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "decks_per_second": len(latencies) / wall if wall else 0.0,
+        "peak_rss_bytes": max(rss) if rss else None,
+        "elapsed_seconds": elapsed,
+    }
+
+
+def run_isolated(name, repeat=None):
+    """시나리오를 새 파이썬 프로세스에서 실행 (최대 RSS를 시나리오별로 따로 재기 위해)"""
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", name]
+    if repeat:
+        cmd += ["--repeat", str(repeat)]
+    proc = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, cwd=SCRIPTS_DIR)
+    return json.loads(proc.stdout)
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """기준선 대비 허용 범위를 넘게 나빠진 (시나리오, 지표, 기준값, 현재값) 목록"""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for metric, higher_is_worse in METRICS.items():
+            old, new = base.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old if higher_is_worse else (old - new) / old
+            if change > tolerance:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    """결과를 사람이 읽는 표로 변환 (기준선이 있으면 변화율 표시)"""
+    header = f"{'scenario':<14} {'decks':>6} {'p50 ms':>10} {'p95 ms':>10} {'decks/s':>9} {'peak RSS':>9}"
+    lines = [header, "-" * len(header)]
+    for name, m in results.items():
+        rss = f"{m['peak_rss_bytes'] / (1 << 20):.0f}MB" if m["peak_rss_bytes"] else "-"
+        line = (f"{name:<14} {m['decks']:>6} {m['p50_ms']:>10.1f} {m['p95_ms']:>10.1f}"
+                f" {m['decks_per_second']:>9.2f} {rss:>9}")
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base and base.get("p50_ms"):
+            line += f"  p50 {(m['p50_ms'] / base['p50_ms'] - 1) * 100:+.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱 생성 벤치마크")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="실행할 시나리오 (여러 번 지정 가능, 기본: 전부)")
+    parser.add_argument("--repeat", type=int, help="시나리오별 반복 횟수 (배치 시나리오 제외)")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, help="결과를 기준선으로 저장")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="기준선과 비교 (회귀가 있으면 종료 코드 1)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="회귀로 볼 악화 비율 (기본 0.15)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        sys.path.insert(0, SCRIPTS_DIR)
+        json.dump(run_scenario(args.worker, args.repeat), sys.stdout)
+        return 0
+
+    baseline = None
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"기준선이 없습니다: {os.path.abspath(args.compare)} (--save-baseline으로 먼저 저장)", file=sys.stderr)
+            return 2
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        print(f"{name} ...", file=sys.stderr)
+        results[name] = run_isolated(name, args.repeat)
+    print(format_results(results, baseline))
+
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+              "cpus": os.cpu_count(), "scenarios": results}
+    if args.json:
+        _write_json(args.json, report)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        _write_json(args.save_baseline, report)
+        print(f"기준선 저장: {os.path.abspath(args.save_baseline)}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, metric, old, new in regressions:
+            print(f"회귀: {name} {metric} {old:.1f} -> {new:.1f}")
+        if regressions:
+            return 1
+        print(f"회귀 없음 (허용 범위 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
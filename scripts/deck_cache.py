@@ -0,0 +1,198 @@
+"""완성된 덱(.pptx 바이트) 결과 캐시 — 메모리 + 디스크, 크기 제한 LRU
+
+키는 컴파일된 스펙의 해시(deck_spec digest), 빌더 버전(렌더링 모듈 소스 해시), 스펙이
+가리키는 데이터 파일(이미지, trends.json, 테마)의 크기와 수정 시각으로 정한다. 그래서
+캐시를 확인할 때는 python-pptx를 임포트하지도, 슬라이드 함수를 실행하지도 않는다.
+
+메모리 캐시는 최근에 쓴 덱부터 memory_bytes까지, 디스크 캐시는 max_bytes까지 보관하고
+넘치면 가장 오래 쓰지 않은 덱부터 지운다 (디스크는 파일 수정 시각을 사용 시각으로 씀).
+기본 크기는 DECK_RESULT_CACHE_MB, DECK_RESULT_MEMORY_MB 환경 변수로 바꿀 수 있다.
+"""
+import ast
+import hashlib
+import io
+import os
+import tempfile
+from collections import OrderedDict
+
+import deck_colors
+import deck_spec
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPTS_DIR, "..", ".deck-cache", "decks")
+
+DEFAULT_MAX_BYTES = int(os.environ.get("DECK_RESULT_CACHE_MB", 512)) << 20
+DEFAULT_MEMORY_BYTES = int(os.environ.get("DECK_RESULT_MEMORY_MB", 64)) << 20
+
+# 빌더 버전을 정할 때 임포트를 따라가기 시작하는 모듈
+ENTRY_MODULE = "create_ppt.py"
+
+_builder_version = None
+
+
+def builder_modules(scripts_dir=None):
+    """덱 결과에 영향을 주는 모듈 — ENTRY_MODULE부터 임포트를 따라간 scripts/ 안의 파일 이름 (이름순)
+
+    함수 안의 지연 임포트도 따라가므로 새 모듈을 추가해도 목록을 따로 고칠 필요가 없다.
+    """
+    scripts_dir = scripts_dir or SCRIPTS_DIR
+    found, pending = set(), [ENTRY_MODULE]
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        found.add(name)
+        with open(os.path.join(scripts_dir, name), "rb") as f:
+            tree = ast.parse(f.read(), name)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                modules = [node.module]
+            else:
+                continue
+            for module in modules:
+                file_name = module.split(".")[0] + ".py"
+                if os.path.isfile(os.path.join(scripts_dir, file_name)):
+                    pending.append(file_name)
+    return sorted(found)
+
+
+def builder_version():
+    """렌더링 모듈 소스 해시 (프로세스당 한 번 계산, deck_incremental도 같은 값을 씀)"""
+    global _builder_version
+    if _builder_version is None:
+        h = hashlib.sha256()
+        for name in builder_modules():
+            with open(os.path.join(SCRIPTS_DIR, name), "rb") as f:
+                h.update(name.encode("ascii") + b"\0" + f.read())
+        _builder_version = h.hexdigest()
+    return _builder_version
+
+
+def deck_key(compiled):
+    """컴파일된 스펙(deck_spec.load_spec 결과)의 캐시 키"""
+    h = hashlib.sha256(f"{compiled['digest']}:{builder_version()}".encode("ascii"))
+    for slide in compiled["slides"]:
+        for path in deck_spec.slide_paths(slide):
+            st = os.stat(path)
+            h.update(f"{path}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    return h.hexdigest()
+
+
+class DeckCache:
+    """덱 바이트 캐시 (get/put과 적중/실패 카운터)"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, memory_bytes=DEFAULT_MEMORY_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        # 키 -> 덱 바이트 (뒤쪽이 최근 사용)
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        # 키 -> 파일 크기 (처음 쓸 때 디스크를 한 번 훑어 채움, 뒤쪽이 최근 사용)
+        self._disk = None
+        self._disk_size = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".pptx")
+
+    def _disk_index(self):
+        if self._disk is None:
+            entries = []
+            if os.path.isdir(self.cache_dir):
+                for folder in os.scandir(self.cache_dir):
+                    if folder.is_dir():
+                        for entry in os.scandir(folder.path):
+                            if entry.name.endswith(".pptx"):
+                                st = entry.stat()
+                                entries.append((st.st_mtime_ns, entry.name[:-5], st.st_size))
+            self._disk = OrderedDict((key, size) for _, key, size in sorted(entries))
+            self._disk_size = sum(self._disk.values())
+        return self._disk
+
+    def _remember(self, key, data):
+        """메모리 캐시에 넣고 memory_bytes를 넘으면 오래된 것부터 버림"""
+        if len(data) > self.memory_bytes:
+            return
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_bytes:
+            _, old = self._memory.popitem(last=False)
+            self._memory_size -= len(old)
+
+    def get(self, key):
+        """캐시된 덱 바이트 (없으면 None)"""
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return data
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        # 디스크 LRU 순서 갱신
+        os.utime(path)
+        disk = self._disk_index()
+        if key in disk:
+            disk.move_to_end(key)
+        self.stats["disk_hits"] += 1
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """덱 바이트를 캐시에 저장하고 max_bytes를 넘으면 오래 쓰지 않은 덱부터 지움"""
+        self._remember(key, data)
+        if len(data) > self.max_bytes:
+            return
+        disk = self._disk_index()
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._disk_size += len(data) - disk.pop(key, 0)
+        disk[key] = len(data)
+        while self._disk_size > self.max_bytes:
+            old, size = disk.popitem(last=False)
+            self._disk_size -= size
+            self.stats["evictions"] += 1
+            try:
+                os.remove(self._path(old))
+            except FileNotFoundError:
+                pass
+
+    def info(self):
+        """카운터와 현재 크기"""
+        lookups = sum(self.stats.values()) - self.stats["evictions"]
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        disk = self._disk_index()
+        return dict(self.stats, hit_rate=hits / lookups if lookups else 0.0,
+                    memory_decks=len(self._memory), memory_bytes=self._memory_size,
+                    disk_decks=len(disk), disk_bytes=self._disk_size)
+
+
+def deck_bytes(spec=None, cache=None):
+    """스펙의 덱 바이트 (캐시에 있으면 렌더링하지 않음)와 적중 여부 반환"""
+    cache = cache or DeckCache()
+    key = deck_key(deck_spec.load_spec(spec, color_names=deck_colors.PALETTE))
+    data = cache.get(key)
+    if data is not None:
+        return data, True
+
+    import create_ppt
+
+    buf = io.BytesIO()
+    create_ppt.save_deck(create_ppt.build_deck(spec), buf)
+    data = buf.getvalue()
+    cache.put(key, data)
+    return data, False
@@ -0,0 +1,121 @@
+"""트렌드 집계를 그리는 네이티브 차트
+
+deck_trend_stats가 센 (항목 목록, 값 목록)을 python-pptx의 네이티브 차트(막대, 꺾은선, 도넛)로
+그린다. PowerPoint에서 값을 바로 편집할 수 있다. 차트에 딸린 데이터 통합 문서(xlsx)는
+deck_reproducible로 다시 묶어 같은 입력이면 같은 바이트가 나오게 한다.
+"""
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION, XL_LEGEND_POSITION, XL_MARKER_STYLE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Pt
+
+import deck_reproducible
+
+# 스펙의 chart 값 -> python-pptx 차트 종류
+CHART_TYPES = {
+    "bar": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "line": XL_CHART_TYPE.LINE_MARKERS,
+    "donut": XL_CHART_TYPE.DOUGHNUT,
+}
+
+# 도넛 조각 색상 순서 (슬라이드 색상이 맨 앞)
+SLICE_COLORS = ("ACCENT_YELLOW", "ACCENT_RED", "ACCENT_CYAN", "ACCENT_GOLD", "LIGHT_GRAY", "GRAY")
+
+# 데이터 레이블을 붙이는 최대 항목 수 (넘으면 축 눈금만)
+MAX_LABELS = 12
+
+
+def _rgb(value):
+    return RGBColor.from_string(value)
+
+
+def _no_fill(parent, before=None):
+    """차트 영역/그림 영역 배경과 테두리를 없앰 (슬라이드 배경이 비치게)"""
+    sp_pr = parse_xml('<c:spPr %s><a:noFill/><a:ln><a:noFill/></a:ln></c:spPr>' % nsdecls("c", "a"))
+    if before is None:
+        parent.append(sp_pr)
+    else:
+        before.addnext(sp_pr)
+
+
+def _style_axes(chart, theme):
+    category_axis, value_axis = chart.category_axis, chart.value_axis
+    category_axis.format.line.color.rgb = _rgb(theme.colors["DIVIDER"])
+    category_axis.tick_labels.font.color.rgb = _rgb(theme.colors["LIGHT_GRAY"])
+    value_axis.format.line.fill.background()
+    value_axis.has_major_gridlines = True
+    value_axis.major_gridlines.format.line.color.rgb = _rgb(theme.colors["DIVIDER"])
+    value_axis.tick_labels.font.color.rgb = _rgb(theme.colors["GRAY"])
+    value_axis.tick_labels.number_format = "#,##0"
+    value_axis.tick_labels.number_format_is_linked = False
+
+
+def _data_labels(plot, theme, number_format, color, position=None):
+    plot.has_data_labels = True
+    labels = plot.data_labels
+    labels.number_format = number_format
+    labels.number_format_is_linked = False
+    labels.font.size = Pt(11)
+    labels.font.color.rgb = _rgb(theme.colors[color])
+    if position is not None:
+        labels.position = position
+    return labels
+
+
+def add_chart(slide, kind, x, y, cx, cy, categories, values, theme, color, series_name):
+    """슬라이드에 네이티브 차트 추가 — kind는 CHART_TYPES의 키, color는 RRGGBB 계열 색상"""
+    chart_data = CategoryChartData(number_format="#,##0")
+    chart_data.categories = categories
+    chart_data.add_series(series_name, values)
+    graphic_frame = slide.shapes.add_chart(CHART_TYPES[kind], x, y, cx, cy, chart_data)
+    chart = graphic_frame.chart
+    # XlsxWriter가 통합 문서에 기록한 현재 시각을 고정
+    workbook = chart.part.chart_workbook
+    workbook.update_from_xlsx_blob(deck_reproducible.embedded_package(workbook.xlsx_part.blob))
+
+    # 계열이 하나면 PowerPoint가 계열 이름을 차트 제목으로 띄우므로 끔 (제목은 슬라이드 타이틀)
+    chart.has_title = False
+    chart_space = chart._chartSpace
+    _no_fill(chart_space, before=chart_space.chart)
+    _no_fill(chart_space.chart.plotArea)
+    chart.font.size = Pt(12)
+    chart.font.color.rgb = _rgb(theme.colors["LIGHT_GRAY"])
+    plot = chart.plots[0]
+    series = plot.series[0]
+
+    if kind == "donut":
+        slices = [color] + [theme.colors[name] for name in SLICE_COLORS if theme.colors[name] != color]
+        for i, point in enumerate(series.points):
+            point.format.fill.solid()
+            point.format.fill.fore_color.rgb = _rgb(slices[i % len(slices)])
+            point.format.line.color.rgb = _rgb(theme.colors["DARK_BG"])
+        plot.vary_by_categories = True
+        _data_labels(plot, theme, "0%", "BLACK").show_percentage = True
+        plot.data_labels.show_value = False
+        chart.has_legend = True
+        chart.legend.position = XL_LEGEND_POSITION.RIGHT
+        chart.legend.include_in_layout = False
+        return graphic_frame
+
+    chart.has_legend = False
+    plot.vary_by_categories = False
+    _style_axes(chart, theme)
+    if kind == "bar":
+        plot.gap_width = 60
+        series.format.fill.solid()
+        series.format.fill.fore_color.rgb = _rgb(color)
+    else:
+        series.smooth = False
+        series.format.line.color.rgb = _rgb(color)
+        series.format.line.width = Pt(2.5)
+        series.marker.style = XL_MARKER_STYLE.CIRCLE
+        series.marker.size = 6
+        series.marker.format.fill.solid()
+        series.marker.format.fill.fore_color.rgb = _rgb(color)
+        series.marker.format.line.color.rgb = _rgb(color)
+    if len(categories) <= MAX_LABELS:
+        position = XL_LABEL_POSITION.OUTSIDE_END if kind == "bar" else XL_LABEL_POSITION.ABOVE
+        _data_labels(plot, theme, "#,##0", "WHITE", position)
+    return graphic_frame
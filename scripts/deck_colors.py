@@ -0,0 +1,26 @@
+"""덱 기본 색상 팔레트
+
+스펙과 테마(deck_theme)에서 이름으로 참조하는 색상의 기본 (R, G, B) 값.
+테마 파일은 이 이름들의 값만 바꿀 수 있다. python-pptx를 임포트하지 않으므로
+스펙 검증처럼 렌더링하지 않는 명령도 색상 이름을 확인할 수 있다.
+"""
+
+PALETTE = {
+    "BLACK": (0, 0, 0),
+    "DARK_BG": (15, 15, 15),
+    "WHITE": (255, 255, 255),
+    "ACCENT_YELLOW": (255, 255, 0),
+    "ACCENT_RED": (255, 107, 107),
+    "ACCENT_CYAN": (78, 205, 196),
+    "ACCENT_GOLD": (255, 230, 109),
+    "GRAY": (128, 128, 128),
+    "DARK_GRAY": (40, 40, 40),
+    "LIGHT_GRAY": (200, 200, 200),
+    # 카드 배경, 구분선, 배경 글자, 표지 장식 원
+    "CARD_BG": (25, 25, 25),
+    "DIVIDER": (60, 60, 60),
+    "WATERMARK": (30, 30, 30),
+    "GLOW_RED": (80, 30, 30),
+    "GLOW_CYAN": (25, 60, 60),
+    "GLOW_GOLD": (60, 60, 20),
+}
@@ -0,0 +1,259 @@
+"""덱 구조 해시와 슬라이드/도형 단위 비교
+
+.pptx 바이트는 zip 시각, 압축 순서, 도형 id, 관계 id(rId)만 달라도 바뀐다. 여기서는 덱을
+python-pptx 없이 zip과 슬라이드 XML로 읽어, 슬라이드마다 도형(위치와 크기, 도형 종류,
+채우기와 테두리 색, 텍스트와 글꼴, 그림 내용)을 정규화한 XML(exclusive C14N)의 해시를 낸다.
+정규화할 때 도형 id, python-pptx가 붙이는 "TextBox 12" 같은 자동 이름, rId를 지우고
+rId는 가리키는 파트 내용(그림, 차트)이나 레이아웃 파일 이름으로 바꾼다. 그래서 같은 스펙을 다시
+빌드하거나 스트리밍/증분 빌드로 만든 덱은 같은 해시를 가진다.
+
+해시 목록(manifest)은 JSON으로 저장할 수 있어서 CI는 몇 MB짜리 덱 대신 manifest만 보관하고
+새로 만든 덱과 비교해 바뀐 것이 없으면 다시 게시하지 않을 수 있다. 종료 코드는 diff처럼
+같으면 0, 다르면 1이다.
+
+사용 예:
+    python scripts/deck_diff.py old.pptx new.pptx
+    python scripts/deck_diff.py --manifest deck.manifest.json iRUSH_Homepage_Concept.pptx
+    python scripts/deck_diff.py --quiet deck.manifest.json iRUSH_Homepage_Concept.pptx || publish
+"""
+import argparse
+import difflib
+import hashlib
+import json
+import posixpath
+import re
+import sys
+import zipfile
+
+from lxml import etree
+
+MANIFEST_VERSION = 1
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+_R = "{%s}" % _NS["r"]
+_C_NV_PR = "{%s}cNvPr" % _NS["p"]
+_TEXT = "{%s}t" % _NS["a"]
+# 관계를 가리키는 속성 (r:embed, r:id, r:link 등)
+_REL_ATTRS = etree.XPath('.//@*[namespace-uri() = "%s"]' % _NS["r"])
+
+# 이름 대신 내용으로 비교하는 파트 (그림, 차트 — 차트 XML에 값이 들어 있음)
+_CONTENT_PARTS = ("ppt/media/", "ppt/charts/")
+
+# spTree에서 도형이 아닌 자식 (그룹 자신의 속성)
+_TREE_PROPS = {"{%s}%s" % (_NS["p"], tag) for tag in ("nvGrpSpPr", "grpSpPr", "extLst")}
+
+# python-pptx/PowerPoint가 자동으로 붙이는 도형 이름 ("TextBox 12", "Rounded Rectangle 3", "Title 1")
+_AUTO_NAME = re.compile(r"^[A-Z][A-Za-z ]* \d+$")
+
+# 목록에 보여 줄 도형 텍스트 길이
+LABEL_TEXT = 40
+
+
+def _rels(zf, part):
+    """파트의 관계 {rId: (대상 파트 이름 또는 외부 URL, 외부 여부)}"""
+    folder, name = posixpath.split(part)
+    try:
+        root = etree.fromstring(zf.read(posixpath.join(folder, "_rels", name + ".rels")))
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in root.iterfind("rel:Relationship", _NS):
+        external = rel.get("TargetMode") == "External"
+        target = rel.get("Target")
+        rels[rel.get("Id")] = (target if external else posixpath.normpath(posixpath.join(folder, target)), external)
+    return rels
+
+
+def slide_parts(zf):
+    """발표 순서대로 슬라이드 파트 이름 목록"""
+    root = etree.fromstring(zf.read("ppt/presentation.xml"))
+    rels = _rels(zf, "ppt/presentation.xml")
+    return [rels[sld_id.get(_R + "id")][0] for sld_id in root.iterfind("p:sldIdLst/p:sldId", _NS)]
+
+
+class _Resolver:
+    """rId를 가리키는 내용으로 바꾸는 값 (그림과 차트는 내용 해시, 그 외는 파일 이름)"""
+
+    def __init__(self, zf):
+        self.zf = zf
+        self._digests = {}
+
+    def __call__(self, target, external):
+        if external:
+            return target
+        if not target.startswith(_CONTENT_PARTS):
+            return posixpath.basename(target)
+        digest = self._digests.get(target)
+        if digest is None:
+            digest = self._digests[target] = "sha1:" + hashlib.sha1(self.zf.read(target)).hexdigest()
+        return digest
+
+
+def _label(elm, name):
+    """diff 목록에 보여 줄 도형 설명 (태그 이름 또는 도형 종류 + 텍스트 앞부분)"""
+    if name is None:
+        name = etree.QName(elm).localname
+    elif _AUTO_NAME.match(name):
+        name = name.rsplit(" ", 1)[0]
+    text = " ".join("".join(t.text or "" for t in elm.iter(_TEXT)).split())
+    if len(text) > LABEL_TEXT:
+        text = text[:LABEL_TEXT - 1] + "…"
+    return f'{name} "{text}"' if text else name
+
+
+def _canonical(elm, rels, resolve):
+    """도형 XML에서 id, 자동 이름, rId를 정규화한 C14N 바이트"""
+    for c_nv_pr in elm.iter(_C_NV_PR):
+        c_nv_pr.attrib.pop("id", None)
+        if _AUTO_NAME.match(c_nv_pr.get("name", "")):
+            del c_nv_pr.attrib["name"]
+    if rels:
+        for attr in _REL_ATTRS(elm):
+            if attr in rels:
+                attr.getparent().set(attr.attrname, resolve(*rels[attr]))
+    return etree.tostring(elm, method="c14n", exclusive=True)
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def slide_manifest(zf, part, resolve):
+    """슬라이드 하나의 {"hash", "layout", "shapes": [[해시, 설명]]}"""
+    root = etree.fromstring(zf.read(part))
+    rels = _rels(zf, part)
+    layout = next((posixpath.basename(target) for target, external in rels.values()
+                   if not external and "/slideLayouts/" in target), "")
+    # 도형이 가리킬 수 있는 관계 (레이아웃만 있는 슬라이드는 rId를 바꿀 것이 없음)
+    rels = {rid: rel for rid, rel in rels.items() if "/slideLayouts/" not in rel[0]}
+    h = hashlib.sha256(f"layout:{layout}\n".encode("utf-8"))
+    bg = root.find("p:cSld/p:bg", _NS)
+    if bg is not None:
+        h.update(b"bg:" + _canonical(bg, rels, resolve) + b"\n")
+
+    shapes = []
+    sp_tree = root.find("p:cSld/p:spTree", _NS)
+    for elm in () if sp_tree is None else sp_tree:
+        if not isinstance(elm.tag, str) or elm.tag in _TREE_PROPS:
+            continue
+        c_nv_pr = next(elm.iter(_C_NV_PR), None)
+        label = _label(elm, None if c_nv_pr is None else c_nv_pr.get("name"))
+        digest = _digest(_canonical(elm, rels, resolve))
+        shapes.append([digest, label])
+        h.update(digest.encode("ascii") + b"\n")
+    return {"hash": h.hexdigest(), "layout": layout, "shapes": shapes}
+
+
+def deck_manifest(path):
+    """덱의 구조 해시 목록 {"version", "hash", "size", "slides": [slide_manifest...]}"""
+    with zipfile.ZipFile(path) as zf:
+        resolve = _Resolver(zf)
+        size = etree.fromstring(zf.read("ppt/presentation.xml")).find("p:sldSz", _NS)
+        slides = [slide_manifest(zf, part, resolve) for part in slide_parts(zf)]
+    size = [int(size.get("cx")), int(size.get("cy"))] if size is not None else None
+    h = hashlib.sha256(json.dumps(size).encode("ascii"))
+    for slide in slides:
+        h.update(slide["hash"].encode("ascii") + b"\n")
+    return {"version": MANIFEST_VERSION, "hash": h.hexdigest(), "size": size, "slides": slides}
+
+
+def load_manifest(path):
+    """.pptx면 구조 해시를 계산하고, 아니면 저장해 둔 manifest JSON을 읽음"""
+    if zipfile.is_zipfile(path):
+        return deck_manifest(path)
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{path}: manifest 버전이 다릅니다 ({manifest.get('version')} != {MANIFEST_VERSION})")
+    return manifest
+
+
+def save_manifest(manifest, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+
+
+def _shape_changes(old, new):
+    """도형 목록 두 개를 맞춰 [(기호, 설명)] 반환 (~ 바뀜, + 추가, - 삭제)"""
+    changes = []
+    matcher = difflib.SequenceMatcher(None, [digest for digest, _ in old], [digest for digest, _ in new],
+                                      autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        removed, added = old[i1:i2], new[j1:j2]
+        for (_, before), (_, after) in zip(removed, added):
+            changes.append(("~", before if before == after else f"{before} -> {after}"))
+        changes.extend(("-", label) for _, label in removed[len(added):])
+        changes.extend(("+", label) for _, label in added[len(removed):])
+    return changes
+
+
+def diff_manifests(old, new):
+    """두 manifest의 차이 [(슬라이드 번호, "changed"/"added"/"removed", [(기호, 설명)])]"""
+    changes = []
+    old_slides, new_slides = old["slides"], new["slides"]
+    for number, (before, after) in enumerate(zip(old_slides, new_slides), start=1):
+        if before["hash"] != after["hash"]:
+            shapes = _shape_changes(before["shapes"], after["shapes"])
+            if before["layout"] != after["layout"]:
+                shapes.insert(0, ("~", f"레이아웃 {before['layout']} -> {after['layout']}"))
+            changes.append((number, "changed", shapes))
+    common = min(len(old_slides), len(new_slides))
+    changes.extend((number, "removed", []) for number in range(common + 1, len(old_slides) + 1))
+    changes.extend((number, "added", []) for number in range(common + 1, len(new_slides) + 1))
+    return changes
+
+
+_KIND = {"changed": "바뀜", "added": "추가", "removed": "삭제"}
+
+
+def format_diff(old, new, changes):
+    lines = []
+    if old["size"] != new["size"]:
+        lines.append(f"슬라이드 크기: {old['size']} -> {new['size']}")
+    for number, kind, shapes in changes:
+        lines.append(f"슬라이드 {number}: {_KIND[kind]}")
+        lines.extend(f"  {mark} {label}" for mark, label in shapes)
+    if lines:
+        lines.append(f"슬라이드 {len(old['slides'])}장 -> {len(new['slides'])}장, {len(changes)}장 다름")
+    return "\n".join(lines)
+
+
+def run(args):
+    """old가 없으면 new의 해시 목록을 출력하고, 있으면 비교해 종료 코드 반환 (deck.py diff 공용)"""
+    new = load_manifest(args.new)
+    if args.manifest:
+        save_manifest(new, args.manifest)
+    if args.old is None:
+        if not args.quiet:
+            print(new["hash"])
+            for number, slide in enumerate(new["slides"], start=1):
+                print(f"{number:>4}  {slide['hash'][:16]}  도형 {len(slide['shapes'])}개")
+        return 0
+    old = load_manifest(args.old)
+    if old["hash"] == new["hash"]:
+        return 0
+    if not args.quiet:
+        print(format_diff(old, new, diff_manifests(old, new)))
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱 구조 해시 비교 (같으면 종료 코드 0, 다르면 1)")
+    parser.add_argument("old", nargs="?", help="이전 덱 .pptx 또는 manifest JSON")
+    parser.add_argument("new", help="새 덱 .pptx 또는 manifest JSON")
+    parser.add_argument("--quiet", action="store_true", help="출력 없이 종료 코드만")
+    parser.add_argument("--manifest", help="새 덱의 manifest JSON 저장 경로")
+    args = parser.parse_args(argv)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,592 @@
+"""덱을 PDF와 슬라이드별 PNG로 내보내기 (Pillow로 직접 그림, 오피스 프로그램 불필요)
+
+메모리에 있는 Presentation의 슬라이드 XML을 읽어 그리기 명령 목록(슬라이드 모델)으로
+바꾸고, Pillow로 도형(사각형, 둥근 사각형, 타원), 텍스트 상자, 그림을 그린다. 이 덱
+빌더가 만드는 도형만 지원하며 그림자 같은 효과는 그리지 않는다. 네이티브 차트(막대, 꺾은선,
+도넛)는 차트 XML에 캐시된 값으로 막대와 선, 조각, 레이블만 단순하게 그린다 (값 축 눈금 생략). 글꼴은 text_fit과 같이
+한글은 Noto Sans KR, 그 외는 Inter를 쓰고 폰트 파일이 없으면 Pillow 기본 폰트를 쓴다.
+
+폰트 파일(NotoSansKR-Regular/Bold, Inter-Regular/Bold)은 text_fit.FONT_DIRS 순서대로
+DECK_FONT_DIR 환경 변수 폴더, scripts/fonts, 사용자/시스템 폰트 폴더에서 찾는다. Pillow 기본
+폰트에는 한글이 없으므로 Noto Sans KR이 없으면 한글이 빈 네모로 그려진다. 이때는 그릴
+텍스트를 보고 프로세스마다 한 번 표준 오류로 경고한다.
+
+슬라이드는 CPU 코어 수만큼 프로세스에서 병렬로 그린다. 결과 PNG는 슬라이드 모델, 출력
+크기, 렌더러 버전, 폰트 파일로 정한 지문으로 디스크에 캐시되므로 바뀌지 않은 슬라이드는
+다시 그리지 않는다 (도형 id나 이름만 다른 슬라이드도 같은 지문을 가진다).
+
+사용 예:
+    python scripts/deck_export.py iRUSH_Homepage_Concept.pptx --pdf handout.pdf --png-dir thumbs
+"""
+import argparse
+import hashlib
+import io
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from lxml import etree
+from PIL import Image, ImageDraw, ImageFont
+
+import text_fit
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".deck-cache", "thumbnails")
+
+# 슬라이드 PNG 기본 폭(픽셀)과 PDF 해상도
+THUMB_WIDTH = 480
+PDF_DPI = 150
+
+# 가로세로 이 배수로 크게 그린 뒤 줄여서 도형 가장자리와 글자를 부드럽게 함
+SUPERSAMPLE = 2
+
+# 그리는 방식이 바뀌면 올려서 기존 캐시를 무효화
+RENDERER_VERSION = 1
+
+EMU_PER_INCH = 914400
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
+}
+
+_ALIGN = {"l": "left", "ctr": "center", "r": "right", "just": "left"}
+
+# 텍스트 상자 기본 여백 (EMU, python-pptx 기본값과 같음)
+_INSETS = {"lIns": 91440, "tIns": 45720, "rIns": 91440, "bIns": 45720}
+
+
+def _q(tag):
+    prefix, name = tag.split(":")
+    return "{%s}%s" % (_NS[prefix], name)
+
+
+def _box(sp_pr):
+    """spPr의 (x, y, 너비, 높이) EMU"""
+    off = sp_pr.find("a:xfrm/a:off", _NS)
+    ext = sp_pr.find("a:xfrm/a:ext", _NS)
+    if off is None or ext is None:
+        return None
+    return (int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+
+
+def _solid(parent):
+    """parent 바로 아래 solidFill의 RRGGBB (없으면 None)"""
+    clr = None if parent is None else parent.find("a:solidFill/a:srgbClr", _NS)
+    return None if clr is None else clr.get("val").upper()
+
+
+def _font(r_pr, base):
+    """rPr/defRPr 속성을 base (크기 pt, 굵게, 색상)에 덮어씀"""
+    if r_pr is None:
+        return base
+    size, bold, color = base
+    if r_pr.get("sz") is not None:
+        size = int(r_pr.get("sz")) / 100
+    if r_pr.get("b") is not None:
+        bold = r_pr.get("b") in ("1", "true")
+    return size, bold, _solid(r_pr) or color
+
+
+def _paragraphs(tx_body):
+    """[(정렬, 줄 간격 배수, [(text, 크기 pt, 굵게, 색상) 또는 줄바꿈 None])]"""
+    paragraphs = []
+    for p in tx_body.findall("a:p", _NS):
+        p_pr = p.find("a:pPr", _NS)
+        align, spacing, base = "left", 1.0, (18.0, False, "000000")
+        if p_pr is not None:
+            align = _ALIGN.get(p_pr.get("algn"), "left")
+            pct = p_pr.find("a:lnSpc/a:spcPct", _NS)
+            if pct is not None:
+                spacing = int(pct.get("val")) / 100000
+            base = _font(p_pr.find("a:defRPr", _NS), base)
+        pieces = []
+        for child in p:
+            if child.tag == _q("a:br"):
+                pieces.append(None)
+            elif child.tag == _q("a:r"):
+                text = child.findtext("a:t", "", _NS)
+                if text:
+                    pieces.append((text,) + _font(child.find("a:rPr", _NS), base))
+        paragraphs.append((align, spacing, pieces))
+    return paragraphs
+
+
+# 차트 XML의 그림 요소 -> 차트 종류
+_CHART_KINDS = {"barChart": "bar", "lineChart": "line", "doughnutChart": "donut"}
+
+# 차트 레이블 글자 크기 (pt)
+CHART_LABEL_SIZE = 11
+
+
+def _text_color(elm):
+    """차트 요소의 txPr 글자 색 (없으면 None)"""
+    return None if elm is None else _solid(elm.find("c:txPr/a:p/a:pPr/a:defRPr", _NS))
+
+
+def _chart_model(blob):
+    """차트 XML을 [종류, 항목, 값, 색상 목록, 값 레이블 색상, 글자 색상, 축/격자 색상]으로 (지원하지 않으면 None)"""
+    root = etree.fromstring(blob)
+    plot_area = root.find("c:chart/c:plotArea", _NS)
+    if plot_area is None:
+        return None
+    plot = next((child for child in plot_area if etree.QName(child).localname in _CHART_KINDS), None)
+    ser = None if plot is None else plot.find("c:ser", _NS)
+    if ser is None:
+        return None
+    kind = _CHART_KINDS[etree.QName(plot).localname]
+    categories = [pt.findtext("c:v", "", _NS) for pt in ser.iterfind("c:cat//c:pt", _NS)]
+    values = [float(pt.findtext("c:v", "0", _NS)) for pt in ser.iterfind("c:val//c:pt", _NS)]
+    if kind == "donut":
+        colors = [_solid(d_pt.find("c:spPr", _NS)) for d_pt in ser.iterfind("c:dPt", _NS)]
+    elif kind == "bar":
+        colors = [_solid(ser.find("c:spPr", _NS))]
+    else:
+        colors = [_solid(ser.find("c:spPr/a:ln", _NS))]
+    labels = plot.find("c:dLbls", _NS)
+    label_color = None if labels is None else _text_color(labels) or "808080"
+    text_color = _text_color(plot_area.find("c:catAx", _NS)) or _text_color(root) or "808080"
+    axis_color = _solid(plot_area.find("c:valAx/c:majorGridlines/c:spPr/a:ln", _NS)) or "3C3C3C"
+    return [kind, categories, values, colors, label_color, text_color, axis_color]
+
+
+def slide_model(slide):
+    """슬라이드를 (그리기 명령 목록, {이미지 지문: 이미지 바이트})로 변환"""
+    ops, images = [], {}
+    for elm in slide.shapes._spTree:
+        if elm.tag == _q("p:sp"):
+            sp_pr = elm.find("p:spPr", _NS)
+            box = _box(sp_pr)
+            if box is None:
+                continue
+            geom = sp_pr.find("a:prstGeom", _NS)
+            if geom is not None and sp_pr.find("a:noFill", _NS) is None:
+                ln = sp_pr.find("a:ln", _NS)
+                line = _solid(ln)
+                ops.append(["shape", geom.get("prst"), box, _solid(sp_pr), line,
+                            int(ln.get("w", 12700)) if line else 0])
+            tx_body = elm.find("p:txBody", _NS)
+            if tx_body is not None and tx_body.find(".//a:t", _NS) is not None:
+                body_pr = tx_body.find("a:bodyPr", _NS)
+                insets = [int(body_pr.get(key, default)) for key, default in _INSETS.items()]
+                ops.append(["text", box, insets, body_pr.get("wrap") != "none", body_pr.get("anchor", "t"),
+                            _paragraphs(tx_body)])
+        elif elm.tag == _q("p:pic"):
+            box = _box(elm.find("p:spPr", _NS))
+            blip = elm.find("p:blipFill/a:blip", _NS)
+            if box is None or blip is None:
+                continue
+            blob = slide.part.related_part(blip.get(_q("r:embed"))).blob
+            digest = hashlib.sha1(blob).hexdigest()
+            images[digest] = blob
+            src = elm.find("p:blipFill/a:srcRect", _NS)
+            crop = [int(src.get(key, 0)) / 100000 for key in ("l", "t", "r", "b")] if src is not None else None
+            ops.append(["picture", box, digest, crop])
+        elif elm.tag == _q("p:graphicFrame"):
+            off = elm.find("p:xfrm/a:off", _NS)
+            ext = elm.find("p:xfrm/a:ext", _NS)
+            chart = elm.find("a:graphic/a:graphicData/c:chart", _NS)
+            if off is None or ext is None or chart is None:
+                continue
+            model = _chart_model(slide.part.related_part(chart.get(_q("r:id"))).blob)
+            if model is not None:
+                box = (int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+                ops.append(["chart", box] + model)
+    return ops, images
+
+
+def slide_fingerprint(ops, size):
+    """슬라이드 모델과 출력 크기의 지문 (썸네일 캐시 키)"""
+    h = hashlib.sha256(f"v{RENDERER_VERSION}:{size[0]}x{size[1]}x{SUPERSAMPLE}".encode("ascii"))
+    h.update(json.dumps(text_fit.font_files()).encode("utf-8"))
+    h.update(json.dumps(ops, ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()
+
+
+# 이미 경고한 폰트 이름
+_warned_fonts = set()
+
+
+@lru_cache(maxsize=4096)
+def _default_font_covers(ch):
+    """Pillow 기본 폰트에 ch 글리프가 있는지 (없는 문자는 모두 같은 빈 네모 글리프로 그려짐)"""
+    font = _default_font(32)
+    return bytes(font.getmask(ch)) != bytes(font.getmask("\U000F0000"))
+
+
+def _strings(value):
+    """그리기 명령 목록 안의 모든 문자열"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+
+
+def missing_fonts(ops_list):
+    """그릴 텍스트에 필요하지만 폰트 파일이 없어 Pillow 기본 폰트로도 그릴 수 없는 {폰트 이름: 문자 수}"""
+    missing = {}
+    for ops in ops_list:
+        for text in _strings(ops):
+            for ch in text:
+                if ch.isascii() or ch.isspace():
+                    continue
+                name = text_fit.font_for(ch)
+                if text_fit.font_file(name) is None and not _default_font_covers(ch):
+                    missing[name] = missing.get(name, 0) + 1
+    return missing
+
+
+def warn_missing_fonts(ops_list):
+    """빈 네모로 그려질 글자가 있으면 폰트마다 한 번 표준 오류로 경고"""
+    for name, count in missing_fonts(ops_list).items():
+        if name in _warned_fonts:
+            continue
+        _warned_fonts.add(name)
+        patterns = ", ".join(text_fit.FONT_FILES[name])
+        print(f"경고: {name} 폰트 파일({patterns})을 찾지 못해 {count}자가 빈 네모로 그려집니다. "
+              f"DECK_FONT_DIR 환경 변수 폴더나 scripts/fonts에 폰트 파일을 두세요.", file=sys.stderr)
+
+
+def _pillow_font(ch, px, bold):
+    """문자에 맞는 폰트 (Noto Sans KR / Inter, 없으면 Pillow 기본 폰트)"""
+    font = text_fit.truetype(text_fit.font_for(ch), px, bold)
+    return font if font is not None else _default_font(px)
+
+
+_default_fonts = {}
+
+
+def _default_font(px):
+    font = _default_fonts.get(px)
+    if font is None:
+        font = _default_fonts[px] = ImageFont.load_default(px)
+    return font
+
+
+def _chunks(text, px, bold):
+    """문자열을 같은 폰트로 그리는 조각 [(text, font)]으로 나눔"""
+    chunks = []
+    for ch in text:
+        font = _pillow_font(ch, px, bold)
+        if chunks and chunks[-1][1] is font:
+            chunks[-1][0] += ch
+        else:
+            chunks.append([ch, font])
+    return chunks
+
+
+def _layout(pieces, scale, avail, wrap):
+    """문단 조각을 줄 목록 [[(text, font, 색상, 크기 px)]]으로 배치"""
+    lines = [[]]
+    width = 0.0
+    for piece in pieces:
+        if piece is None:
+            lines.append([])
+            width = 0.0
+            continue
+        text, size, bold, color = piece
+        px = max(1, round(size / 72 * EMU_PER_INCH * scale))
+        # 공백 단위 토큰 (공백은 앞 토큰에 붙여 줄 끝에 남김)
+        tokens = [token + " " for token in text.split(" ")]
+        tokens[-1] = tokens[-1][:-1]
+        for token in tokens:
+            if not token:
+                continue
+            chunks = _chunks(token, px, bold)
+            token_width = sum(font.getlength(part) for part, font in chunks)
+            if wrap and lines[-1] and width + token_width - _trailing(token, chunks) > avail:
+                lines.append([])
+                width = 0.0
+            for part, font in chunks:
+                lines[-1].append((part, font, color, px))
+            width += token_width
+    return lines
+
+
+def _trailing(token, chunks):
+    """줄 끝 공백 폭 (줄 넘김 판단에서 제외)"""
+    if not token.endswith(" "):
+        return 0.0
+    return chunks[-1][1].getlength(" ")
+
+
+def _draw_text(draw, op, scale):
+    _, (x, y, w, h), insets, wrap, anchor, paragraphs = op
+    left, top = (x + insets[0]) * scale, (y + insets[1]) * scale
+    avail = max(1.0, (w - insets[0] - insets[2]) * scale)
+
+    rows = []
+    for align, spacing, pieces in paragraphs:
+        default_px = round(18 / 72 * EMU_PER_INCH * scale)
+        for line in _layout(pieces, scale, avail, wrap):
+            px = max((piece[3] for piece in line), default=default_px)
+            rows.append((align, px * 1.2 * spacing, line))
+
+    total = sum(height for _, height, _ in rows)
+    if anchor == "ctr":
+        top += (h - insets[1] - insets[3]) * scale / 2 - total / 2
+    elif anchor == "b":
+        top += (h - insets[1] - insets[3]) * scale - total
+
+    for align, height, line in rows:
+        line_width = sum(font.getlength(part) for part, font, _, _ in line)
+        if align == "center":
+            cx = left + (avail - line_width) / 2
+        elif align == "right":
+            cx = left + avail - line_width
+        else:
+            cx = left
+        descent = max((font.getmetrics()[1] for _, font, _, _ in line), default=0)
+        baseline = top + height - descent
+        for part, font, color, _ in line:
+            draw.text((cx, baseline), part, font=font, fill="#" + color, anchor="ls")
+            cx += font.getlength(part)
+        top += height
+
+
+def _draw_shape(draw, op, scale):
+    _, prst, (x, y, w, h), fill, line, line_width = op
+    xy = [x * scale, y * scale, (x + w) * scale, (y + h) * scale]
+    if xy[2] <= xy[0] or xy[3] <= xy[1]:
+        # 두께가 1px도 안 되는 선
+        xy[2], xy[3] = max(xy[2], xy[0] + 1), max(xy[3], xy[1] + 1)
+    kwargs = {"fill": "#" + fill if fill else None}
+    if line:
+        kwargs.update(outline="#" + line, width=max(1, round(line_width * scale)))
+    if prst == "ellipse":
+        draw.ellipse(xy, **kwargs)
+    elif prst == "roundRect":
+        # 기본 조정값 16667 (짧은 변의 1/6)
+        draw.rounded_rectangle(xy, radius=min(xy[2] - xy[0], xy[3] - xy[1]) / 6, **kwargs)
+    else:
+        draw.rectangle(xy, **kwargs)
+
+
+def _draw_label(draw, text, x, baseline, px, color, align="center"):
+    """차트 레이블 한 줄 (x는 align 기준점)"""
+    chunks = _chunks(text, px, False)
+    width = sum(font.getlength(part) for part, font in chunks)
+    if align == "center":
+        x -= width / 2
+    elif align == "right":
+        x -= width
+    for part, font in chunks:
+        draw.text((x, baseline), part, font=font, fill="#" + color, anchor="ls")
+        x += font.getlength(part)
+
+
+def _draw_donut(draw, op, scale, px):
+    _, (x, y, w, h), _, categories, values, colors, label_color, text_color, _ = op
+    total = sum(values) or 1
+    # 범례 자리(오른쪽 1/4)를 뺀 영역 가운데, 구멍 크기 50%
+    size = min(w * 0.75, h) * scale * 0.9
+    cx, cy = (x + w * 0.375) * scale, (y + h / 2) * scale
+    ring = size / 4
+    bbox = [cx - size / 2, cy - size / 2, cx + size / 2, cy + size / 2]
+    start = -90.0
+    for i, value in enumerate(values):
+        extent = value / total * 360
+        color = colors[i] if i < len(colors) and colors[i] else "808080"
+        if extent > 0:
+            draw.arc(bbox, start, start + extent, fill="#" + color, width=max(1, round(ring)))
+        if label_color and extent > 0:
+            angle = math.radians(start + extent / 2)
+            radius = size / 2 - ring / 2
+            _draw_label(draw, f"{value / total:.0%}", cx + radius * math.cos(angle),
+                        cy + radius * math.sin(angle) + px / 3, px, label_color)
+        start += extent
+
+    # 범례
+    left = (x + w * 0.78) * scale
+    top = cy - len(categories) * px * 1.6 / 2
+    for i, name in enumerate(categories):
+        color = colors[i] if i < len(colors) and colors[i] else "808080"
+        row = top + i * px * 1.6
+        draw.rectangle([left, row, left + px * 0.8, row + px * 0.8], fill="#" + color)
+        _draw_label(draw, name, left + px * 1.3, row + px * 0.8, px, text_color, align="left")
+
+
+def _draw_chart(draw, op, scale):
+    _, (x, y, w, h), kind, categories, values, colors, label_color, text_color, axis_color = op
+    px = max(1, round(CHART_LABEL_SIZE / 72 * EMU_PER_INCH * scale))
+    if not values:
+        return
+    if kind == "donut":
+        _draw_donut(draw, op, scale, px)
+        return
+
+    # 위 한 줄은 값 레이블, 아래 한 줄은 항목 이름 자리
+    left, right = x * scale, (x + w) * scale
+    top, bottom = y * scale + px * 2, (y + h) * scale - px * 2
+    peak = max(values) or 1
+    for i in range(1, 5):
+        gy = bottom - (bottom - top) * i / 4
+        draw.line([left, gy, right, gy], fill="#" + axis_color, width=1)
+    draw.line([left, bottom, right, bottom], fill="#" + axis_color, width=1)
+
+    color = "#" + (colors[0] or "808080")
+    slot = (right - left) / len(values)
+    points = []
+    for i, value in enumerate(values):
+        center = left + slot * (i + 0.5)
+        top_y = bottom - (bottom - top) * value / peak
+        if kind == "bar":
+            # 간격 너비 60% (막대 폭 대비)
+            bar = slot / 1.6
+            draw.rectangle([center - bar / 2, top_y, center + bar / 2, bottom], fill=color)
+        points.append((center, top_y))
+        if label_color:
+            _draw_label(draw, f"{value:,.0f}", center, top_y - px / 2, px, label_color)
+    if kind == "line":
+        if len(points) > 1:
+            draw.line(points, fill=color, width=max(1, round(2.5 / 72 * EMU_PER_INCH * scale)))
+        r = 3 / 72 * EMU_PER_INCH * scale
+        for cx, cy in points:
+            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=color)
+
+    # 항목 이름 (겹치지 않게 건너뛰며)
+    widest = max(sum(font.getlength(part) for part, font in _chunks(name, px, False)) for name in categories)
+    step = max(1, math.ceil((widest + px) / slot))
+    for i in range(0, len(categories), step):
+        _draw_label(draw, categories[i], left + slot * (i + 0.5), bottom + px * 1.5, px, text_color)
+
+
+def _draw_picture(canvas, op, scale, images):
+    _, (x, y, w, h), digest, crop = op
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    with Image.open(io.BytesIO(images[digest])) as im:
+        im = im.convert("RGB")
+        if crop:
+            l, t, r, b = crop
+            im = im.crop((round(im.width * l), round(im.height * t),
+                          round(im.width * (1 - r)), round(im.height * (1 - b))))
+        canvas.paste(im.resize(size, Image.LANCZOS), (round(x * scale), round(y * scale)))
+
+
+def render_slide(ops, images, size, slide_size):
+    """슬라이드 모델 하나를 size(픽셀) PNG 바이트로 그림"""
+    big = (size[0] * SUPERSAMPLE, size[1] * SUPERSAMPLE)
+    scale = big[0] / slide_size[0]
+    canvas = Image.new("RGB", big, "white")
+    draw = ImageDraw.Draw(canvas)
+    for op in ops:
+        if op[0] == "shape":
+            _draw_shape(draw, op, scale)
+        elif op[0] == "text":
+            _draw_text(draw, op, scale)
+        elif op[0] == "picture":
+            _draw_picture(canvas, op, scale, images)
+        elif op[0] == "chart":
+            _draw_chart(draw, op, scale)
+    if SUPERSAMPLE != 1:
+        canvas = canvas.resize(size, Image.LANCZOS)
+    buf = io.BytesIO()
+    canvas.save(buf, "PNG", optimize=False)
+    return buf.getvalue()
+
+
+def _render_job(job):
+    return render_slide(*job)
+
+
+def _cache_path(cache_dir, fingerprint):
+    return os.path.join(cache_dir, fingerprint[:2], fingerprint + ".png")
+
+
+def _write_cached(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=".png", dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def render_deck(prs, width=THUMB_WIDTH, workers=None, cache_dir=CACHE_DIR):
+    """모든 슬라이드를 폭 width 픽셀로 그려 캐시된 PNG 경로 목록과 통계 반환"""
+    slide_size = (prs.slide_width, prs.slide_height)
+    size = (width, max(1, round(width * slide_size[1] / slide_size[0])))
+    paths, jobs, missing, models = [], [], [], []
+    for slide in prs.slides:
+        ops, images = slide_model(slide)
+        models.append(ops)
+        path = _cache_path(cache_dir, slide_fingerprint(ops, size))
+        paths.append(path)
+        if not os.path.exists(path) and path not in missing:
+            jobs.append((ops, images, size, slide_size))
+            missing.append(path)
+    # 캐시된 썸네일도 같은 폰트로 그린 것이므로 모든 슬라이드를 봄
+    warn_missing_fonts(models)
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        results = map(_render_job, jobs)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(_render_job, jobs)
+    try:
+        for path, data in zip(missing, results):
+            _write_cached(path, data)
+    finally:
+        if workers > 1:
+            pool.shutdown()
+    return paths, {"slides": len(paths), "rendered": len(missing), "cached": len(paths) - len(missing)}
+
+
+def export_pngs(prs, out_dir, width=THUMB_WIDTH, workers=None, cache_dir=CACHE_DIR):
+    """슬라이드별 PNG를 out_dir/slide01.png ... 로 저장하고 통계 반환"""
+    paths, stats = render_deck(prs, width, workers, cache_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    digits = max(2, len(str(len(paths))))
+    for i, path in enumerate(paths, start=1):
+        shutil.copyfile(path, os.path.join(out_dir, f"slide{i:0{digits}d}.png"))
+    return stats
+
+
+def export_pdf(prs, output, dpi=PDF_DPI, workers=None, cache_dir=CACHE_DIR):
+    """슬라이드 한 장을 한 페이지로 PDF 저장 (페이지 크기는 슬라이드 크기와 같음)"""
+    width = round(prs.slide_width / EMU_PER_INCH * dpi)
+    paths, stats = render_deck(prs, width, workers, cache_dir)
+    if not paths:
+        raise ValueError("슬라이드가 없는 덱은 PDF로 저장할 수 없습니다")
+    pages = [Image.open(path) for path in paths]
+    try:
+        pages[0].save(output, "PDF", save_all=True, append_images=pages[1:], resolution=dpi, quality=90)
+    finally:
+        for page in pages:
+            page.close()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱을 PDF와 슬라이드별 PNG로 내보내기")
+    parser.add_argument("deck", help="내보낼 .pptx 파일")
+    parser.add_argument("--pdf", help="PDF 저장 경로")
+    parser.add_argument("--png-dir", help="슬라이드 PNG 저장 폴더")
+    parser.add_argument("--width", type=int, default=THUMB_WIDTH, help=f"PNG 폭 (픽셀, 기본 {THUMB_WIDTH})")
+    parser.add_argument("--dpi", type=int, default=PDF_DPI, help=f"PDF 해상도 (기본 {PDF_DPI})")
+    parser.add_argument("--workers", type=int, help="렌더링 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="썸네일 캐시 폴더")
+    args = parser.parse_args(argv)
+    if not (args.pdf or args.png_dir):
+        parser.error("--pdf 또는 --png-dir 중 하나는 지정해야 합니다")
+
+    from pptx import Presentation
+
+    prs = Presentation(args.deck)
+    if args.pdf:
+        stats = export_pdf(prs, args.pdf, args.dpi, args.workers, args.cache_dir)
+        print(f"PDF 저장: {os.path.abspath(args.pdf)} (슬라이드 {stats['slides']}장, {stats['cached']}장 캐시 사용)")
+    if args.png_dir:
+        stats = export_pngs(prs, args.png_dir, args.width, args.workers, args.cache_dir)
+        print(f"PNG 저장: {os.path.abspath(args.png_dir)} (슬라이드 {stats['slides']}장, {stats['cached']}장 캐시 사용)")
+
+
+if __name__ == "__main__":
+    main()
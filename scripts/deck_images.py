@@ -0,0 +1,83 @@
+"""슬라이드에 넣을 이미지 전처리 (축소 + 재압축 + 디스크 캐시)
+
+src/assets/images의 원본 JPG는 수 MB라 그대로 넣으면 덱 크기가 커진다.
+이미지를 슬라이드의 배치 박스 크기 x 목표 DPI로 줄이고(박스 비율에 맞춰 가운데 자름)
+지정한 품질의 JPEG로 다시 인코딩한다. 결과는 원본 내용 해시와 처리 옵션으로 주소가
+정해지는 디스크 캐시에 저장되므로 같은 이미지는 모든 빌드와 덱을 통틀어 한 번만 처리된다.
+
+DPI와 품질 기본값은 DECK_IMAGE_DPI, DECK_IMAGE_QUALITY 환경 변수로 바꿀 수 있다.
+"""
+import hashlib
+import os
+import tempfile
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".deck-cache", "images")
+
+DEFAULT_DPI = int(os.environ.get("DECK_IMAGE_DPI", 150))
+DEFAULT_QUALITY = int(os.environ.get("DECK_IMAGE_QUALITY", 82))
+
+# 처리 방식이 바뀌면 올려서 기존 캐시를 무효화
+PIPELINE_VERSION = 1
+
+# (절대 경로, 크기, 수정 시각) -> 원본 내용 해시
+_source_digests = {}
+
+
+def source_digest(path):
+    """원본 파일 내용 해시 (파일이 바뀌지 않았으면 프로세스 안에서 재계산하지 않음)"""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    digest = _source_digests.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = _source_digests[key] = h.hexdigest()
+    return digest
+
+
+def target_size(source_size, width, height, dpi):
+    """박스(인치)와 DPI로 출력 픽셀 크기 계산 — 원본보다 크게 키우지 않음"""
+    box_w, box_h = max(1, round(width * dpi)), max(1, round(height * dpi))
+    src_w, src_h = source_size
+    scale = min(1.0, src_w / box_w, src_h / box_h)
+    return max(1, round(box_w * scale)), max(1, round(box_h * scale))
+
+
+def _encode(path, out_path, width, height, dpi, quality):
+    """이미지를 박스 비율로 잘라 축소하고 JPEG로 저장"""
+    # Pillow는 실제로 인코딩할 때만 임포트 (캐시에 있는 이미지는 Pillow 없이 경로만 돌려줌)
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as im:
+        # EXIF 회전(90/270도)이 있으면 가로세로를 바꿔서 계산
+        rotated = im.getexif().get(0x0112, 1) in (5, 6, 7, 8)
+        source_size = im.size[::-1] if rotated else im.size
+        size = target_size(source_size, width, height, dpi)
+        # JPEG는 디코딩 단계에서 미리 줄여 메모리와 시간을 아낀다 (결과는 요청 크기 이상)
+        im.draft("RGB", size[::-1] if rotated else size)
+        im = ImageOps.exif_transpose(im)
+        if im.mode != "RGB":
+            im = im.convert("RGB")
+        im = ImageOps.fit(im, size, Image.LANCZOS)
+
+        fd, tmp = tempfile.mkstemp(suffix=".jpg", dir=os.path.dirname(out_path))
+        with os.fdopen(fd, "wb") as f:
+            im.save(f, "JPEG", quality=quality, optimize=True, progressive=True)
+    os.replace(tmp, out_path)
+
+
+def prepare_image(path, width, height, dpi=None, quality=None, cache_dir=CACHE_DIR):
+    """배치 박스(인치)에 맞게 처리된 이미지 파일 경로 반환 (캐시에 있으면 바로 반환)"""
+    dpi = dpi or DEFAULT_DPI
+    quality = quality or DEFAULT_QUALITY
+    key = hashlib.sha256(
+        f"{source_digest(path)}:{width:.4f}x{height:.4f}@{dpi}:q{quality}:v{PIPELINE_VERSION}".encode("ascii")
+    ).hexdigest()
+    out_path = os.path.join(cache_dir, key[:2], key + ".jpg")
+    if not os.path.exists(out_path):
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        _encode(path, out_path, width, height, dpi, quality)
+    return out_path
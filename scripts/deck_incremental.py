@@ -0,0 +1,170 @@
+"""변경된 슬라이드만 다시 렌더링하는 증분 빌드
+
+슬라이드 스펙마다 지문(빌더 소스 + 스펙 내용의 해시)을 계산하고, 렌더링된
+슬라이드 XML을 디스크 캐시에 보관한다. 다시 빌드할 때는 지문이 바뀐 슬라이드만
+렌더링하고 나머지는 캐시된 XML로 빈 슬라이드 뼈대 패키지를 채워 다시 묶는다.
+
+사용 예:
+    python scripts/deck_incremental.py --client LG전자
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+import create_ppt
+import deck_cache
+import deck_reproducible
+import deck_spec
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".deck-cache")
+
+_LAYOUT_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+
+_skeletons = {}
+
+
+def builder_digest():
+    """슬라이드 생성 코드의 해시 — create_ppt와 그것이 임포트하는 모듈 중 하나라도 바뀌면 캐시 전체가 무효화됨
+
+    결과 캐시(deck_cache)와 같은 빌더 버전을 쓴다.
+    """
+    return deck_cache.builder_version()
+
+
+def slide_fingerprint(slide_spec):
+    """슬라이드 스펙 하나의 내용 지문 (스펙이 가리키는 데이터 파일 내용 포함)"""
+    h = hashlib.sha256(builder_digest().encode("ascii"))
+    h.update(json.dumps(slide_spec, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for path in deck_spec.slide_paths(slide_spec):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def render_slide_xml(slide_spec):
+    """슬라이드 스펙 하나를 임시 덱에 렌더링해 슬라이드 XML 목록 반환
+
+    레이아웃 외의 관계(이미지 등)가 있는 슬라이드는 XML만으로 다시 묶을 수 없으므로
+    None을 반환한다.
+    """
+    prs = create_ppt.new_presentation()
+    create_ppt.SLIDE_RENDERERS[slide_spec["type"]](prs, slide_spec)
+    blobs = []
+    for slide in prs.slides:
+        if any(rel.reltype != _LAYOUT_RELTYPE for rel in slide.part.rels.values()):
+            return None
+        blobs.append(slide.part.blob)
+    return blobs
+
+
+def _cache_path(cache_dir, fingerprint):
+    return os.path.join(cache_dir, "slides", fingerprint[:2], fingerprint)
+
+
+def _read_cached(path):
+    """캐시된 슬라이드 XML 목록 읽기 (없으면 None)"""
+    try:
+        names = sorted(os.listdir(path), key=lambda name: int(name.split(".")[0]))
+    except FileNotFoundError:
+        return None
+    blobs = []
+    for name in names:
+        with open(os.path.join(path, name), "rb") as f:
+            blobs.append(f.read())
+    return blobs
+
+
+def _write_cached(path, blobs):
+    """슬라이드 XML 목록을 임시 폴더에 쓴 뒤 원자적으로 캐시에 올림"""
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent)
+    for i, blob in enumerate(blobs):
+        with open(os.path.join(tmp, f"{i}.xml"), "wb") as f:
+            f.write(blob)
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        # 다른 프로세스가 먼저 같은 지문을 기록한 경우
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def skeleton_package(slide_count):
+    """빈 슬라이드 slide_count장으로 이루어진 패키지 바이트 (프로세스당 한 번 생성)"""
+    blob = _skeletons.get(slide_count)
+    if blob is None:
+        prs = create_ppt.new_presentation()
+        for _ in range(slide_count):
+            create_ppt.add_blank_slide(prs)
+        buf = io.BytesIO()
+        prs.save(buf)
+        blob = _skeletons[slide_count] = buf.getvalue()
+    return blob
+
+
+def repack(slide_blobs, output):
+    """뼈대 패키지의 슬라이드 XML을 렌더링된 XML로 바꿔 저장"""
+    replacements = {
+        f"ppt/slides/slide{i}.xml": blob for i, blob in enumerate(slide_blobs, start=1)
+    }
+    with zipfile.ZipFile(io.BytesIO(skeleton_package(len(slide_blobs)))) as src:
+        parts = {name: replacements.get(name) or src.read(name) for name in src.namelist()}
+    deck_reproducible.write_package(parts, output)
+
+
+def rebuild_deck(spec=None, output=create_ppt.DEFAULT_OUTPUT, cache_dir=CACHE_DIR):
+    """지문이 바뀐 슬라이드만 렌더링해 덱을 저장하고 통계 반환"""
+    started = time.perf_counter()
+    compiled = create_ppt.load_deck_spec(spec)
+    slide_blobs = []
+    rendered = reused = 0
+    for slide_spec in compiled["slides"]:
+        path = _cache_path(cache_dir, slide_fingerprint(slide_spec))
+        blobs = _read_cached(path)
+        if blobs is None:
+            blobs = render_slide_xml(slide_spec)
+            if blobs is None:
+                # 증분 빌드를 지원하지 않는 슬라이드가 있으면 전체 빌드
+                create_ppt.save_deck(create_ppt.build_deck(spec), output)
+                return {"slides": len(compiled["slides"]), "rendered": len(compiled["slides"]),
+                        "reused": 0, "full_build": True, "seconds": time.perf_counter() - started}
+            _write_cached(path, blobs)
+            rendered += 1
+        else:
+            reused += 1
+        slide_blobs.extend(blobs)
+
+    repack(slide_blobs, output)
+    return {"slides": len(compiled["slides"]), "rendered": rendered, "reused": reused,
+            "full_build": False, "seconds": time.perf_counter() - started}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="변경된 슬라이드만 다시 렌더링하는 증분 빌드")
+    parser.add_argument("--spec-file", help="덱 스펙 파일 (기본: specs/irush_concept.json)")
+    parser.add_argument("--client", help="클라이언트 이름 덮어쓰기")
+    parser.add_argument("--output", default=create_ppt.DEFAULT_OUTPUT, help="저장 경로")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="슬라이드 캐시 폴더")
+    args = parser.parse_args(argv)
+
+    spec = {}
+    if args.spec_file:
+        spec["spec_file"] = args.spec_file
+    if args.client:
+        spec["client"] = args.client
+
+    stats = rebuild_deck(spec, args.output, args.cache_dir)
+    print(f"PPT 생성 완료: {os.path.abspath(args.output)} "
+          f"(슬라이드 {stats['slides']}개 중 {stats['rendered']}개 렌더링, "
+          f"{stats['reused']}개 캐시 사용, {stats['seconds'] * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
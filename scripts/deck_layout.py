@@ -0,0 +1,132 @@
+"""슬라이드 배치 엔진 (열, 행, 간격, 넘치면 다음 슬라이드)
+
+슬라이드 함수는 카드나 목록의 위치를 직접 계산하지 않고 Grid로 배치를 선언한다.
+Grid는 항목 수를 받아 열 수, 칸 폭, 슬라이드당 행 수를 정하고 모든 칸의 위치를 한 번에
+계산한다. 항목이 늘어 영역 폭을 넘으면 칸 폭을 min_cell_width까지 줄이고, 그래도
+넘치면 다음 행으로, 영역 높이도 넘치면 다음 슬라이드(페이지)로 넘긴다.
+칸 안의 세로 목록(클라이언트 이름, 기술 아이템 등)이 칸 아래로 넘치면 overflow_pages가
+넘친 항목을 이어지는 슬라이드의 같은 칸으로 보낸다.
+
+좌표와 크기는 모두 인치 단위 float이며 그릴 때 Inches()로 바꾼다.
+"""
+import math
+from collections import namedtuple
+
+SLIDE_WIDTH = 13.333
+SLIDE_HEIGHT = 7.5
+
+# 본문 영역 오른쪽/아래쪽 끝 (인치) — 가장 넓게 쓰던 사이트 구조 슬라이드 기준
+CONTENT_RIGHT = 13.2
+CONTENT_BOTTOM = 7.0
+
+# 칸 수를 셀 때 float 오차 허용치
+_EPSILON = 1e-9
+
+
+class Box(namedtuple("Box", "x y w h")):
+    """칸 하나의 위치와 크기 (인치)"""
+
+    __slots__ = ()
+
+    @property
+    def right(self):
+        return self.x + self.w
+
+    @property
+    def bottom(self):
+        return self.y + self.h
+
+
+class Grid:
+    """영역 안에 같은 크기 칸을 왼쪽에서 오른쪽, 위에서 아래로 배치
+
+    columns를 지정하지 않으면 항목 수만큼 한 행에 놓고, 영역 폭에 맞게 칸 폭을
+    cell_width에서 min_cell_width(기본 cell_width의 3/4)까지 줄인다.
+    """
+
+    def __init__(self, left, top, cell_width, cell_height, gap=0.2, row_gap=None, columns=None,
+                 right=CONTENT_RIGHT, bottom=CONTENT_BOTTOM, min_cell_width=None):
+        self.left = left
+        self.top = top
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.gap = gap
+        self.row_gap = gap if row_gap is None else row_gap
+        self.columns = columns
+        self.right = right
+        self.bottom = bottom
+        self.min_cell_width = cell_width * 0.75 if min_cell_width is None else min_cell_width
+
+    def fit(self, count):
+        """항목 count개를 놓을 (열 수, 칸 폭, 슬라이드당 행 수)"""
+        avail = self.right - self.left
+        columns = self.columns or max(1, count)
+        max_columns = math.floor((avail + self.gap) / (self.min_cell_width + self.gap) + _EPSILON)
+        columns = max(1, min(columns, max_columns))
+        width = min(self.cell_width, (avail - self.gap * (columns - 1)) / columns)
+        rows = math.floor((self.bottom - self.top + self.row_gap) / (self.cell_height + self.row_gap) + _EPSILON)
+        return columns, width, max(1, rows)
+
+    def _boxes(self, count, columns, width, rows=None):
+        # 열 x좌표, 행 y좌표를 한 번씩만 계산해 조합
+        xs = [self.left + c * (width + self.gap) for c in range(columns)]
+        row_count = -(-count // columns) if rows is None else min(rows, -(-count // columns))
+        ys = [self.top + r * (self.cell_height + self.row_gap) for r in range(row_count)]
+        per_page = columns * len(ys)
+        return [Box(xs[i % columns], ys[(i % per_page) // columns], width, self.cell_height)
+                for i in range(count)] if per_page else []
+
+    def pages(self, count):
+        """항목 count개의 칸을 슬라이드별 목록으로 (항목이 없어도 빈 페이지 하나)"""
+        columns, width, rows = self.fit(count)
+        boxes = self._boxes(count, columns, width, rows)
+        per_page = columns * rows
+        return [boxes[i:i + per_page] for i in range(0, count, per_page)] or [[]]
+
+    def cells(self, count):
+        """항목 count개를 한 슬라이드에 모두 배치 (영역 아래로 넘칠 수 있음)"""
+        columns, width, _ = self.fit(count)
+        return self._boxes(count, columns, width)
+
+
+def paginate(items, grid):
+    """항목을 grid 페이지로 나눠 페이지마다 [(번호, 항목, Box)] 목록을 만듦"""
+    items = list(items)
+    start = 0
+    for boxes in grid.pages(len(items)):
+        yield [(start + i, item, box) for i, (item, box) in enumerate(zip(items[start:start + len(boxes)], boxes))]
+        start += len(boxes)
+
+
+def overflow_rounds(page, items_of, stack_of):
+    """칸마다 세로 목록이 있는 페이지 하나를 목록이 칸 아래로 넘치지 않게 여러 장으로 나눔
+
+    page는 paginate()가 만든 [(번호, 그룹, Box)], items_of(그룹)은 그룹의 세로 목록,
+    stack_of(Box)는 그 목록을 놓을 한 열짜리 Grid다. 장마다 [(번호, 그룹, Box, [(항목, Box)])]를
+    넘겨주고, 목록이 남은 그룹만 같은 자리에서 다음 장으로 이어진다. 항목은 한 번씩만
+    배치되므로 목록 길이에 비례하는 시간에 끝난다.
+    """
+    pending = []
+    for i, group, box in page:
+        items = items_of(group)
+        stack = stack_of(box)
+        # 칸 하나에 들어가는 행 위치를 그룹마다 한 번만 계산
+        _, _, rows = stack.fit(len(items))
+        pending.append([i, group, box, items, 0, stack.cells(rows)])
+
+    first = True
+    while first or pending:
+        chunk = []
+        for entry in pending:
+            i, group, box, items, start, rows = entry
+            chunk.append((i, group, box, list(zip(items[start:start + len(rows)], rows))))
+            entry[4] = start + len(rows)
+        yield chunk
+        pending = [entry for entry in pending if entry[4] < len(entry[3])]
+        first = False
+
+
+def overflow_pages(groups, grid, items_of, stack_of):
+    """paginate()와 overflow_rounds()를 이어 붙인 슬라이드 단위 스트림"""
+    for page in paginate(groups, grid):
+        yield from overflow_rounds(page, items_of, stack_of)
@@ -0,0 +1,263 @@
+"""메시지 카탈로그로 여러 언어 덱을 한 번에 만들기
+
+카탈로그(locales/<스펙 이름>.json)는 원문(스펙에 쓴 한국어 문자열) -> 번역문 목록을
+언어 태그(BCP 47, "en-US", "ja-JP")별로 담는다. 원문과 번역문에는 스펙처럼 {client} 같은
+자리표시자를 쓸 수 있다.
+
+    {"source": "ko-KR", "locales": {"en-US": {"창작에 대한 뜨거운 열정...": "A burning passion..."}}}
+
+덱은 원문 언어로 한 번만 빌드한다. 도형 위치와 크기, 배경, 이미지, 레이아웃 등 언어와
+무관한 파트는 모든 언어가 그대로 나눠 쓰고, 언어마다 슬라이드 XML의 텍스트만 바꾼다.
+도형 텍스트 전체가 카탈로그 원문과 같으면 번역문으로 바꾸고(줄바꿈 포함), 글머리표("• "),
+"  |  " 구분자, 이어지는 슬라이드의 " (계속)"이 붙은 텍스트는 조각별로 바꾼다.
+카탈로그에 없는 텍스트(트렌드 기사 등)는 원문 그대로 둔다.
+
+번역문이 길어 원문에 맞춰 정한 글자 크기로 상자에 들어가지 않으면 text_fit으로 글자 크기만
+줄인다. 바뀐 텍스트의 run에는 언어 태그(lang)를 달아 PowerPoint가 맞는 글꼴과 맞춤법
+검사를 쓰게 한다.
+
+사용 예:
+    python scripts/deck_locale.py --locales en-US,ja-JP
+    python scripts/deck.py build --locales all --output out/deck.pptx
+"""
+import argparse
+import copy
+import io
+import json
+import os
+import re
+import time
+import zipfile
+
+from lxml import etree
+
+import create_ppt
+import deck_patch
+import deck_reproducible
+import deck_spec
+import text_fit
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+EMU_PER_INCH = 914400
+
+# 번역문을 줄여 넣을 때의 최소 글자 크기 (pt)
+MIN_SIZE = 8
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+_A = "{%s}" % _NS["a"]
+
+_SLIDE_PART = re.compile(r"^ppt/slides/slide\d+\.xml$")
+
+# 텍스트 앞뒤의 장식과 구분자 — 그 사이 조각을 따로 번역
+_SEPARATORS = re.compile(r"(^[•→]\s+|\s+\|\s+|%s$)" % re.escape(create_ppt.CONTINUED))
+
+
+def catalog_path(spec_file=None):
+    """스펙 파일에 짝지은 카탈로그 경로 (locales/<스펙 파일 이름>.json)"""
+    name = os.path.splitext(os.path.basename(spec_file or deck_spec.DEFAULT_SPEC_FILE))[0]
+    return os.path.join(LOCALE_DIR, name + ".json")
+
+
+def load_catalog(path):
+    """카탈로그 파일 읽기 (형식이 맞지 않으면 SpecError)"""
+    raw = deck_spec.read_spec_file(path)
+    catalog = deck_spec.parse_spec(raw, path)
+    locales = catalog.get("locales")
+    if not isinstance(locales, dict) or not all(
+            isinstance(messages, dict) and all(isinstance(v, str) for v in messages.values())
+            for messages in locales.values()):
+        raise deck_spec.SpecError(f"{path}: locales는 언어 태그 -> {{원문: 번역문}} 객체여야 합니다")
+    return catalog
+
+
+def locale_messages(catalog, locale, compiled):
+    """한 언어의 {원문: 번역문} (자리표시자는 컴파일된 스펙 값으로 치환)"""
+    try:
+        messages = catalog["locales"][locale]
+    except KeyError:
+        raise deck_spec.SpecError(f"카탈로그에 없는 언어: {locale} ({', '.join(catalog['locales'])})")
+    variables = deck_spec.spec_variables(compiled)
+    return {deck_spec.substitute(source, variables): deck_spec.substitute(target, variables)
+            for source, target in messages.items()}
+
+
+def translate(text, messages):
+    """도형 텍스트 하나를 번역 (전체가 카탈로그에 없으면 장식/구분자 사이 조각별로)"""
+    whole = messages.get(text)
+    if whole is not None:
+        return whole
+    pieces = _SEPARATORS.split(text)
+    if len(pieces) == 1:
+        return text
+    for i, piece in enumerate(pieces):
+        if i % 2 == 0:
+            pieces[i] = messages.get(piece, piece)
+        elif piece == create_ppt.CONTINUED:
+            pieces[i] = " " + messages.get(piece.strip(), piece.strip())
+    return "".join(pieces)
+
+
+def _shape_text(tx_body):
+    """txBody의 텍스트 (문단과 <a:br/>는 줄바꿈)"""
+    lines = []
+    for p in tx_body.iterfind("a:p", _NS):
+        line = []
+        for child in p:
+            if child.tag == _A + "br":
+                line.append("\n")
+            elif child.tag == _A + "r":
+                line.append(child.findtext("a:t", "", _NS))
+        lines.append("".join(line))
+    return "\n".join(lines)
+
+
+def _refit(sp, tx_body, source, text):
+    """원문에 맞춰 정한 글자 크기로 번역문이 상자를 넘치면 글자 크기를 줄임
+
+    텍스트 상자 스타일(문단 기본 글꼴 defRPr의 sz)만 다룬다. 원문도 이미 넘치던 상자는
+    (spAutoFit으로 늘어나는 제목 등) 건드리지 않는다.
+    """
+    ext = sp.find("p:spPr/a:xfrm/a:ext", _NS)
+    def_r_pr = tx_body.find("a:p/a:pPr/a:defRPr", _NS)
+    if ext is None or def_r_pr is None or def_r_pr.get("sz") is None:
+        return
+    size = int(def_r_pr.get("sz")) / 100
+    width = int(ext.get("cx")) / EMU_PER_INCH
+    height = int(ext.get("cy")) / EMU_PER_INCH
+    bold = def_r_pr.get("b") == "1"
+    wrap = tx_body.find("a:bodyPr", _NS).get("wrap") != "none"
+    pct = tx_body.find("a:p/a:pPr/a:lnSpc/a:spcPct", _NS)
+    line_spacing = 1.2 * (int(pct.get("val")) / 100000 if pct is not None else 1.0)
+
+    def fit(value):
+        return text_fit.fit_font_size(value, width, height, size, min_size=min(size, MIN_SIZE), bold=bold,
+                                      line_spacing=line_spacing, wrap=wrap)
+
+    if fit(source) < size:
+        return
+    new_size = fit(text)
+    if new_size < size:
+        # TextStyle과 같은 계산 (Pt(size).centipoints)
+        def_r_pr.set("sz", "%d" % (int(new_size * 12700) // 127))
+
+
+def _set_lang(tx_body, lang):
+    """텍스트의 모든 run과 문단 기본 글꼴에 언어 태그 지정"""
+    for run in tx_body.iter(_A + "r"):
+        r_pr = run.find("a:rPr", _NS)
+        if r_pr is None:
+            r_pr = etree.Element(_A + "rPr")
+            run.insert(0, r_pr)
+        r_pr.set("lang", lang)
+    for def_r_pr in tx_body.iterfind("a:p/a:pPr/a:defRPr", _NS):
+        def_r_pr.set("lang", lang)
+
+
+def translate_slide_xml(blob, messages, lang):
+    """슬라이드 XML 하나를 번역해 (새 XML 바이트 또는 바뀐 것이 없으면 None, 바꾼 도형 수) 반환"""
+    root = etree.fromstring(blob)
+    changed = 0
+    for tx_body in root.iterfind(".//p:sp/p:txBody", _NS):
+        source = _shape_text(tx_body)
+        if not source:
+            continue
+        text = translate(source, messages)
+        if text == source:
+            continue
+        # 원문이 도형 텍스트 전체이므로 run이 여럿이어도(통계 숫자 + suffix) 전체를 바꿈
+        deck_patch.set_text(tx_body, text, replace_all=True)
+        _refit(tx_body.getparent(), tx_body, source, text)
+        _set_lang(tx_body, lang)
+        changed += 1
+    if not changed:
+        return None, 0
+    return etree.tostring(root, encoding="UTF-8", standalone=True), changed
+
+
+def localize_package(parts, messages, lang, file):
+    """원문 덱의 {파트 이름: 바이트}에서 슬라이드 텍스트만 번역한 덱을 file에 저장하고 바꾼 도형 수 반환"""
+    localized = dict(parts)
+    changed = 0
+    for name, blob in parts.items():
+        if _SLIDE_PART.match(name):
+            new_blob, count = translate_slide_xml(blob, messages, lang)
+            if new_blob is not None:
+                localized[name] = new_blob
+                changed += count
+    deck_reproducible.write_package(localized, file)
+    return changed
+
+
+def locale_output(output, locale):
+    """언어별 저장 경로 (deck.pptx -> deck.en-US.pptx)"""
+    stem, ext = os.path.splitext(output)
+    return f"{stem}.{locale}{ext}"
+
+
+def build_locales(spec=None, locales=None, output=create_ppt.DEFAULT_OUTPUT, catalog=None):
+    """원문 덱을 한 번 빌드해 output에 저장하고 언어별 덱을 locale_output 경로에 저장
+
+    locales가 None이면 카탈로그의 모든 언어. 반환값은 {"source": 경로, "locales": {언어: (경로, 바꾼 도형 수)},
+    "seconds": 소요 시간}.
+    """
+    started = time.perf_counter()
+    spec = dict(spec or {})
+    compiled = create_ppt.load_deck_spec(spec)
+    catalog = load_catalog(catalog or catalog_path(spec.get("spec_file")))
+    locales = list(catalog["locales"]) if locales is None else locales
+    messages = {locale: locale_messages(catalog, locale, compiled) for locale in locales}
+
+    buf = io.BytesIO()
+    create_ppt.save_deck(create_ppt.build_deck(spec), buf)
+    with open(output, "wb") as f:
+        f.write(buf.getvalue())
+    # 언어와 무관한 파트는 한 번만 풀어 모든 언어가 공유
+    with zipfile.ZipFile(buf) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+
+    results = {}
+    for locale in locales:
+        path = locale_output(output, locale)
+        results[locale] = (path, localize_package(parts, messages[locale], locale, path))
+    return {"source": output, "locales": results, "seconds": time.perf_counter() - started}
+
+
+def parse_locales(value):
+    """--locales 값 ("all" 또는 쉼표로 구분한 언어 태그)을 목록으로 (all이면 None)"""
+    if value == "all":
+        return None
+    return [locale.strip() for locale in value.split(",") if locale.strip()]
+
+
+def format_result(result):
+    lines = [f"PPT 생성 완료: {os.path.abspath(result['source'])}"]
+    for locale, (path, changed) in result["locales"].items():
+        lines.append(f"  {locale}: {os.path.abspath(path)} (텍스트 {changed}곳 번역)")
+    lines.append(f"언어 {len(result['locales'])}개 포함 {result['seconds'] * 1000:.0f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="메시지 카탈로그로 언어별 덱을 한 번에 생성")
+    parser.add_argument("--spec-file", help="덱 스펙 파일 (기본: specs/irush_concept.json)")
+    parser.add_argument("--client", help="클라이언트 이름 덮어쓰기")
+    parser.add_argument("--locales", default="all", help="쉼표로 구분한 언어 태그 (기본: 카탈로그의 모든 언어)")
+    parser.add_argument("--messages", help="메시지 카탈로그 (기본: locales/<스펙 파일 이름>.json)")
+    parser.add_argument("--output", default=create_ppt.DEFAULT_OUTPUT,
+                        help="원문 덱 저장 경로 (언어별 덱은 이름에 .<언어>를 붙여 같은 폴더에 저장)")
+    args = parser.parse_args(argv)
+
+    spec = {}
+    if args.spec_file:
+        spec["spec_file"] = args.spec_file
+    if args.client:
+        spec["client"] = args.client
+    print(format_result(build_locales(spec, parse_locales(args.locales), args.output, args.messages)))
+
+
+if __name__ == "__main__":
+    main()
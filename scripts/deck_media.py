@@ -0,0 +1,142 @@
+"""덱 사이에서 공유하는 이미지 레지스트리
+
+python-pptx의 add_picture는 호출할 때마다 파일 전체를 읽고 SHA1을 계산한 뒤 패키지의
+이미지 파트를 훑어 같은 이미지를 찾는다. MediaRegistry는 이미지 파일을 mmap으로 한 번만
+열고 내용 해시를 한 번만 계산해 프로세스 안의 모든 덱에서 재사용한다. 덱(패키지)마다
+이미지 파트는 해시당 하나만 만들어지고 모든 슬라이드가 그 파트를 참조한다.
+mmap으로 읽은 데이터는 저장할 때 그대로 ZIP에 기록되므로 큰 이미지도 파이썬 메모리로
+복사되지 않는다.
+
+서버처럼 오래 도는 프로세스에서 mmap(과 mmap이 복제한 파일 디스크립터)이 쌓이지 않도록
+레지스트리는 최근에 쓴 이미지 max_images개만 유지한다. 밀려난 이미지의 mmap은 그 이미지를
+담은 덱이 모두 사라진 뒤에 닫는다.
+
+이미지 파트를 직접 만들고 붙이는 부분은 python-pptx 내부 API를 쓰므로 확인한 버전(1.0.x)에서만
+켜고, 다른 버전에서는 공개 API(shapes.add_picture)로 파일을 그대로 넣는다.
+"""
+import collections
+import mmap
+import os
+import weakref
+
+import pptx
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image, ImagePart
+from pptx.shapes.shapetree import SlideShapes
+from pptx.util import lazyproperty
+
+# 레지스트리가 열어 두는 이미지 수 기본값
+MAX_IMAGES = 64
+
+
+def _private_api_supported():
+    """이 모듈이 쓰는 python-pptx 내부 API가 확인한 형태 그대로 있는지"""
+    if not pptx.__version__.startswith("1.0."):
+        return False
+    return (isinstance(Image.__dict__.get("_pil_props"), lazyproperty)
+            and isinstance(ImagePart.__dict__.get("sha1"), lazyproperty)
+            and all(hasattr(SlideShapes, name)
+                    for name in ("_add_pic_from_image_part", "_recalculate_extents", "_shape_factory")))
+
+
+PRIVATE_API = _private_api_supported()
+
+
+class MediaRegistry:
+    """내용 해시로 이미지를 한 번만 읽고, 덱마다 이미지 파트를 한 번만 만드는 레지스트리"""
+
+    def __init__(self, max_images=MAX_IMAGES):
+        self.max_images = max_images
+        # (절대 경로, 크기, 수정 시각) -> SHA1
+        self._sources = {}
+        # SHA1 -> Image, 오래 안 쓴 순 (경로가 달라도 내용이 같으면 하나로 합침)
+        self._images = collections.OrderedDict()
+        # 패키지 -> {SHA1: ImagePart}
+        self._parts = weakref.WeakKeyDictionary()
+        # 밀려났지만 아직 덱이 참조하고 있어 mmap을 닫지 못한 이미지
+        self._retired = []
+
+    def image(self, path):
+        """이미지 파일을 mmap으로 열어 캐시된 Image 반환"""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        key = (path, st.st_size, st.st_mtime_ns)
+        sha1 = self._sources.get(key)
+        if sha1 in self._images:
+            self._images.move_to_end(sha1)
+            return self._images[sha1]
+        with open(path, "rb") as f:
+            blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        image = Image.from_blob(blob, os.path.basename(path))
+        if image.sha1 in self._images:
+            # 다른 경로의 같은 내용
+            blob.close()
+            image = self._images[image.sha1]
+            self._images.move_to_end(image.sha1)
+        else:
+            # 포맷/크기는 파일 헤더만 읽어 채움 (python-pptx는 blob 전체를 BytesIO로 복사함)
+            from PIL import Image as PILImage
+
+            with PILImage.open(path) as im:
+                image.__dict__["_pil_props"] = (im.format, im.size, im.info.get("dpi"))
+            self._images[image.sha1] = image
+            self._evict()
+        self._sources[key] = image.sha1
+        return image
+
+    def _in_use(self, sha1):
+        return any(sha1 in parts for parts in self._parts.values())
+
+    def _evict(self):
+        """max_images를 넘는 오래된 이미지를 내보내고, 더 이상 참조하는 덱이 없는 mmap을 닫음"""
+        while len(self._images) > self.max_images:
+            sha1, image = self._images.popitem(last=False)
+            self._sources = {key: value for key, value in self._sources.items() if value != sha1}
+            self._retired.append(image)
+        retired = []
+        for image in self._retired:
+            if self._in_use(image.sha1):
+                retired.append(image)
+            else:
+                image.blob.close()
+        self._retired = retired
+
+    def close(self):
+        """열어 둔 mmap을 모두 닫고 비움 (이 레지스트리로 만든 덱을 저장한 뒤에만 호출)"""
+        for image in list(self._images.values()) + self._retired:
+            image.blob.close()
+        self._sources.clear()
+        self._images.clear()
+        self._parts.clear()
+        self._retired = []
+
+    def image_part(self, package, path):
+        """패키지 안에서 이 이미지를 담은 파트 (없으면 한 번만 생성)"""
+        image = self.image(path)
+        parts = self._parts.setdefault(package, weakref.WeakValueDictionary())
+        part = parts.get(image.sha1)
+        if part is None:
+            part = ImagePart.new(package, image)
+            # python-pptx가 같은 이미지를 찾을 때 다시 해시하지 않도록 미리 채움
+            part.__dict__["sha1"] = image.sha1
+            parts[image.sha1] = part
+        return part
+
+    def add_picture(self, slide, path, left, top, width, height):
+        """공유 이미지 파트를 참조하는 그림 도형을 슬라이드에 추가"""
+        if not PRIVATE_API:
+            return slide.shapes.add_picture(path, left, top, width, height)
+        part = self.image_part(slide.part.package, path)
+        rId = slide.part.relate_to(part, RT.IMAGE)
+        shapes = slide.shapes
+        pic = shapes._add_pic_from_image_part(part, rId, left, top, width, height)
+        shapes._recalculate_extents()
+        return shapes._shape_factory(pic)
+
+    def stats(self):
+        """열어 둔 이미지 수와 전체 바이트 (밀려났지만 덱이 참조 중인 이미지 포함)"""
+        images = list(self._images.values()) + self._retired
+        return {
+            "images": len(images),
+            "bytes": sum(len(image.blob) for image in images),
+        }
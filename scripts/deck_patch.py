@@ -0,0 +1,324 @@
+"""이미 만든 덱의 태그된 텍스트만 바꿔 저장하는 패치 모드
+
+create_ppt는 바뀔 수 있는 값(표지 연도, 통계 숫자, 트렌드 기사 등)을 담은 텍스트 상자에
+"cover.year", "stats.0.value", "trends.3.title" 같은 도형 이름을 붙여 둔다. 패치는 덱을
+python-pptx로 다시 만들지 않고 .pptx(zip)를 직접 열어, 값을 바꿀 도형 이름이나
+{{이름}} 토큰이 들어 있는 슬라이드 XML만 파싱해 그 도형의 텍스트 run만 고쳐 쓴다.
+나머지 파트(이미지, 레이아웃, 테마, 바뀌지 않은 슬라이드)는 파싱하지 않고 내용 그대로
+옮기므로(zipfile 공개 API로 다시 압축) 큰 클라이언트 덱도 전체 빌드보다 훨씬 빨리 끝난다.
+
+PowerPoint에서 직접 만든 템플릿도 도형 이름(선택 창의 이름, 플레이스홀더 이름)이나
+텍스트 안의 {{이름}} 토큰으로 같은 방식으로 패치할 수 있다. 토큰은 run 하나 안에 있어야
+한다 (서식이 바뀌는 곳에서 나뉜 토큰은 찾지 못함). 글꼴과 위치는 바꾸지 않고 크기는 값에
+size를 줄 때만 바꾸므로, 트렌드 기사 수가 바뀌어 슬라이드 수가 달라질 때는 다시 빌드해야 한다.
+
+사용 예:
+    python scripts/deck_patch.py iRUSH_Homepage_Concept.pptx --set cover.year=2025
+    python scripts/deck_patch.py deck.pptx --from-spec --client LG전자 --output lg.pptx
+    python scripts/deck_patch.py deck.pptx --values values.json
+"""
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import zipfile
+
+from lxml import etree
+
+import deck_colors
+import deck_reproducible
+import deck_spec
+import deck_trends
+import text_fit
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+_A = "{%s}" % _NS["a"]
+
+_SLIDE_PART = re.compile(r"^ppt/slides/slide\d+\.xml$")
+# 슬라이드 XML 바이트에서 도형 이름만 빠르게 훑기 (파싱 여부 판단용)
+_SHAPE_NAME = re.compile(rb'<p:cNvPr\b[^>]*?\sname="([^"]*)"')
+_TOKEN = re.compile(r"\{\{([^{}]+)\}\}")
+_CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+def _plain(text):
+    """python-pptx와 같게 제어 문자를 _xHHHH_로 바꿈 (lxml은 제어 문자를 받지 않음)"""
+    return _CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), str(text))
+
+
+def _unescape_name(raw):
+    """cNvPr name 속성 바이트를 문자열로 (XML 엔티티 복원)"""
+    text = raw.decode("utf-8")
+    if "&" in text:
+        text = etree.fromstring(b"<n>" + raw + b"</n>").text
+    return text
+
+
+# === 스펙 -> 태그 값 ===
+def spec_values(compiled):
+    """컴파일된 스펙(deck_spec.load_spec 결과)에서 create_ppt가 붙이는 태그의 값 계산
+
+    문자열 값은 도형 텍스트 전체를, 목록 값은 run을 순서대로 바꾼다 (통계 숫자 + suffix).
+    트렌드 기사는 create_ppt와 같은 규칙으로 제목과 요약을 자르고, 제목은 자른 기준인 글자
+    크기도 함께 넘긴다 ({"text", "size"}).
+    """
+    values = {}
+    for slide in compiled["slides"]:
+        kind = slide["type"]
+        if kind == "cover":
+            for key in ("title", "subtitle", "description", "year"):
+                values[f"cover.{key}"] = slide[key]
+        elif kind == "stats":
+            for i, stat in enumerate(slide["stats"]):
+                values[f"stats.{i}.value"] = [stat["value"], stat["suffix"]]
+                values[f"stats.{i}.label"] = stat["label"]
+                values[f"stats.{i}.description"] = stat["description"]
+        elif kind == "trends":
+            for i, article in enumerate(deck_trends.iter_trends(slide["source"])):
+                title = article.get("title", "")
+                size = text_fit.fit_font_size(title, 8.2, 0.4, 15, min_size=12, bold=True, wrap=False)
+                values[f"trends.{i}.number"] = str(article.get("number", ""))
+                values[f"trends.{i}.title"] = {"text": text_fit.truncate_to_width(title, size, 8.2, bold=True),
+                                               "size": size}
+                values[f"trends.{i}.meta"] = f"{article.get('source', '')}  {article.get('date', '')}"
+                values[f"trends.{i}.summary"] = deck_trends.truncate(article.get("summary", ""),
+                                                                     slide["summary_length"])
+        elif kind == "ending":
+            for key in ("title", "company", "contact", "values_line"):
+                values[f"ending.{key}"] = slide[key]
+    return values
+
+
+# === 텍스트 바꾸기 ===
+def _set_runs(paragraph, runs, texts):
+    """문단의 run들을 texts 길이에 맞추고 차례로 텍스트 지정 (run 서식은 유지)"""
+    if not runs:
+        run = etree.Element(_A + "r")
+        etree.SubElement(run, _A + "t")
+        end = paragraph.find(_A + "endParaRPr")
+        if end is None:
+            paragraph.append(run)
+        else:
+            end.addprevious(run)
+        runs = [run]
+    for run, text in zip(runs, texts):
+        run.find(_A + "t").text = _plain(text)
+    for run in runs[len(texts):]:
+        paragraph.remove(run)
+    last = runs[min(len(runs), len(texts)) - 1]
+    for text in texts[len(runs):]:
+        run = copy.deepcopy(runs[-1])
+        run.find(_A + "t").text = _plain(text)
+        last.addnext(run)
+        last = run
+
+
+def _set_size(tx_body, size):
+    """txBody의 글자 크기를 size(pt)로 (문단 기본 서식, run, 문단 끝 서식 모두)"""
+    for r_pr in tx_body.iter(_A + "defRPr", _A + "rPr", _A + "endParaRPr"):
+        r_pr.set("sz", str(round(size * 100)))
+
+
+def set_text(tx_body, value, replace_all=False):
+    """txBody의 텍스트를 value로 바꿈
+
+    문자열은 첫 문단 첫 run의 서식으로 전체를 다시 쓴다 (줄바꿈은 <a:br/>). 단, 한 줄짜리
+    텍스트에 서식이 다른 run이 여럿이면(통계 숫자 + suffix) 한 줄 문자열은 첫 run의 텍스트만
+    바꾸고 나머지 run은 그대로 둔다. replace_all이면 이때도 전체를 다시 쓴다 (value가 도형
+    텍스트 전체일 때, deck_locale). 목록은 첫 문단의 run을 순서대로 바꾸고, 남는 run은
+    지우고 모자라면 마지막 run을 복사한다. {"text": 값, "size": pt}는 text로 바꾼 뒤 글자
+    크기를 size로 맞춘다 (size는 생략 가능).
+    """
+    if isinstance(value, dict):
+        set_text(tx_body, value["text"], replace_all)
+        if value.get("size"):
+            _set_size(tx_body, value["size"])
+        return
+    paragraphs = tx_body.findall(_A + "p")
+    first = paragraphs[0]
+    if (not replace_all and not isinstance(value, (list, tuple)) and len(paragraphs) == 1 and first.find(_A + "br") is None
+            and len(first.findall(_A + "r")) > 1 and not re.search("\n|\v", str(value))):
+        first.find(_A + "r").find(_A + "t").text = _plain(value)
+        return
+    for extra in paragraphs[1:]:
+        tx_body.remove(extra)
+    for br in first.findall(_A + "br"):
+        first.remove(br)
+    runs = first.findall(_A + "r")
+
+    if isinstance(value, (list, tuple)):
+        _set_runs(first, runs, [str(text) for text in value])
+        return
+
+    lines = re.split("\n|\v", str(value))
+    _set_runs(first, runs[:1], lines[:1])
+    for run in runs[1:]:
+        first.remove(run)
+    last = first.findall(_A + "r")[-1]
+    for line in lines[1:]:
+        br = etree.Element(_A + "br")
+        run = copy.deepcopy(last)
+        run.find(_A + "t").text = _plain(line)
+        last.addnext(br)
+        br.addnext(run)
+        last = run
+
+
+def _replace_tokens(root, values):
+    """모든 run 텍스트의 {{이름}} 토큰을 값으로 바꾸고 바꾼 토큰 이름 목록 반환"""
+    used = []
+
+    def sub(m):
+        key = m.group(1).strip()
+        if key not in values:
+            return m.group(0)
+        used.append(key)
+        value = values[key]
+        if isinstance(value, dict):
+            value = value["text"]
+        return _plain("".join(map(str, value)) if isinstance(value, (list, tuple)) else value)
+
+    for t in root.iter(_A + "t"):
+        if t.text and "{{" in t.text:
+            t.text = _TOKEN.sub(sub, t.text)
+    return used
+
+
+def patch_slide_xml(blob, values):
+    """슬라이드 XML 하나를 패치해 (새 XML 바이트, 찾은 이름 목록, 바뀐 도형/토큰 수) 반환
+
+    찾은 도형의 텍스트가 이미 값과 같아 바뀐 것이 없으면 새 XML 바이트 대신 None을 반환한다.
+    """
+    root = etree.fromstring(blob)
+    found = []
+    changed = 0
+    for c_nv_pr in root.iterfind(".//p:sp/p:nvSpPr/p:cNvPr", _NS):
+        name = c_nv_pr.get("name")
+        if name not in values:
+            continue
+        tx_body = c_nv_pr.getparent().getparent().find("p:txBody", _NS)
+        if tx_body is None or tx_body.find(_A + "p") is None:
+            continue
+        found.append(name)
+        before = etree.tostring(tx_body)
+        set_text(tx_body, values[name])
+        changed += etree.tostring(tx_body) != before
+    tokens = _replace_tokens(root, values)
+    found.extend(tokens)
+    changed += len(tokens)
+    if not changed:
+        return None, found, 0
+    return etree.tostring(root, encoding="UTF-8", standalone=True), found, changed
+
+
+# === zip 다시 쓰기 ===
+def _copy_entry(src, dst, info):
+    """zip 항목 내용을 그대로 dst에 복사 (이름, 시각, 속성, 압축 방식은 원본대로)"""
+    zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.create_system = info.create_system
+    zinfo.external_attr = info.external_attr
+    dst.writestr(zinfo, src.read(info))
+
+
+def patch_deck(path, values, output=None):
+    """덱의 태그된 도형과 {{이름}} 토큰을 values로 바꿔 output(기본: 같은 파일)에 저장하고 통계 반환
+
+    values는 도형 이름(또는 토큰 이름) -> 문자열 또는 run별 문자열 목록이다.
+    """
+    started = time.perf_counter()
+    output = output or path
+    keys = set(values)
+    stats = {"parts": 0, "rewritten": 0, "changed": 0}
+    found = set()
+
+    fd, tmp = tempfile.mkstemp(suffix=".pptx", dir=os.path.dirname(os.path.abspath(output)))
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp, "w") as dst:
+            for info in src.infolist():
+                stats["parts"] += 1
+                if _SLIDE_PART.match(info.filename):
+                    blob = src.read(info)
+                    names = {_unescape_name(raw) for raw in _SHAPE_NAME.findall(blob)}
+                    if names & keys or b"{{" in blob:
+                        blob, names, changed = patch_slide_xml(blob, values)
+                        found.update(names)
+                        if blob is not None:
+                            # 운영체제와 무관하게 같은 바이트가 나오도록 재현 가능한 빌드와 같은 헤더
+                            dst.writestr(deck_reproducible.zip_info(info.filename), blob)
+                            stats["rewritten"] += 1
+                            stats["changed"] += changed
+                            continue
+                _copy_entry(src, dst, info)
+        os.replace(tmp, output)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    stats["missing"] = sorted(keys - found, key=_natural_key)
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def _natural_key(name):
+    """"trends.10.title"이 "trends.9.title" 뒤에 오도록 숫자는 숫자로 비교"""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part) for part in name.split(".")]
+
+
+def parse_assignments(items):
+    """--set 이름=값 목록을 dict로 (값의 \\n은 줄바꿈)"""
+    values = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"이름=값 형식이 아닙니다: {item}")
+        values[key] = value.replace("\\n", "\n")
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱의 태그된 텍스트만 바꿔 저장")
+    parser.add_argument("deck", help="패치할 .pptx 파일")
+    parser.add_argument("--output", help="저장 경로 (기본: 원본 파일에 덮어쓰기)")
+    parser.add_argument("--set", action="append", default=[], metavar="이름=값",
+                        help="도형 이름(또는 {{이름}} 토큰)과 새 텍스트, 여러 번 지정 가능")
+    parser.add_argument("--values",
+                        help="이름 -> 값 JSON 파일 (값이 목록이면 run별로, {\"text\", \"size\"}면 글자 크기도 바꿈)")
+    parser.add_argument("--from-spec", action="store_true", help="스펙의 현재 값으로 태그를 모두 바꿈")
+    parser.add_argument("--spec-file", help="--from-spec 스펙 파일 (기본: specs/irush_concept.json)")
+    parser.add_argument("--client", help="--from-spec 클라이언트 이름 덮어쓰기")
+    args = parser.parse_args(argv)
+
+    values = {}
+    if args.from_spec:
+        spec = {key: value for key, value in (("spec_file", args.spec_file), ("client", args.client)) if value}
+        values.update(spec_values(deck_spec.load_spec(spec, color_names=deck_colors.PALETTE)))
+    if args.values:
+        with open(args.values, encoding="utf-8") as f:
+            values.update(json.load(f))
+    try:
+        values.update(parse_assignments(args.set))
+    except ValueError as e:
+        parser.error(str(e))
+    if not values:
+        parser.error("--set, --values, --from-spec 중 하나는 지정해야 합니다")
+
+    stats = patch_deck(args.deck, values, args.output)
+    print(f"패치 완료: {os.path.abspath(args.output or args.deck)} "
+          f"(파트 {stats['parts']}개 중 {stats['rewritten']}개 다시 씀, 텍스트 {stats['changed']}곳 바뀜, "
+          f"{stats['seconds'] * 1000:.0f} ms)")
+    if stats["missing"]:
+        print(f"덱에 없는 이름 {len(stats['missing'])}개: {', '.join(stats['missing'][:10])}"
+              + (" ..." if len(stats["missing"]) > 10 else ""), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
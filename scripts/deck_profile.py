@@ -0,0 +1,106 @@
+"""덱 빌드 프로파일 (슬라이드 함수별 소요 시간, 도형 수, 메모리 최대치)
+
+build_deck(spec, profile=BuildProfile())처럼 넘기면 슬라이드 함수 호출마다 기록이 남고,
+prs.save()는 profile.measure("prs.save()", prs, new_slides=False)로 감싸 기록한다.
+기본 모드는 perf_counter와 도형 개수만 세므로 운영 워커에서 켜 두어도 부담이 거의 없다.
+memory=True이면 tracemalloc으로 구간별 파이썬 할당 최대치도 기록한다 (느려지므로 --profile 전용).
+lxml이 C에서 할당하는 XML 트리 메모리는 tracemalloc에 잡히지 않으므로 프로세스 전체
+최대 RSS(ru_maxrss)도 함께 남긴다.
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _max_rss_bytes():
+    """프로세스 최대 RSS (바이트, 알 수 없으면 None)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return rss if rss > 1 << 32 else rss * 1024
+
+
+class BuildProfile:
+    """구간별 기록을 모으는 프로파일러"""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.records = []
+        self._started_tracing = False
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def measure(self, name, prs=None, new_slides=True, **info):
+        """with 블록 하나를 기록
+
+        prs를 넘기면 new_slides가 참일 때 블록에서 추가된 슬라이드의, 거짓이면 덱 전체의
+        슬라이드 수와 도형 수를 센다.
+        """
+        first = len(prs.slides) if prs is not None and new_slides else 0
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            record = {"name": name, **info, "seconds": seconds}
+            if self.memory:
+                record["peak_bytes"] = max(0, tracemalloc.get_traced_memory()[1] - base)
+            if prs is not None:
+                slides = list(prs.slides)[first:]
+                record["slides"] = len(slides)
+                record["shapes"] = sum(len(slide.shapes) for slide in slides)
+            self.records.append(record)
+
+    def stop(self):
+        """이 프로파일러가 켠 tracemalloc을 끔"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 결과"""
+        return {
+            "total_seconds": sum(record["seconds"] for record in self.records),
+            "max_rss_bytes": _max_rss_bytes(),
+            "records": self.records,
+        }
+
+    def save_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def format_table(self):
+        """사람이 읽는 표 (오래 걸린 구간에 * 표시)"""
+        total = sum(record["seconds"] for record in self.records) or 1.0
+        header = f"{'#':>3}  {'section':<28} {'ms':>9} {'%':>6} {'slides':>8} {'shapes':>6}"
+        if self.memory:
+            header += f" {'peak':>10}"
+        lines = [header, "-" * len(header)]
+        for i, record in enumerate(self.records, start=1):
+            share = record["seconds"] / total * 100
+            line = (f"{i:>3}  {record['name']:<28} {record['seconds'] * 1000:>9.1f} {share:>5.1f}%"
+                    f" {record.get('slides', ''):>8} {record.get('shapes', ''):>6}")
+            if self.memory:
+                line += f" {record['peak_bytes'] / 1024:>8.0f}KB"
+            if share >= 20:
+                line += "  *"
+            lines.append(line)
+        lines.append("-" * len(header))
+        summary = f"합계 {total * 1000:.1f} ms"
+        rss = _max_rss_bytes()
+        if rss is not None:
+            summary += f", 최대 RSS {rss / (1 << 20):.0f} MB"
+        lines.append(summary)
+        return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""같은 입력이면 바이트까지 같은 .pptx를 쓰는 재현 가능한 저장
+
+python-pptx의 prs.save()는 ZIP 항목마다 저장한 시각을 기록하고 운영체제 종류를 남기므로
+같은 스펙으로 두 번 빌드해도 파일 해시가 달라진다. 여기서는 prs.save()가 쓸 패키지 파트를
+직접 꺼내 고정된 순서([Content_Types].xml, _rels/.rels, 나머지는 이름순)와 고정된 시각,
+속성으로 한 번만 압축해 쓴다. 이미 저장된 파일은 normalize로 다시 묶는다.
+도형 id는 create_ppt/ShapeBatch가 슬라이드마다 1부터 차례로 매기므로 이미 입력에 따라 정해진다.
+
+시각은 재현 가능한 빌드 관례대로 SOURCE_DATE_EPOCH 환경 변수(유닉스 초)를 쓰고, 없으면
+ZIP 형식의 가장 이른 시각(1980-01-01)을 쓴다. SOURCE_DATE_EPOCH가 있으면 문서 속성
+(docProps/core.xml)의 만든 날짜와 수정한 날짜도 그 시각으로 맞춘다. 없으면 템플릿의 고정된
+값을 그대로 둔다. 차트 데이터 통합 문서(xlsx)처럼 덱 안에 넣는 패키지는 만든 도구가 현재
+시각을 기록하므로 SOURCE_DATE_EPOCH가 없어도 1980-01-01로 맞춘다(embedded_package).
+압축 결과는 zlib 버전에 따라 달라질 수 있으므로 같은 해시를 기대하는 빌드끼리는 같은
+Python 환경을 써야 한다.
+
+python-pptx는 save()에서만 임포트하므로 zip 항목만 다루는 모듈(deck_patch 등)은 python-pptx
+없이 zip_info, write_package를 쓸 수 있다.
+"""
+import io
+import os
+import time
+import zipfile
+
+from lxml import etree
+
+# ZIP 항목 시각이 표현할 수 있는 가장 이른 시각 (1980-01-01 00:00:00 UTC)
+ZIP_EPOCH = 315532800
+
+CORE_PART = "docProps/core.xml"
+
+# 맨 앞에 둘 파트 (나머지는 이름순)
+_FIRST = ["[Content_Types].xml", "_rels/.rels"]
+
+_CORE_NS = {
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+    "dcterms": "http://purl.org/dc/terms/",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+}
+
+
+def source_date_epoch():
+    """SOURCE_DATE_EPOCH 값 (유닉스 초, 설정되지 않았으면 None)"""
+    value = os.environ.get("SOURCE_DATE_EPOCH")
+    return int(value) if value else None
+
+
+def zip_info(name, timestamp=None):
+    """고정된 시각과 속성의 ZipInfo (timestamp가 없으면 SOURCE_DATE_EPOCH, 그것도 없으면 1980-01-01)"""
+    if timestamp is None:
+        timestamp = source_date_epoch()
+    info = zipfile.ZipInfo(name, date_time=time.gmtime(max(ZIP_EPOCH, timestamp or ZIP_EPOCH))[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    # 운영체제와 무관하게 같은 헤더 (Unix, rw-r--r--)
+    info.create_system = 3
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def normalize_core_xml(blob, timestamp):
+    """문서 속성의 만든 날짜/수정한 날짜를 timestamp로 맞추고 마지막 인쇄 날짜를 지움"""
+    root = etree.fromstring(blob)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+    for tag in ("created", "modified"):
+        elm = root.find(f"dcterms:{tag}", _CORE_NS)
+        if elm is None:
+            elm = etree.SubElement(root, f"{{{_CORE_NS['dcterms']}}}{tag}")
+            elm.set(f"{{{_CORE_NS['xsi']}}}type", "dcterms:W3CDTF")
+        elm.text = stamp
+    for elm in root.findall("cp:lastPrinted", _CORE_NS):
+        root.remove(elm)
+    return etree.tostring(root, encoding="UTF-8", standalone=True)
+
+
+def part_order(names):
+    """ZIP 항목 순서: [Content_Types].xml, _rels/.rels, 나머지 이름순"""
+    first = [name for name in _FIRST if name in names]
+    return first + sorted(name for name in names if name not in _FIRST)
+
+
+def write_package(parts, file, timestamp=None):
+    """{파트 이름: 바이트}를 고정된 순서, 시각, 속성으로 file(경로 또는 쓰기 스트림)에 기록"""
+    if timestamp is None:
+        timestamp = source_date_epoch()
+    with zipfile.ZipFile(file, "w") as zf:
+        for name in part_order(parts):
+            blob = parts[name]
+            if name == CORE_PART and timestamp is not None:
+                blob = normalize_core_xml(blob, timestamp)
+            zf.writestr(zip_info(name, timestamp), blob)
+
+
+def normalize(data, file, timestamp=None):
+    """이미 저장된 .pptx 바이트를 재현 가능한 형태로 다시 묶어 file에 기록"""
+    with zipfile.ZipFile(io.BytesIO(data)) as src:
+        parts = {name: src.read(name) for name in src.namelist()}
+    write_package(parts, file, timestamp)
+
+
+def embedded_package(data, timestamp=None):
+    """덱 안에 넣는 패키지(차트 데이터 xlsx 등)를 고정된 시각으로 다시 묶은 바이트 (만든 날짜도 항상 고정)"""
+    if timestamp is None:
+        timestamp = source_date_epoch()
+    buf = io.BytesIO()
+    normalize(data, buf, ZIP_EPOCH if timestamp is None else timestamp)
+    return buf.getvalue()
+
+
+def _content_types_item():
+    """python-pptx의 [Content_Types].xml 생성기 (내부 구조가 바뀌어 없으면 None)"""
+    try:
+        from pptx.opc.serialized import _ContentTypesItem
+    except ImportError:
+        return None
+    return _ContentTypesItem
+
+
+def package_parts(prs):
+    """prs.save()가 ZIP에 쓸 내용 {파트 이름: 바이트} (python-pptx PackageWriter와 같은 파트)"""
+    from pptx.opc.oxml import serialize_part_xml
+
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    blobs = {
+        "[Content_Types].xml": serialize_part_xml(_content_types_item().xml_for(parts)),
+        "_rels/.rels": package._rels.xml,
+    }
+    for part in parts:
+        blobs[part.partname.membername] = part.blob
+        if len(part.rels):
+            blobs[part.partname.rels_uri.membername] = part.rels.xml
+    return blobs
+
+
+def save(prs, file, timestamp=None):
+    """prs.save() 대신 쓰는 재현 가능한 저장 (파트를 한 번만 압축)"""
+    if _content_types_item() is None:
+        # python-pptx 내부 구조가 바뀌었으면 prs.save() 결과를 다시 묶음
+        buf = io.BytesIO()
+        prs.save(buf)
+        normalize(buf.getvalue(), file, timestamp)
+        return
+    write_package(package_parts(prs), file, timestamp)
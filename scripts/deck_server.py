@@ -0,0 +1,315 @@
+"""덱 생성 로컬 HTTP 서비스 (asyncio, 표준 라이브러리만 사용)
+
+웹사이트 백엔드가 CI 대신 이 서비스에 덱 생성을 요청한다. 렌더링은 시작할 때 미리
+데워 둔 프로세스 풀 워커가 맡고, 렌더링 중인 요청과 기다리는 요청을 합쳐 워커 수 +
+대기열 크기를 넘으면 503과 Retry-After로 거절해 부하를 되돌린다. 같은 스펙(deck_spec 스펙 해시)을 동시에 요청하면 렌더링은
+한 번만 하고 결과를 모든 요청에 나눠 준다. 완성된 덱은 결과 캐시(deck_cache)에 남아
+같은 스펙을 다시 요청하면 워커를 거치지 않고 바로 돌려준다. 결과 덱은 Content-Length를
+붙여 조각 단위로 쓰므로 느린 클라이언트에는 보내는 속도를 맞춘다.
+
+스펙 읽기, 캐시 키 계산, 캐시 읽기/쓰기처럼 디스크를 건드리는 일은 이벤트 루프가 아니라
+I/O 스레드 하나에서 차례로 실행해 느린 디스크가 다른 연결을 막지 않게 한다. 워커 프로세스가
+죽으면(메모리 부족 등) 그 요청은 실패로 돌려주고 풀을 새로 띄운다.
+
+엔드포인트:
+    POST /decks     본문 JSON {"spec": "irush_portfolio", "client": "LG전자", "theme": "irush_midnight"}
+                    -> .pptx (spec은 scripts/specs의 스펙 이름, 나머지는 스펙 최상위 값 덮어쓰기)
+    GET  /health    워커 수, 대기열, 처리 통계 JSON
+
+사용 예:
+    python scripts/deck_server.py --port 8765 --workers 4
+    curl -X POST localhost:8765/decks -d '{"client": "LG전자"}' -o deck.pptx
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import deck_cache
+import deck_colors
+import deck_spec
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 16
+
+# 요청 본문 최대 크기, 응답을 나눠 쓰는 크기 (바이트)
+MAX_BODY = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+PPTX_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class RequestError(Exception):
+    """HTTP 오류 응답으로 돌려줄 요청 오류"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _warm_worker():
+    """워커 시작 시 기본 덱을 한 번 만들어 임포트, 스펙, 도형 캐시를 미리 채움"""
+    import create_ppt
+
+    create_ppt.build_deck().save(io.BytesIO())
+
+
+def _ready():
+    return os.getpid()
+
+
+def render_deck_bytes(spec):
+    """워커에서 덱을 만들어 .pptx 바이트 반환"""
+    import create_ppt
+
+    buf = io.BytesIO()
+    create_ppt.save_deck(create_ppt.build_deck(spec), buf)
+    return buf.getvalue()
+
+
+def request_spec(body):
+    """요청 본문 JSON을 load_spec 덮어쓰기 값으로 변환
+
+    스펙 파일은 scripts/specs 안의 이름으로만, 테마는 scripts/themes 안의 이름으로만 고를 수 있고
+    slides처럼 파일 경로가 들어가는 값은 덮어쓸 수 없다.
+    """
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError as e:
+        raise RequestError(400, f"JSON 파싱 실패 ({e})")
+    if not isinstance(data, dict):
+        raise RequestError(400, "요청 본문은 JSON 객체여야 합니다")
+
+    spec = {}
+    for key, value in data.items():
+        if key in ("slides", "spec_file"):
+            raise RequestError(400, f"{key}는 덮어쓸 수 없습니다")
+        if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+            raise RequestError(400, f"{key}: 문자열이나 숫자여야 합니다")
+        if key in ("spec", "theme") and (not isinstance(value, str) or not value.replace("_", "").isalnum()):
+            raise RequestError(400, f"{key}: 이름만 쓸 수 있습니다")
+        if key == "spec":
+            spec["spec_file"] = os.path.join(deck_spec.SPEC_DIR, value + ".json")
+        else:
+            spec[key] = value
+    return spec
+
+
+class DeckService:
+    """미리 데운 워커 풀, 크기 제한 대기열, 스펙 해시 기준 요청 합치기"""
+
+    def __init__(self, workers=None, queue_size=DEFAULT_QUEUE_SIZE, cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.cache = cache if cache is not None else deck_cache.DeckCache()
+        # 받아들이는 작업 수는 render()가 inflight로 제한하므로 큐 자체는 크기 제한 없음
+        # (디스패처가 꺼내 가기 전에 요청이 몰려도 쉬는 워커 몫까지 503이 나지 않게)
+        self.queue = asyncio.Queue()
+        self.pool = None
+        # 스펙/캐시 파일 I/O 전용 스레드 (DeckCache와 스펙 캐시는 한 스레드에서만 씀)
+        self.io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deck-io")
+        # 스펙 해시 -> 렌더링 결과 Future (대기 중 + 렌더링 중)
+        self.inflight = {}
+        self.stats = {"requests": 0, "rendered": 0, "coalesced": 0, "rejected": 0, "failed": 0,
+                      "pool_restarts": 0}
+        self._dispatchers = []
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+
+    async def _io(self, func, *args):
+        """func(*args)를 I/O 스레드에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self.io_pool, func, *args)
+
+    async def start(self):
+        """워커 프로세스를 모두 띄우고 데운 뒤 디스패처 시작"""
+        loop = asyncio.get_running_loop()
+        self.pool = self._new_pool()
+        # 워커 수만큼 작업을 동시에 넣어 프로세스를 모두 미리 띄움
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _ready) for _ in range(self.workers)))
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def close(self):
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        self.io_pool.shutdown()
+
+    def _restart_pool(self, broken):
+        """죽은 워커 풀을 새 풀로 바꿈 (같은 풀에서 실패한 디스패처끼리는 한 번만)"""
+        if self.pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = self._new_pool()
+            self.stats["pool_restarts"] += 1
+            print("렌더링 워커가 비정상 종료되어 워커 풀을 다시 시작합니다", file=sys.stderr)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            digest, key, spec, future = await self.queue.get()
+            pool = self.pool
+            try:
+                data = await loop.run_in_executor(pool, render_deck_bytes, spec)
+                await self._io(self.cache.put, key, data)
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    self._restart_pool(pool)
+                self.stats["failed"] += 1
+                future.set_exception(e)
+            else:
+                self.stats["rendered"] += 1
+                future.set_result(data)
+            finally:
+                del self.inflight[digest]
+                self.queue.task_done()
+
+    def _lookup(self, spec):
+        """(스펙 해시, 캐시 키, 캐시된 덱 바이트 또는 None) — I/O 스레드에서 실행"""
+        compiled = deck_spec.load_spec(spec, color_names=deck_colors.PALETTE)
+        key = deck_cache.deck_key(compiled)
+        return compiled["digest"], key, self.cache.get(key)
+
+    async def render(self, spec):
+        """스펙의 덱 바이트 반환 (캐시에 있으면 바로, 같은 스펙이 렌더링 중이면 그 결과를 기다림)"""
+        self.stats["requests"] += 1
+        try:
+            digest, key, data = await self._io(self._lookup, spec)
+        except deck_spec.SpecError as e:
+            raise RequestError(400, f"스펙 오류: {e}")
+        if data is not None:
+            return data
+
+        future = self.inflight.get(digest)
+        if future is not None:
+            self.stats["coalesced"] += 1
+        else:
+            if len(self.inflight) >= self.workers + self.queue_size:
+                self.stats["rejected"] += 1
+                raise RequestError(503, "대기열이 가득 찼습니다")
+            future = asyncio.get_running_loop().create_future()
+            self.queue.put_nowait((digest, key, spec, future))
+            self.inflight[digest] = future
+        # 한 요청이 끊겨도 같은 결과를 기다리는 다른 요청에는 영향이 없게 함
+        return await asyncio.shield(future)
+
+    async def health(self):
+        cache = await self._io(self.cache.info)
+        return dict(self.stats, workers=self.workers, queued=self.queue.qsize(),
+                    queue_size=self.queue_size, inflight=len(self.inflight), cache=cache)
+
+
+async def _read_request(reader):
+    """요청 줄, 헤더, 본문 읽기"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise RequestError(413, "헤더가 너무 깁니다")
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise RequestError(400, "잘못된 요청 줄")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise RequestError(400, "잘못된 Content-Length")
+    if length > MAX_BODY:
+        raise RequestError(413, "요청 본문이 너무 큽니다")
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], body
+
+
+async def _send_json(writer, status, data):
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    writer.write((f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                  "Content-Type: application/json; charset=utf-8\r\n"
+                  f"Content-Length: {len(body)}\r\n"
+                  + ("Retry-After: 1\r\n" if status == 503 else "")
+                  + "Connection: close\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+async def _send_deck(writer, data):
+    """덱 바이트를 CHUNK_SIZE씩 나눠 씀 (느린 클라이언트는 drain에서 기다림)"""
+    writer.write((f"HTTP/1.1 200 OK\r\nContent-Type: {PPTX_TYPE}\r\n"
+                  'Content-Disposition: attachment; filename="iRUSH_Homepage_Concept.pptx"\r\n'
+                  f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n").encode("latin-1"))
+    view = memoryview(data)
+    for start in range(0, len(view), CHUNK_SIZE):
+        writer.write(view[start:start + CHUNK_SIZE])
+        await writer.drain()
+
+
+async def handle(service, reader, writer):
+    """연결 하나 (요청 하나) 처리"""
+    try:
+        method, path, body = await _read_request(reader)
+        if path == "/health":
+            if method != "GET":
+                raise RequestError(405, "GET만 지원합니다")
+            await _send_json(writer, 200, await service.health())
+        elif path == "/decks":
+            if method != "POST":
+                raise RequestError(405, "POST만 지원합니다")
+            await _send_deck(writer, await service.render(request_spec(body)))
+        else:
+            raise RequestError(404, f"없는 경로: {path}")
+    except RequestError as e:
+        await _send_json(writer, e.status, {"error": str(e)})
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    except Exception as e:
+        await _send_json(writer, 500, {"error": f"{type(e).__name__}: {e}"})
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, queue_size=DEFAULT_QUEUE_SIZE):
+    service = DeckService(workers, queue_size)
+    await service.start()
+    server = await asyncio.start_server(lambda r, w: handle(service, r, w), host, port)
+    print(f"덱 서비스 시작: http://{host}:{port} (워커 {service.workers}개, 대기열 {queue_size})", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱 생성 로컬 HTTP 서비스")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"바인드 주소 (기본 {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본 {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, help="렌더링 워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"워커가 모두 바쁠 때 기다릴 수 있는 요청 수, 넘치면 503 (기본 {DEFAULT_QUEUE_SIZE})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""도형 XML을 직접 만들어 한 번에 붙이는 배치 도형 레이어
+
+python-pptx로 사각형 하나를 그리면 add_shape -> fill.solid() -> fore_color.rgb ->
+line.fill.background()처럼 호출마다 lxml 트리를 훑는다. ShapeBatch는 같은 결과의
+<p:sp> XML을 문자열로 모았다가 flush()에서 한 번 파싱해 슬라이드에 붙인다.
+만들어지는 XML(도형 id, 이름, 속성 순서 포함)은 python-pptx 호출로 만든 것과 같다.
+
+배치 도중에 python-pptx로 도형을 직접 추가하려면 먼저 flush()를 호출해야 도형 순서와
+id가 어긋나지 않는다. 텍스트 상자에 name을 주면 "TextBox N" 대신 그 이름이 도형 이름이
+되어 deck_patch가 나중에 그 도형의 텍스트만 바꿀 수 있다.
+"""
+import re
+from xml.sax.saxutils import escape
+
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+# MSO_SHAPE -> (도형 이름, prstGeom 값)
+AUTOSHAPES = {
+    MSO_SHAPE.RECTANGLE: ("Rectangle", "rect"),
+    MSO_SHAPE.ROUNDED_RECTANGLE: ("Rounded Rectangle", "roundRect"),
+    MSO_SHAPE.OVAL: ("Oval", "ellipse"),
+}
+
+_AUTOSHAPE = (
+    '<p:cNvSpPr/><p:nvPr/></p:nvSpPr><p:spPr>'
+    '<a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="%s"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>%s</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+
+_TEXTBOX = (
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr><p:spPr>'
+    '<a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="%s"><a:spAutoFit/></a:bodyPr><a:lstStyle/><a:p>%s</a:p></p:txBody></p:sp>'
+)
+
+_CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+def _text_xml(text):
+    """python-pptx와 같게 제어 문자를 _xHHHH_로 바꾸고 XML 이스케이프"""
+    return escape(_CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), text))
+
+
+def _runs_xml(text, r_pr=""):
+    """줄바꿈(\\n, \\v)은 <a:br/>, 나머지는 <a:r> (빈 run은 만들지 않음)"""
+    parts = []
+    for i, chunk in enumerate(re.split("\n|\v", text)):
+        if i:
+            parts.append("<a:br/>")
+        if chunk:
+            parts.append("<a:r>%s<a:t>%s</a:t></a:r>" % (r_pr, _text_xml(chunk)))
+    return "".join(parts)
+
+
+class ShapeBatch:
+    """슬라이드에 붙일 도형 XML을 모았다가 flush()에서 한 번에 추가"""
+
+    def __init__(self, slide):
+        self._sp_tree = slide.shapes._spTree
+        # (도형 이름, 이름 뒤에 번호를 붙일지, cNvPr 뒤의 XML)
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+    def shape(self, autoshape, left, top, width, height, fill, line=None, line_width=None):
+        """단색 채우기 도형 — line이 없으면 테두리 없음, 있으면 line_width(Length) 두께의 단색 테두리
+
+        색상은 RRGGBB 문자열 (Theme.color) 또는 RGBColor.
+        """
+        name, prst = AUTOSHAPES[autoshape]
+        if line is None:
+            ln = "<a:ln><a:noFill/></a:ln>"
+        else:
+            ln = '<a:ln w="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:ln>' % (line_width, line)
+        self._pending.append((name, True, _AUTOSHAPE % (left, top, width, height, prst, fill, ln)))
+
+    def rect(self, left, top, width, height, fill, line=None, line_width=None):
+        self.shape(MSO_SHAPE.RECTANGLE, left, top, width, height, fill, line, line_width)
+
+    def rounded_rect(self, left, top, width, height, fill, line=None, line_width=None):
+        self.shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height, fill, line, line_width)
+
+    def oval(self, left, top, width, height, fill, line=None, line_width=None):
+        self.shape(MSO_SHAPE.OVAL, left, top, width, height, fill, line, line_width)
+
+    def _add_textbox(self, left, top, width, height, body, wrap, name):
+        xml = _TEXTBOX % (left, top, width, height, "square" if wrap else "none", body)
+        self._pending.append(("TextBox", True, xml) if name is None else (escape(name, {'"': "&quot;"}), False, xml))
+
+    def textbox(self, left, top, width, height, text, style, wrap=False, name=None):
+        """문단 하나짜리 텍스트 상자 — style은 deck_theme.TextStyle (글꼴은 문단 기본값으로 지정)"""
+        self._add_textbox(left, top, width, height, style.p_pr + _runs_xml(text), wrap, name)
+
+    def rich_textbox(self, left, top, width, height, runs, wrap=False, name=None):
+        """run마다 글꼴이 다른 한 문단 텍스트 상자 — runs는 (text, TextStyle) 목록"""
+        body = "".join(_runs_xml(text, style.r_pr) for text, style in runs)
+        self._add_textbox(left, top, width, height, body, wrap, name)
+
+    def flush(self):
+        """모은 도형을 한 번에 파싱해 슬라이드 도형 트리 끝에 추가"""
+        if not self._pending:
+            return
+        shape_id = self._sp_tree.max_shape_id
+        xml = []
+        for name, numbered, body in self._pending:
+            shape_id += 1
+            if numbered:
+                name = "%s %d" % (name, shape_id - 1)
+            xml.append('<p:sp><p:nvSpPr><p:cNvPr id="%d" name="%s"/>%s' % (shape_id, name, body))
+        self._pending = []
+
+        group = parse_xml("<p:spTree %s>%s</p:spTree>" % (nsdecls("p", "a"), "".join(xml)))
+        ext_lst = self._sp_tree.find(qn("p:extLst"))
+        if ext_lst is None:
+            self._sp_tree.extend(list(group))
+        else:
+            for sp in list(group):
+                ext_lst.addprevious(sp)
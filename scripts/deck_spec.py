@@ -0,0 +1,274 @@
+"""덱 스펙(JSON/YAML) 로드, 검증, 컴파일 캐시
+
+스펙 파일은 덱 공통 값(client, year 등)과 slides 목록으로 이루어진다.
+슬라이드 문자열 안의 {client}, {year} 같은 자리표시자는 덱 공통 값으로 치환된다.
+검증과 치환을 마친 스펙은 내용 해시로 캐시되므로 같은 스펙을 다시 렌더링할 때는
+파싱과 검증을 건너뛴다.
+"""
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+DEFAULT_SPEC_FILE = os.path.join(SPEC_DIR, "irush_concept.json")
+
+# 테마 폴더와 기본 테마 (스펙의 theme 값)
+THEME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes")
+DEFAULT_THEME = "irush_dark"
+
+# 컴파일된 스펙 캐시 최대 개수
+CACHE_SIZE = 256
+
+
+class SpecError(ValueError):
+    """스펙 형식 오류"""
+
+
+# 색상 필드 표시 (색상 이름 또는 #RRGGBB)
+COLOR = "color"
+# 파일 경로 필드 표시 (스펙 파일 기준 상대 경로는 절대 경로로 바뀜)
+PATH = "path"
+
+# 슬라이드 타입별 스키마. 리스트는 [항목 스키마], dict는 필수 필드, 튜플은 허용하는 문자열 값
+SLIDE_SCHEMAS = {
+    "cover": {"title": str, "subtitle": str, "description": str, "year": str},
+    "overview": {
+        "number": str, "color": COLOR, "title": str,
+        "info_items": [{"label": str, "value": str}],
+        "objective_title": str, "objective": str,
+        "message_title": str, "message": str,
+    },
+    "values": {
+        "number": str, "color": COLOR, "title": str,
+        "values": [{"title": str, "subtitle": str, "description": str, "color": COLOR}],
+    },
+    "stats": {
+        "number": str, "color": COLOR, "title": str, "background_text": str,
+        "stats": [{"value": str, "suffix": str, "label": str, "description": str, "color": COLOR}],
+    },
+    "tech": {
+        "number": str, "color": COLOR, "title": str,
+        "tech_items": [{"category": str, "color": COLOR, "items": [{"name": str, "description": str}]}],
+    },
+    "design": {
+        "number": str, "color": COLOR, "title": str,
+        "palette_title": str, "palette": [{"color": COLOR, "name": str, "hex": str}],
+        "fonts_title": str, "fonts": [{"name": str, "role": str, "description": str}],
+        "styles_title": str, "styles": [str],
+    },
+    "structure": {
+        "number": str, "color": COLOR, "title": str,
+        "pages": [{"name": str, "title": str, "features": [str], "color": COLOR}],
+    },
+    "features": {
+        "number": str, "color": COLOR, "title": str,
+        "features": [{"title": str, "subtitle": str, "description": str, "color": COLOR}],
+    },
+    "clients": {
+        "number": str, "color": COLOR, "title": str,
+        "clients": [{"category": str, "names": [str], "color": COLOR}],
+    },
+    "portfolio": {
+        "number": str, "color": COLOR, "title": str, "image": PATH,
+        "project": str, "subtitle": str, "client": str, "year": str, "description": str,
+    },
+    "trends": {
+        "number": str, "color": COLOR, "title": str,
+        "source": PATH, "per_slide": int, "summary_length": int,
+    },
+    "chart": {
+        "number": str, "color": COLOR, "title": str, "source": PATH,
+        "chart": ("bar", "line", "donut"), "group_by": ("source", "category", "date"), "limit": int,
+    },
+    "ending": {"title": str, "company": str, "contact": str, "values_line": str},
+}
+
+_HEX_COLOR = re.compile(r"^#[0-9A-Fa-f]{6}$")
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+_COMPILED = OrderedDict()
+
+
+def read_spec_file(path):
+    """스펙 파일 원본 바이트 읽기"""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as e:
+        raise SpecError(f"스펙 파일을 읽을 수 없습니다: {path} ({e})")
+
+
+def parse_spec(raw, path):
+    """스펙 바이트를 dict로 파싱 (.yaml/.yml은 PyYAML 필요)"""
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError("YAML 스펙을 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)")
+        try:
+            spec = yaml.safe_load(raw)
+        except yaml.YAMLError as e:
+            raise SpecError(f"{path}: YAML 파싱 실패 ({e})")
+    else:
+        try:
+            spec = json.loads(raw)
+        except ValueError as e:
+            raise SpecError(f"{path}: JSON 파싱 실패 ({e})")
+    if not isinstance(spec, dict):
+        raise SpecError(f"{path}: 최상위 값은 객체여야 합니다")
+    return spec
+
+
+def _check(value, schema, where, color_names):
+    """값이 스키마를 따르는지 재귀 검사"""
+    if schema is COLOR:
+        if not isinstance(value, str) or not (value in color_names or _HEX_COLOR.match(value)):
+            raise SpecError(f"{where}: 알 수 없는 색상 {value!r}")
+    elif schema is PATH:
+        if not isinstance(value, str) or not value:
+            raise SpecError(f"{where}: 파일 경로 문자열이어야 합니다")
+    elif isinstance(schema, tuple):
+        if value not in schema:
+            raise SpecError(f"{where}: {', '.join(schema)} 중 하나여야 합니다 ({value!r})")
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            raise SpecError(f"{where}: 리스트여야 합니다")
+        for i, item in enumerate(value):
+            _check(item, schema[0], f"{where}[{i}]", color_names)
+    elif isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise SpecError(f"{where}: 객체여야 합니다")
+        for key, sub_schema in schema.items():
+            if key not in value:
+                raise SpecError(f"{where}: 필드 '{key}'가 없습니다")
+            _check(value[key], sub_schema, f"{where}.{key}", color_names)
+    elif not isinstance(value, schema) or isinstance(value, bool):
+        raise SpecError(f"{where}: {schema.__name__} 타입이어야 합니다")
+
+
+def validate_spec(spec, color_names=()):
+    """스펙 전체 검증 (문제가 있으면 SpecError)"""
+    if not isinstance(spec.get("theme", DEFAULT_THEME), str):
+        raise SpecError("theme: 테마 이름 또는 경로 문자열이어야 합니다")
+    slides = spec.get("slides")
+    if not isinstance(slides, list) or not slides:
+        raise SpecError("slides: 비어 있지 않은 리스트여야 합니다")
+    for i, slide in enumerate(slides):
+        where = f"slides[{i}]"
+        if not isinstance(slide, dict) or slide.get("type") not in SLIDE_SCHEMAS:
+            kind = slide.get("type") if isinstance(slide, dict) else slide
+            raise SpecError(f"{where}: 알 수 없는 슬라이드 타입 {kind!r}")
+        _check(slide, SLIDE_SCHEMAS[slide["type"]], f"{where}({slide['type']})", color_names)
+
+
+def substitute(value, variables):
+    """문자열 안의 {이름} 자리표시자를 덱 공통 값으로 치환"""
+    if isinstance(value, str):
+        return _PLACEHOLDER.sub(lambda m: variables.get(m.group(1), m.group(0)), value)
+    if isinstance(value, list):
+        return [substitute(item, variables) for item in value]
+    if isinstance(value, dict):
+        return {key: substitute(item, variables) for key, item in value.items()}
+    return value
+
+
+def spec_variables(spec):
+    """{이름} 자리표시자에 쓰는 덱 공통 값 (스펙 최상위의 문자열/숫자 값)"""
+    return {key: str(value) for key, value in spec.items()
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool)}
+
+
+def _resolve_paths(value, schema, base_dir):
+    """스키마의 PATH 필드를 base_dir 기준 절대 경로로 변환"""
+    if schema is PATH:
+        return os.path.normpath(os.path.join(base_dir, value))
+    if isinstance(schema, list):
+        return [_resolve_paths(item, schema[0], base_dir) for item in value]
+    if isinstance(schema, dict):
+        resolved = dict(value)
+        for key, sub_schema in schema.items():
+            resolved[key] = _resolve_paths(value[key], sub_schema, base_dir)
+        return resolved
+    return value
+
+
+def _iter_paths(value, schema):
+    if schema is PATH:
+        yield value
+    elif isinstance(schema, list):
+        for item in value:
+            yield from _iter_paths(item, schema[0])
+    elif isinstance(schema, dict):
+        for key, sub_schema in schema.items():
+            yield from _iter_paths(value[key], sub_schema)
+
+
+def slide_paths(slide):
+    """컴파일된 슬라이드 스펙이 참조하는 파일 경로 목록 (테마 파일 포함)"""
+    paths = list(_iter_paths(slide, SLIDE_SCHEMAS[slide["type"]]))
+    if "theme" in slide:
+        paths.append(slide["theme"])
+    return paths
+
+
+def theme_path(value, base_dir="."):
+    """테마 이름(themes/<이름>.json) 또는 스펙 파일 기준 경로를 테마 파일 절대 경로로 변환"""
+    if value.endswith(".json") or "/" in value or os.sep in value:
+        path = os.path.normpath(os.path.join(base_dir, value))
+    else:
+        path = os.path.join(THEME_DIR, value + ".json")
+    if not os.path.isfile(path):
+        raise SpecError(f"theme: 테마 파일이 없습니다: {path}")
+    return path
+
+
+def compile_spec(spec, color_names=(), base_dir="."):
+    """스펙을 검증하고 자리표시자 치환, 경로 해석을 마친 새 스펙 반환
+
+    컴파일된 슬라이드 스펙마다 테마 파일 경로(theme)가 들어간다.
+    """
+    validate_spec(spec, color_names)
+    variables = spec_variables(spec)
+    theme = theme_path(spec.get("theme", DEFAULT_THEME), base_dir)
+    compiled = dict(spec)
+    compiled["slides"] = [
+        dict(_resolve_paths(slide, SLIDE_SCHEMAS[slide["type"]], base_dir), theme=theme)
+        for slide in substitute(spec["slides"], variables)
+    ]
+    return compiled
+
+
+def load_spec(overrides=None, color_names=()):
+    """기본 스펙 파일에 덮어쓰기 값을 적용해 컴파일된 스펙 반환
+
+    overrides의 최상위 값이 스펙 파일의 같은 키를 대체한다. spec_file 키로
+    다른 스펙 파일을 지정할 수 있다. 결과는 파일 내용과 덮어쓰기 값의 해시로
+    캐시되며 digest 키에 해시가 들어 있다. 반환된 스펙은 캐시와 공유되므로
+    수정하지 않는다.
+    """
+    overrides = dict(overrides or {})
+    path = overrides.pop("spec_file", DEFAULT_SPEC_FILE)
+    raw = read_spec_file(path)
+
+    h = hashlib.sha256(raw)
+    h.update(os.path.abspath(path).encode("utf-8"))
+    h.update(json.dumps(overrides, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    h.update("\0".join(sorted(color_names)).encode("utf-8"))
+    digest = h.hexdigest()
+
+    compiled = _COMPILED.get(digest)
+    if compiled is not None:
+        _COMPILED.move_to_end(digest)
+        return compiled
+
+    spec = parse_spec(raw, path)
+    spec.update(overrides)
+    compiled = compile_spec(spec, color_names, os.path.dirname(os.path.abspath(path)))
+    compiled["digest"] = digest
+
+    _COMPILED[digest] = compiled
+    if len(_COMPILED) > CACHE_SIZE:
+        _COMPILED.popitem(last=False)
+    return compiled
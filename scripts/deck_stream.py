@@ -0,0 +1,178 @@
+"""슬라이드를 만드는 즉시 ZIP 항목으로 흘려보내는 스트리밍 PPTX 저장
+
+prs.save()는 모든 슬라이드를 메모리에 만든 뒤에 패키지를 쓴다. 여기서는 슬라이드 스펙
+하나를 렌더링할 때마다 그 슬라이드(와 처음 참조된 이미지 등 관련 파트)를 곧바로 ZIP에
+쓰고 프레젠테이션에서 떼어 낸다. 프레젠테이션 본문, 템플릿 파트, [Content_Types].xml은
+마지막에 기록한다. 출력은 seek이 안 되는 스트림(소켓, 표준 출력)도 된다.
+ZIP 항목 시각과 문서 속성 날짜는 deck_reproducible과 같이 고정하므로 같은 스펙이면
+같은 바이트가 나온다 (항목 순서는 기록 순서).
+여러 장을 만드는 슬라이드 함수(트렌드 등)도 새 슬라이드를 추가하기 전에 앞 슬라이드를 내보내므로
+최대 메모리는 덱 전체가 아니라 슬라이드 한 장 분량에 가깝다.
+
+사용 예:
+    python scripts/deck_stream.py --output deck.pptx
+    python scripts/deck_stream.py --output - > deck.pptx
+"""
+import argparse
+import re
+import sys
+import types
+import weakref
+import zipfile
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import _ContentTypesItem
+
+import create_ppt
+import deck_reproducible
+
+_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_PARTNAME = re.compile(r"^(.*?)(\d*)(\.\w+)$")
+
+
+class StreamingPackageWriter:
+    """프레젠테이션에서 떼어 낸 슬라이드를 순서대로 ZIP에 기록하는 writer"""
+
+    def __init__(self, file, prs):
+        self._zip = zipfile.ZipFile(file, "w")
+        self._timestamp = deck_reproducible.source_date_epoch()
+        self._prs = prs
+        package = prs.part.package
+        # 시작 시점의 파트(마스터, 레이아웃, 테마 등)는 마지막에 원래 이름으로 기록
+        self._template = {id(part) for part in package.iter_parts()}
+        self._used_names = {str(part.partname) for part in package.iter_parts()}
+        # 이미 기록한 슬라이드 외 파트 (이미지 등) -> 출력 파트 이름
+        self._written = weakref.WeakKeyDictionary()
+        self._content_types = {}
+        self._counters = {}
+        self._slide_partnames = []
+
+    @property
+    def slide_count(self):
+        return len(self._slide_partnames)
+
+    def _write(self, name, blob):
+        name = name.lstrip("/")
+        if name == deck_reproducible.CORE_PART and self._timestamp is not None:
+            blob = deck_reproducible.normalize_core_xml(blob, self._timestamp)
+        self._zip.writestr(deck_reproducible.zip_info(name, self._timestamp), blob)
+
+    def _unique_partname(self, partname):
+        """다른 출력 파트와 겹치지 않는 파트 이름 (image1.jpg, image2.jpg ...)"""
+        base, _, ext = _PARTNAME.match(str(partname)).groups()
+        number = self._counters.get((base, ext), 0)
+        while True:
+            number += 1
+            name = f"{base}{number}{ext}"
+            if name not in self._used_names:
+                self._counters[(base, ext)] = number
+                self._used_names.add(name)
+                return PackURI(name)
+
+    def _write_part(self, part):
+        """파트와 그 관계 파일을 기록하고, 처음 보는 관련 파트도 함께 기록"""
+        for rel in part.rels.values():
+            if rel.is_external:
+                continue
+            target = rel.target_part
+            if id(target) in self._template or target in self._written:
+                continue
+            target.partname = self._unique_partname(target.partname)
+            self._written[target] = str(target.partname)
+            self._write_part(target)
+
+        self._write(str(part.partname), part.blob)
+        self._content_types[str(part.partname)] = part.content_type
+        if len(part.rels):
+            self._write(part.partname.rels_uri, part.rels.xml)
+
+    def write_slide(self, slide):
+        """슬라이드를 다음 번호로 기록하고 프레젠테이션에서 떼어 냄"""
+        part = slide.part
+        part.partname = PackURI(f"/ppt/slides/slide{len(self._slide_partnames) + 1}.xml")
+        self._used_names.add(str(part.partname))
+        self._write_part(part)
+        self._slide_partnames.append(str(part.partname))
+
+        sld_id_lst = self._prs.slides._sldIdLst
+        for sld_id in sld_id_lst.sldId_lst:
+            if self._prs.part.related_part(sld_id.rId) is part:
+                sld_id_lst.remove(sld_id)
+                self._prs.part.drop_rel(sld_id.rId)
+                break
+
+    def flush(self):
+        """프레젠테이션에 남아 있는 (완성된) 슬라이드를 모두 기록"""
+        for slide in list(self._prs.slides):
+            self.write_slide(slide)
+
+    def close(self):
+        """프레젠테이션 본문, 템플릿 파트, [Content_Types].xml을 기록하고 ZIP을 닫음"""
+        self.flush()
+        prs_part = self._prs.part
+        package = prs_part.package
+
+        # 기록한 슬라이드를 프레젠테이션 본문과 관계 파일에 연결
+        rels = etree.fromstring(prs_part.rels.xml)
+        next_rid = 1 + max([int(rid[3:]) for rid in prs_part.rels if rid[3:].isdigit()] + [0])
+        sld_id_lst = self._prs.slides._sldIdLst
+        for i, partname in enumerate(self._slide_partnames):
+            rid = f"rId{next_rid + i}"
+            sld_id_lst.add_sldId(rid)
+            etree.SubElement(rels, f"{{{_RELS_NS}}}Relationship", Id=rid, Type=RT.SLIDE,
+                             Target=PackURI(partname).relative_ref(prs_part.partname.baseURI))
+
+        for part in package.iter_parts():
+            self._content_types[str(part.partname)] = part.content_type
+            self._write(str(part.partname), part.blob)
+            if part is prs_part:
+                self._write(part.partname.rels_uri, etree.tostring(rels, encoding="UTF-8", standalone=True))
+            elif len(part.rels):
+                self._write(part.partname.rels_uri, part.rels.xml)
+
+        self._write("/_rels/.rels", package._rels.xml)
+        parts = [types.SimpleNamespace(partname=PackURI(name), content_type=content_type)
+                 for name, content_type in self._content_types.items()]
+        self._write("/[Content_Types].xml", serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.close()
+
+
+def stream_deck(spec, file):
+    """스펙의 슬라이드를 하나씩 렌더링하며 file(경로 또는 쓰기 스트림)에 바로 기록"""
+    compiled = create_ppt.load_deck_spec(spec)
+    prs = create_ppt.new_presentation()
+    writer = StreamingPackageWriter(file, prs)
+    # 여러 장을 만드는 슬라이드 함수도 새 슬라이드를 추가하기 전에 이전 슬라이드를 내보냄
+    prs.before_add_slide = writer.flush
+    for slide_spec in compiled["slides"]:
+        create_ppt.SLIDE_RENDERERS[slide_spec["type"]](prs, slide_spec)
+    writer.close()
+    return writer.slide_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="슬라이드 단위로 흘려 쓰는 PPTX 저장")
+    parser.add_argument("--spec-file", help="덱 스펙 파일 (기본: specs/irush_concept.json)")
+    parser.add_argument("--client", help="클라이언트 이름 덮어쓰기")
+    parser.add_argument("--output", default=create_ppt.DEFAULT_OUTPUT, help="저장 경로 (- 이면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    spec = {}
+    if args.spec_file:
+        spec["spec_file"] = args.spec_file
+    if args.client:
+        spec["client"] = args.client
+
+    if args.output == "-":
+        stream_deck(spec, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    else:
+        count = stream_deck(spec, args.output)
+        print(f"PPT 생성 완료: {args.output} (슬라이드 {count}장)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
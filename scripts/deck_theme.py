@@ -0,0 +1,147 @@
+"""덱 테마 (색상 팔레트 + 이름 있는 텍스트 스타일)
+
+테마 파일(themes/<이름>.json)은 deck_colors 팔레트 중 바꿀 색상과 title, heading,
+label, body, caption 같은 텍스트 스타일을 정의한다. 스타일은 처음 쓰일 때 한 번만
+문단 속성(<a:pPr>)과 run 속성(<a:rPr>) XML로 컴파일되고, 도형 배치(deck_shapes)는
+컴파일된 XML을 그대로 붙인다. 크기/색상만 바꾼 변형(style("label", color=...))도
+변형별로 한 번만 컴파일된다.
+
+덱 스펙의 theme 값(테마 이름 또는 JSON 경로, deck_spec.theme_path 참고)으로 덱마다
+테마를 고를 수 있다. 같은 프로세스에서 테마가 다른 덱을 번갈아 만들어도 된다.
+"""
+import json
+import os
+import re
+
+import deck_colors
+from deck_spec import SpecError
+
+# 스타일 정렬 값 -> a:pPr algn 값
+ALIGN = {"left": "l", "center": "ctr", "right": "r", "justify": "just"}
+
+STYLE_FIELDS = ("size", "color", "bold", "italic", "align", "line_spacing")
+
+# 테마 파일 경로 -> (수정 시각, Theme)
+_THEMES = {}
+
+# #RRGGBB 또는 RRGGBB
+_HEX_COLOR = re.compile(r"#?([0-9A-Fa-f]{6})")
+
+
+def _hex(value):
+    """(R, G, B)를 RRGGBB 문자열로"""
+    return "%02X%02X%02X" % tuple(value)
+
+
+class TextStyle:
+    """컴파일된 텍스트 스타일
+
+    p_pr는 문단 하나짜리 텍스트 상자의 <a:pPr> (글꼴은 문단 기본값 defRPr),
+    r_pr는 run마다 글꼴이 다른 문단에 쓰는 <a:rPr> XML이다.
+    """
+
+    __slots__ = STYLE_FIELDS + ("p_pr", "r_pr")
+
+    def __init__(self, size=None, color=None, bold=None, italic=None, align=None, line_spacing=None):
+        self.size = size
+        self.color = color
+        self.bold = bold
+        self.italic = italic
+        self.align = align
+        self.line_spacing = line_spacing
+        self.r_pr = self._font_xml("rPr")
+
+        p_pr = ""
+        if line_spacing is not None:
+            p_pr += '<a:lnSpc><a:spcPct val="%d"/></a:lnSpc>' % round(line_spacing * 100000)
+        if (size, color, bold, italic) != (None, None, None, None):
+            p_pr += self._font_xml("defRPr")
+        algn = ' algn="%s"' % ALIGN[align] if align is not None else ""
+        if p_pr:
+            self.p_pr = "<a:pPr%s>%s</a:pPr>" % (algn, p_pr)
+        else:
+            self.p_pr = "<a:pPr%s/>" % algn if algn else ""
+
+    def _font_xml(self, tag):
+        """글꼴 속성 XML — 속성은 sz, b, i 순서 (python-pptx로 설정한 결과와 같음)"""
+        attrs = ""
+        if self.size is not None:
+            # Pt(size).centipoints와 같은 계산
+            attrs += ' sz="%d"' % (int(self.size * 12700) // 127)
+        if self.bold is not None:
+            attrs += ' b="%d"' % bool(self.bold)
+        if self.italic is not None:
+            attrs += ' i="%d"' % bool(self.italic)
+        if self.color is None:
+            return "<a:%s%s/>" % (tag, attrs)
+        return '<a:%s%s><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:%s>' % (tag, attrs, self.color, tag)
+
+
+class Theme:
+    """색상 팔레트와 이름 있는 텍스트 스타일"""
+
+    def __init__(self, name, colors=None, styles=None):
+        self.name = name
+        self.colors = {key: _hex(rgb) for key, rgb in deck_colors.PALETTE.items()}
+        for key, value in (colors or {}).items():
+            if key not in self.colors:
+                raise SpecError(f"테마 {name}: 알 수 없는 색상 이름 {key!r}")
+            try:
+                self.colors[key] = self.color(value)
+            except SpecError:
+                raise SpecError(f"테마 {name}: 색상 {key}의 값은 색상 이름 또는 #RRGGBB 문자열이어야 합니다 ({value!r})") from None
+        self._styles = {}
+        for key, fields in (styles or {}).items():
+            unknown = set(fields) - set(STYLE_FIELDS)
+            if unknown:
+                raise SpecError(f"테마 {name}: 스타일 {key}에 알 수 없는 속성 {sorted(unknown)}")
+            if fields.get("align") is not None and fields["align"] not in ALIGN:
+                raise SpecError(f"테마 {name}: 스타일 {key}의 정렬 값 {fields['align']!r}")
+            self._styles[key] = dict(fields)
+        # (스타일 이름, 덮어쓴 속성) -> TextStyle
+        self._compiled = {}
+
+    def color(self, value):
+        """색상 이름, #RRGGBB 또는 RRGGBB를 RRGGBB 문자열로"""
+        if isinstance(value, str):
+            if value in self.colors:
+                return self.colors[value]
+            match = _HEX_COLOR.fullmatch(value)
+            if match:
+                return match.group(1).upper()
+        raise SpecError(f"테마 {self.name}: 알 수 없는 색상 {value!r}")
+
+    def style(self, name, **overrides):
+        """이름 있는 스타일 (속성을 덮어쓴 변형 포함)을 컴파일해 반환"""
+        key = (name, tuple(sorted(overrides.items())))
+        style = self._compiled.get(key)
+        if style is None:
+            try:
+                fields = dict(self._styles[name])
+            except KeyError:
+                raise SpecError(f"테마 {self.name}: 스타일 {name!r}가 없습니다")
+            fields.update(overrides)
+            if fields.get("color") is not None:
+                fields["color"] = self.color(fields["color"])
+            style = self._compiled[key] = TextStyle(**fields)
+        return style
+
+
+def load_theme(path):
+    """테마 파일을 읽어 Theme 반환 (파일이 바뀌지 않았으면 캐시 사용)"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError as e:
+        raise SpecError(f"테마 파일을 읽을 수 없습니다: {path} ({e})")
+    cached = _THEMES.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise SpecError(f"{path}: JSON 파싱 실패 ({e})")
+    name = data.get("name") or os.path.splitext(os.path.basename(path))[0]
+    theme = Theme(name, data.get("colors"), data.get("styles"))
+    _THEMES[path] = (mtime, theme)
+    return theme
@@ -0,0 +1,107 @@
+"""trends.json 기사 집계 (python-pptx 없이)
+
+트렌드 아카이브의 기사를 출처(source), 분류(category), 날짜(date)별로 세어 차트 슬라이드
+(create_ppt.create_chart_slide, deck_charts)에 넘길 (항목 목록, 값 목록)을 만든다. 기사는
+deck_trends로 한 번만 훑어 세 필드의 열(column)만 남기고, 집계는 NumPy가 있으면 열 배열
+전체를 한 번에(numpy.unique, numpy.argsort) 계산한다. NumPy가 없으면 collections.Counter로
+같은 결과를 낸다. 열은 파일 수정 시각으로 캐시되므로 같은 아카이브로 차트를 여러 장 만들어도
+파일은 한 번만 읽는다.
+
+python-pptx를 임포트하지 않으므로 deck.py list처럼 렌더링하지 않는 명령도 빠르게 쓸 수 있다.
+NumPy도 처음 집계할 때 임포트한다.
+"""
+import datetime
+import os
+from collections import Counter
+
+import deck_trends
+
+# 집계할 수 있는 기사 필드 (deck_spec의 group_by 값)
+GROUP_FIELDS = ("source", "category", "date")
+
+# 크롤러가 쓰는 날짜 형식 (2026.02.07)
+DATE_FORMAT = "%Y.%m.%d"
+
+# limit을 넘는 출처/분류를 합친 항목 이름
+OTHERS = "Others"
+
+# False면 NumPy가 있어도 Counter로 집계
+USE_NUMPY = True
+
+_numpy_module = False
+
+# 파일 경로 -> ((수정 시각, 크기, NumPy 사용 여부), {필드: 열})
+_COLUMNS = {}
+
+
+def _numpy():
+    """NumPy 모듈 (없거나 USE_NUMPY가 False면 None)"""
+    global _numpy_module
+    if not USE_NUMPY:
+        return None
+    if _numpy_module is False:
+        try:
+            import numpy
+        except ImportError:  # NumPy 없이도 동작 (Counter로 집계)
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def trend_columns(path):
+    """기사 필드별 값 열 {필드: 배열 또는 리스트} (없는 값은 빈 문자열, 파일이 바뀌지 않았으면 캐시 사용)"""
+    numpy = _numpy()
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size, numpy is not None)
+    cached = _COLUMNS.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    columns = {field: [] for field in GROUP_FIELDS}
+    appends = [(field, columns[field].append) for field in GROUP_FIELDS]
+    for article in deck_trends.iter_trends(path):
+        for field, append in appends:
+            append(str(article.get(field) or ""))
+    if numpy is not None:
+        columns = {field: numpy.array(values, dtype=str) for field, values in columns.items()}
+    _COLUMNS[path] = (stamp, columns)
+    return columns
+
+
+def _counts(column):
+    """빈 값을 뺀 [(값, 기사 수)] — 많은 순, 같으면 값 순"""
+    numpy = _numpy()
+    if numpy is not None:
+        names, counts = numpy.unique(column[column != ""], return_counts=True)
+        order = numpy.argsort(-counts, kind="stable")
+        return list(zip(names[order].tolist(), counts[order].tolist()))
+    return sorted(Counter(value for value in column if value).items(), key=lambda item: (-item[1], item[0]))
+
+
+def _daily(counts):
+    """[(날짜 문자열, 기사 수)]를 첫 날부터 마지막 날까지 하루 단위로 (기사가 없는 날은 0)"""
+    by_day = {datetime.datetime.strptime(value, DATE_FORMAT).date(): count for value, count in counts}
+    if not by_day:
+        return []
+    day, last = min(by_day), max(by_day)
+    days = []
+    while day <= last:
+        days.append((day.strftime(DATE_FORMAT), by_day.get(day, 0)))
+        day += datetime.timedelta(days=1)
+    return days
+
+
+def count_by(path, field, limit=0):
+    """field 값별 기사 수 (항목 목록, 값 목록)
+
+    출처/분류는 많은 순이고 limit개를 넘으면 상위 limit - 1개와 나머지를 합친 OTHERS로 줄인다.
+    날짜는 날짜순으로 빈 날을 0으로 채우고 limit이 있으면 마지막 limit일만 남긴다.
+    """
+    counts = _counts(trend_columns(path)[field])
+    if field == "date":
+        counts = _daily(counts)
+        if limit > 0:
+            counts = counts[-limit:]
+    elif 0 < limit < len(counts):
+        rest = sum(count for _, count in counts[limit - 1:])
+        counts = counts[:limit - 1] + [(OTHERS, rest)]
+    return [name for name, _ in counts], [count for _, count in counts]
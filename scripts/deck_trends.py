@@ -0,0 +1,105 @@
+"""trends.json 스트리밍 읽기
+
+크롤러(scripts/crawl-news.js)가 만드는 src/data/trends.json의 trends 배열을
+파일 전체를 json.load 하지 않고 조금씩 읽으며 기사 하나씩 돌려준다.
+수천 건 이상의 아카이브도 기사 한 건 + 읽기 버퍼 크기의 메모리로 처리할 수 있다.
+"""
+import json
+import os
+
+TRENDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "data", "trends.json")
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Reader:
+    """파일을 청크 단위로 읽어 필요한 만큼만 버퍼에 유지하는 JSON 토큰 리더"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """소비한 앞부분을 버리고 다음 청크를 덧붙임 (더 읽을 게 없으면 False)"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON 형식 오류: '{char}' 위치에 {self.peek()!r}")
+        self.pos += 1
+
+    def value(self):
+        """다음 JSON 값 하나를 디코딩 (값이 버퍼 끝에 걸리면 더 읽고 재시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 숫자처럼 버퍼 끝에서 잘렸을 수 있는 값은 더 읽어서 확인
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(path, key, chunk_size=CHUNK_SIZE):
+    """최상위 객체의 key 배열 항목을 하나씩 반환 (다른 최상위 값은 건너뜀)"""
+    with open(path, encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                reader.expect("[")
+                if reader.peek() == "]":
+                    return
+                while True:
+                    yield reader.value()
+                    if reader.peek() == "]":
+                        return
+                    reader.expect(",")
+            reader.value()
+            if reader.peek() == "}":
+                return
+            reader.expect(",")
+
+
+def iter_trends(path=TRENDS_FILE, chunk_size=CHUNK_SIZE):
+    """trends.json의 기사 dict를 하나씩 반환"""
+    return iter_json_array(path, "trends", chunk_size)
+
+
+def truncate(text, limit):
+    """limit 글자를 넘으면 잘라서 말줄임표 추가"""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + "…"
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 스크립트는 패키지가 아니라 scripts/ 폴더에서 바로 임포트해 쓴다
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
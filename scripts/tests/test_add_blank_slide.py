@@ -0,0 +1,42 @@
+import pytest
+
+import create_ppt
+
+
+def _ids(prs):
+    return [int(sld_id.get("id")) for sld_id in prs.slides._sldIdLst]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_ids_unique_after_reorder(fast, monkeypatch):
+    monkeypatch.setattr(create_ppt, "FAST_ADD_SLIDE", fast)
+    prs = create_ppt.new_presentation()
+    for _ in range(3):
+        create_ppt.add_blank_slide(prs)
+    # 가장 큰 id(258)를 맨 앞으로 옮겨도 다음 id는 겹치지 않아야 함
+    sld_id_lst = prs.slides._sldIdLst
+    sld_id_lst.insert(0, sld_id_lst[-1])
+    assert _ids(prs) == [258, 256, 257]
+    create_ppt.add_blank_slide(prs)
+    create_ppt.add_blank_slide(prs)
+    assert _ids(prs) == [258, 256, 257, 259, 260]
+
+
+def test_ids_after_public_add_slide():
+    prs = create_ppt.new_presentation()
+    create_ppt.add_blank_slide(prs)
+    prs.slides.add_slide(prs.slide_layouts[6])
+    create_ppt.add_blank_slide(prs)
+    assert len(set(_ids(prs))) == 3
+
+
+def test_stats_continuation_title():
+    spec = {"type": "stats", "number": "03", "title": "NUMBERS", "color": "ACCENT_YELLOW",
+            "background_text": "STATS",
+            "stats": [{"value": str(i), "suffix": "+", "label": f"label {i}", "description": "", "color": "ACCENT_CYAN"}
+                      for i in range(5)]}
+    prs = create_ppt.new_presentation()
+    create_ppt.create_stats_slide(prs, spec)
+    titles = [[shape.text_frame.text for shape in slide.shapes
+               if shape.has_text_frame and shape.text_frame.text.startswith("NUMBERS")] for slide in prs.slides]
+    assert titles == [["NUMBERS"], ["NUMBERS" + create_ppt.CONTINUED]]
@@ -0,0 +1,86 @@
+import glob
+import os
+import shutil
+
+import pytest
+
+import deck_cache
+import deck_incremental
+
+# 슬라이드 렌더링에 쓰이는 모듈 (하나라도 수정하면 캐시가 무효화되어야 함)
+EDITED_MODULES = ["create_ppt.py", "deck_layout.py", "deck_shapes.py", "deck_theme.py", "text_fit.py",
+                  "deck_charts.py", "deck_trends.py", "deck_trend_stats.py"]
+
+
+@pytest.fixture
+def scripts_copy(tmp_path, monkeypatch):
+    """scripts/*.py 사본을 빌더 버전 계산 대상으로 (사본을 고쳐 모듈 수정을 흉내 냄)"""
+    copy_dir = tmp_path / "scripts"
+    copy_dir.mkdir()
+    for path in glob.glob(os.path.join(deck_cache.SCRIPTS_DIR, "*.py")):
+        shutil.copy(path, copy_dir)
+    monkeypatch.setattr(deck_cache, "SCRIPTS_DIR", str(copy_dir))
+    monkeypatch.setattr(deck_cache, "_builder_version", None)
+    return copy_dir
+
+
+def _edit(copy_dir, name):
+    with open(copy_dir / name, "a", encoding="utf-8") as f:
+        f.write("\n# edited\n")
+    deck_cache._builder_version = None
+
+
+def test_builder_modules_follow_imports():
+    modules = deck_cache.builder_modules()
+    for name in EDITED_MODULES + ["deck_colors.py", "deck_images.py", "deck_reproducible.py", "deck_spec.py"]:
+        assert name in modules
+    assert "deck_server.py" not in modules
+
+
+@pytest.mark.parametrize("name", EDITED_MODULES)
+def test_result_cache_invalidated_by_module_edit(scripts_copy, tmp_path, name):
+    cache = deck_cache.DeckCache(cache_dir=str(tmp_path / "decks"))
+    assert deck_cache.deck_bytes(None, cache)[1] is False
+    assert deck_cache.deck_bytes(None, cache)[1] is True
+
+    _edit(scripts_copy, name)
+    assert deck_cache.deck_bytes(None, cache)[1] is False
+
+
+@pytest.mark.parametrize("name", EDITED_MODULES)
+def test_incremental_cache_invalidated_by_module_edit(scripts_copy, tmp_path, name):
+    output = str(tmp_path / "deck.pptx")
+    cache_dir = str(tmp_path / "cache")
+    first = deck_incremental.rebuild_deck(None, output, cache_dir)
+    assert first["reused"] == 0
+    assert deck_incremental.rebuild_deck(None, output, cache_dir)["reused"] == first["slides"]
+
+    _edit(scripts_copy, name)
+    assert deck_incremental.rebuild_deck(None, output, cache_dir)["reused"] == 0
+
+
+def test_fragment_cache_does_not_pin_reloaded_themes(tmp_path, monkeypatch):
+    import collections
+    import gc
+    import json
+    import weakref
+
+    import create_ppt
+    import deck_theme
+
+    monkeypatch.setattr(create_ppt, "_FRAGMENT_CACHE", collections.OrderedDict())
+    monkeypatch.setattr(create_ppt, "FRAGMENT_CACHE_SIZE", 4)
+    path = tmp_path / "theme.json"
+    refs = []
+    for i in range(6):
+        # 색상이 바뀐 테마 파일을 다시 읽음 (수정 시각도 바뀜)
+        path.write_text(json.dumps({"name": "reloaded", "colors": {"DARK_BG": "#0000%02X" % i}}), encoding="utf-8")
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+        theme = deck_theme.load_theme(str(path))
+        create_ppt.add_simple_dark_bg(create_ppt.add_blank_slide(create_ppt.new_presentation()), theme)
+        refs.append(weakref.ref(theme))
+    del theme
+    gc.collect()
+    assert len(create_ppt._FRAGMENT_CACHE) == 4
+    # 마지막으로 읽은 테마(테마 캐시에 남음) 말고는 모두 해제됨
+    assert sum(ref() is not None for ref in refs) == 1
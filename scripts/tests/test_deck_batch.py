@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+import deck_batch
+
+
+def _names(specs):
+    return [os.path.basename(spec["output"]) for spec in specs]
+
+
+def test_clients_with_same_slug_get_distinct_files(tmp_path):
+    specs = deck_batch.client_specs(["A&B", "A B", "a_b", "LG전자", "LG전자"], str(tmp_path))
+    names = _names(specs)
+    # 같은 클라이언트는 한 번만, 슬러그가 겹치는 클라이언트는 이름 해시로 구분
+    assert [spec["client"] for spec in specs] == ["A&B", "A B", "a_b", "LG전자"]
+    assert len({name.casefold() for name in names}) == 4
+    assert names[3] == "iRUSH_Homepage_Concept_LG전자.pptx"
+    assert all(name.startswith("iRUSH_Homepage_Concept_") for name in names[:3])
+    # 다른 클라이언트와 함께 요청해도 파일 이름은 그대로
+    assert _names(deck_batch.client_specs(["A&B", "A B"], str(tmp_path)))[0] == names[0]
+
+
+def test_duplicate_outputs_are_rejected(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    with pytest.raises(ValueError, match="output"):
+        deck_batch.render_batch([{"client": "A", "output": output}, {"client": "B", "output": output}], workers=1)
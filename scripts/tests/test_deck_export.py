@@ -0,0 +1,24 @@
+import deck_export
+import text_fit
+
+# slide_model이 만드는 모양의 텍스트 명령 (한글 + 라틴)
+OPS = [["text", [0, 0, 100, 100], [0, 0, 0, 0], True, "t", [[["iRUSH 포트폴리오", "FFFFFF", 18, False]]]]]
+
+
+def test_warns_once_when_hangul_font_missing(monkeypatch, capsys):
+    monkeypatch.setattr(text_fit, "font_file", lambda name, bold=False: None)
+    monkeypatch.setattr(deck_export, "_warned_fonts", set())
+    assert deck_export.missing_fonts([OPS]) == {"Noto Sans KR": 5}
+    deck_export.warn_missing_fonts([OPS])
+    deck_export.warn_missing_fonts([OPS])
+    err = capsys.readouterr().err
+    assert err.count("경고: Noto Sans KR") == 1
+    # 라틴 문자는 Pillow 기본 폰트로 그릴 수 있으므로 Inter가 없어도 경고하지 않음
+    assert "Inter" not in err
+
+
+def test_no_warning_when_fonts_found(monkeypatch, capsys):
+    monkeypatch.setattr(text_fit, "font_file", lambda name, bold=False: f"/fonts/{name}.ttf")
+    monkeypatch.setattr(deck_export, "_warned_fonts", set())
+    deck_export.warn_missing_fonts([OPS])
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,38 @@
+import zipfile
+
+from lxml import etree
+
+import create_ppt
+import deck_locale
+
+_NS = deck_locale._NS
+
+
+def _stats_slide(tmp_path):
+    deck = tmp_path / "deck.pptx"
+    create_ppt.save_deck(create_ppt.build_deck(), str(deck))
+    with zipfile.ZipFile(deck) as zf:
+        for name in zf.namelist():
+            blob = zf.read(name)
+            if deck_locale._SLIDE_PART.match(name) and b'name="stats.0.value"' in blob:
+                return blob
+    raise AssertionError("통계 슬라이드가 없습니다")
+
+
+def _runs(blob, name):
+    root = etree.fromstring(blob)
+    for c_nv_pr in root.iterfind(".//p:sp/p:nvSpPr/p:cNvPr", _NS):
+        if c_nv_pr.get("name") == name:
+            sp = c_nv_pr.getparent().getparent()
+            return [r.findtext("a:t", "", _NS) for r in sp.iterfind("p:txBody/a:p/a:r", _NS)]
+    raise AssertionError(f"도형 {name}이 없습니다")
+
+
+def test_multi_run_shape_is_replaced_whole(tmp_path):
+    blob = _stats_slide(tmp_path)
+    # 통계 숫자와 suffix는 서식이 다른 두 run
+    assert _runs(blob, "stats.0.value") == ["24", "+"]
+
+    translated, changed = deck_locale.translate_slide_xml(blob, {"24+": "24 plus"}, "en-US")
+    assert changed == 1
+    assert _runs(translated, "stats.0.value") == ["24 plus"]
@@ -0,0 +1,75 @@
+import gc
+import zipfile
+
+import pytest
+from PIL import Image as PILImage
+from pptx import Presentation
+from pptx.util import Inches
+
+import deck_media
+
+
+@pytest.fixture
+def image_files(tmp_path):
+    """색이 다른 PNG 4개 (내용 해시가 모두 다름)"""
+    paths = []
+    for i, color in enumerate(["red", "green", "blue", "white"]):
+        path = tmp_path / f"image{i}.png"
+        PILImage.new("RGB", (40, 30), color).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def _add(registry, prs, path):
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return registry.add_picture(slide, path, Inches(1), Inches(1), Inches(2), Inches(1.5))
+
+
+def _media_count(path):
+    with zipfile.ZipFile(path) as z:
+        return sum(1 for name in z.namelist() if name.startswith("ppt/media/"))
+
+
+def test_same_content_shares_one_part(image_files, tmp_path):
+    registry = deck_media.MediaRegistry()
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(open(image_files[0], "rb").read())
+    prs = Presentation()
+    for path in (image_files[0], str(copy), image_files[0]):
+        _add(registry, prs, path)
+    assert registry.stats()["images"] == 1
+    prs.save(tmp_path / "out.pptx")
+    assert _media_count(tmp_path / "out.pptx") == 1
+    registry.close()
+
+
+def test_registry_is_bounded(image_files, tmp_path):
+    registry = deck_media.MediaRegistry(max_images=2)
+    prs = Presentation()
+    for path in image_files:
+        _add(registry, prs, path)
+    # 밀려난 이미지도 아직 이 덱이 참조하므로 열려 있고 저장할 수 있음
+    assert len(registry._images) == 2
+    prs.save(tmp_path / "out.pptx")
+    assert _media_count(tmp_path / "out.pptx") == 4
+
+    retired = list(registry._retired)
+    assert len(retired) == 2
+    del prs
+    gc.collect()
+    _add(registry, Presentation(), image_files[0])
+    # 덱이 사라진 뒤 다음 정리에서 mmap을 닫음
+    assert all(image.blob.closed for image in retired)
+    assert registry.stats()["images"] <= 3
+    registry.close()
+
+
+def test_public_api_fallback(image_files, tmp_path, monkeypatch):
+    monkeypatch.setattr(deck_media, "PRIVATE_API", False)
+    registry = deck_media.MediaRegistry()
+    prs = Presentation()
+    picture = _add(registry, prs, image_files[1])
+    assert picture.image.size == (40, 30)
+    assert registry.stats()["images"] == 0
+    prs.save(tmp_path / "out.pptx")
+    assert _media_count(tmp_path / "out.pptx") == 1
@@ -0,0 +1,125 @@
+import io
+import json
+import zipfile
+
+import pytest
+from lxml import etree
+
+import create_ppt
+import deck_colors
+import deck_patch
+import deck_spec
+
+_NS = deck_patch._NS
+
+
+@pytest.fixture(scope="module")
+def default_deck(tmp_path_factory):
+    deck = tmp_path_factory.mktemp("deck") / "deck.pptx"
+    create_ppt.save_deck(create_ppt.build_deck(), str(deck))
+    return deck
+
+
+def _size(run):
+    """run 글자 크기 pt (run 서식에 없으면 문단 기본 서식)"""
+    r_pr = run.find("a:rPr", _NS)
+    if r_pr is None or r_pr.get("sz") is None:
+        r_pr = run.getparent().find("a:pPr/a:defRPr", _NS)
+    return int(r_pr.get("sz")) / 100
+
+
+def _shape_runs(path, name):
+    """덱에서 이름이 name인 도형의 [(run 텍스트, 글자 크기 pt)]"""
+    with zipfile.ZipFile(path) as zf:
+        for part in zf.namelist():
+            if not deck_patch._SLIDE_PART.match(part):
+                continue
+            root = etree.fromstring(zf.read(part))
+            for c_nv_pr in root.iterfind(".//p:sp/p:nvSpPr/p:cNvPr", _NS):
+                if c_nv_pr.get("name") == name:
+                    sp = c_nv_pr.getparent().getparent()
+                    return [(r.findtext("a:t", "", _NS), _size(r)) for r in sp.iterfind("p:txBody/a:p/a:r", _NS)]
+    raise AssertionError(f"도형 {name}이 없습니다")
+
+
+def test_scalar_keeps_stats_suffix(tmp_path):
+    deck = tmp_path / "deck.pptx"
+    create_ppt.save_deck(create_ppt.build_deck(), str(deck))
+    assert _shape_runs(deck, "stats.0.value") == [("24", 100), ("+", 50)]
+
+    out = tmp_path / "patched.pptx"
+    deck_patch.main([str(deck), "--set", "stats.0.value=30", "--output", str(out)])
+    assert _shape_runs(out, "stats.0.value") == [("30", 100), ("+", 50)]
+
+
+def test_list_replaces_runs_in_order(tmp_path):
+    deck = tmp_path / "deck.pptx"
+    create_ppt.save_deck(create_ppt.build_deck(), str(deck))
+    out = tmp_path / "patched.pptx"
+    deck_patch.patch_deck(str(deck), {"stats.1.value": ["600", "%"]}, str(out))
+    assert _shape_runs(out, "stats.1.value") == [("600", 100), ("%", 50)]
+
+
+def _trends_deck(tmp_path, name, title):
+    """기사 한 건짜리 트렌드 슬라이드 덱과 그 스펙"""
+    source = tmp_path / f"{name}.json"
+    source.write_text(json.dumps({"trends": [{"number": "01", "title": title, "source": "ZDNet Korea",
+                                              "date": "2026.02.07", "summary": "요약"}]}, ensure_ascii=False),
+                      encoding="utf-8")
+    spec = {"slides": [{"type": "trends", "number": "01", "color": "ACCENT_CYAN", "title": "IT TRENDS",
+                        "source": str(source), "per_slide": 5, "summary_length": 80}]}
+    spec_file = tmp_path / f"{name}.spec.json"
+    spec_file.write_text(json.dumps(spec, ensure_ascii=False), encoding="utf-8")
+    deck = tmp_path / f"{name}.pptx"
+    create_ppt.save_deck(create_ppt.build_deck({"spec_file": str(spec_file)}), str(deck))
+    return deck, str(spec_file)
+
+
+def test_trend_title_takes_fitted_size(tmp_path):
+    old, _ = _trends_deck(tmp_path, "old", "짧은 제목")
+    new, spec_file = _trends_deck(tmp_path, "new", "아주 긴 기사 제목 " * 12)
+    assert _shape_runs(old, "trends.0.title") != _shape_runs(new, "trends.0.title")
+
+    values = deck_patch.spec_values(deck_spec.load_spec({"spec_file": spec_file}, color_names=deck_colors.PALETTE))
+    out = tmp_path / "patched.pptx"
+    deck_patch.patch_deck(str(old), values, str(out))
+    # 잘린 제목과 자른 기준 글자 크기가 새로 빌드한 덱과 같아야 함
+    assert _shape_runs(out, "trends.0.title") == _shape_runs(new, "trends.0.title")
+
+
+class _Unseekable(io.RawIOBase):
+    """위치를 옮길 수 없는 출력 (zipfile이 data descriptor 방식으로 씀)"""
+
+    def __init__(self):
+        self.buf = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buf.write(data)
+
+
+def test_data_descriptor_source(tmp_path, default_deck):
+    with zipfile.ZipFile(default_deck) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+    stream = _Unseekable()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, blob in parts.items():
+            zf.writestr(name, blob)
+    deck = tmp_path / "descriptor.pptx"
+    deck.write_bytes(stream.buf.getvalue())
+    with zipfile.ZipFile(deck) as zf:
+        assert all(info.flag_bits & 0x08 for info in zf.infolist())
+
+    out = tmp_path / "patched.pptx"
+    deck_patch.patch_deck(str(deck), {"cover.year": "2030"}, str(out))
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        patched = {name: zf.read(name) for name in zf.namelist()}
+        infos = {info.filename: info for info in zf.infolist()}
+    assert patched.keys() == parts.keys()
+    assert [name for name in parts if patched[name] != parts[name]] == ["ppt/slides/slide1.xml"]
+    # 다시 쓴 슬라이드는 재현 가능한 빌드와 같은 헤더 (운영체제 무관)
+    assert infos["ppt/slides/slide1.xml"].create_system == 3
+    assert _shape_runs(out, "cover.year")[0][0] == "2030"
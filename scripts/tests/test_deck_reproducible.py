@@ -0,0 +1,18 @@
+import io
+
+import pytest
+
+import create_ppt
+import deck_reproducible
+
+
+@pytest.mark.parametrize("timestamp", [None, 1760000000])
+def test_save_matches_normalized_prs_save(timestamp):
+    prs = create_ppt.build_deck({})
+    direct = io.BytesIO()
+    deck_reproducible.save(prs, direct, timestamp)
+    saved = io.BytesIO()
+    prs.save(saved)
+    normalized = io.BytesIO()
+    deck_reproducible.normalize(saved.getvalue(), normalized, timestamp)
+    assert direct.getvalue() == normalized.getvalue()
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import deck_cache
+import deck_server
+
+
+class _Renderer:
+    """render_deck_bytes 대신 쓰는 렌더러 (release()할 때까지 막혀 있음)"""
+
+    def __init__(self):
+        self.calls = []
+        self.gate = threading.Event()
+
+    def __call__(self, spec):
+        self.calls.append(spec)
+        self.gate.wait(10)
+        return f"deck:{spec.get('client')}".encode("utf-8")
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    renderer = _Renderer()
+    monkeypatch.setattr(deck_server, "render_deck_bytes", renderer)
+    yield renderer
+    renderer.gate.set()
+
+
+def _service(tmp_path, workers, queue_size):
+    """프로세스 풀 대신 스레드 풀로 디스패처를 띄운 서비스 (이벤트 루프 안에서 호출)"""
+    service = deck_server.DeckService(workers, queue_size, cache=deck_cache.DeckCache(str(tmp_path / "cache")))
+    service.pool = ThreadPoolExecutor(workers)
+    service._dispatchers = [asyncio.create_task(service._dispatch()) for _ in range(workers)]
+    return service
+
+
+async def _request(port, raw):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status = int(response.split(b" ", 2)[1])
+    return status, response.split(b"\r\n\r\n", 1)[1]
+
+
+def _post(body):
+    data = json.dumps(body).encode("utf-8")
+    return b"POST /decks HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(data) + data
+
+
+def test_same_spec_is_rendered_once(tmp_path, renderer):
+    async def run():
+        service = _service(tmp_path, workers=2, queue_size=0)
+        tasks = [asyncio.create_task(service.render({"client": "LG전자"})) for _ in range(3)]
+        await asyncio.sleep(0.1)
+        renderer.gate.set()
+        results = await asyncio.gather(*tasks)
+        await service.close()
+        return service, results
+
+    service, results = asyncio.run(run())
+    assert len(renderer.calls) == 1
+    assert results == ["deck:LG전자".encode("utf-8")] * 3
+    assert service.stats["coalesced"] == 2 and service.stats["rendered"] == 1
+
+
+def test_burst_fills_idle_workers_before_rejecting(tmp_path, renderer):
+    async def run():
+        service = _service(tmp_path, workers=2, queue_size=1)
+        server = await asyncio.start_server(lambda r, w: deck_server.handle(service, r, w), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        # 워커 2개 + 대기열 1개까지는 디스패처가 꺼내 가기 전에 한꺼번에 와도 받아들임
+        accepted = [asyncio.create_task(_request(port, _post({"client": f"c{i}"}))) for i in range(3)]
+        await asyncio.sleep(0.2)
+        rejected = await _request(port, _post({"client": "c3"}))
+        renderer.gate.set()
+        responses = await asyncio.gather(*accepted)
+        server.close()
+        await service.close()
+        return service, responses, rejected
+
+    service, responses, rejected = asyncio.run(run())
+    assert [status for status, _ in responses] == [200, 200, 200]
+    assert rejected[0] == 503
+    assert service.stats["rejected"] == 1
+
+
+def test_broken_pool_is_replaced(tmp_path, monkeypatch):
+    calls = []
+
+    def crash_once(spec):
+        calls.append(spec)
+        if len(calls) == 1:
+            raise BrokenProcessPool("worker died")
+        return b"deck"
+
+    monkeypatch.setattr(deck_server, "render_deck_bytes", crash_once)
+
+    async def run():
+        service = _service(tmp_path, workers=1, queue_size=1)
+        monkeypatch.setattr(service, "_new_pool", lambda: ThreadPoolExecutor(1))
+        broken = service.pool
+        with pytest.raises(BrokenProcessPool):
+            await service.render({"client": "a"})
+        data = await service.render({"client": "b"})
+        health = await service.health()
+        await service.close()
+        return service, broken, data, health
+
+    service, broken, data, health = asyncio.run(run())
+    assert data == b"deck"
+    assert service.pool is not broken
+    assert health["pool_restarts"] == 1 and health["failed"] == 1 and health["rendered"] == 1
+
+
+@pytest.mark.parametrize("length", [b"-1", b"abc"])
+def test_bad_content_length(tmp_path, length):
+    async def run():
+        service = deck_server.DeckService(1, 1, cache=deck_cache.DeckCache(str(tmp_path / "cache")))
+        server = await asyncio.start_server(lambda r, w: deck_server.handle(service, r, w), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        response = await _request(port, b"POST /decks HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}")
+        server.close()
+        return response
+
+    status, body = asyncio.run(run())
+    assert status == 400
+    assert "Content-Length" in json.loads(body)["error"]
@@ -0,0 +1,22 @@
+import pytest
+
+import deck_theme
+from deck_spec import SpecError
+
+
+@pytest.mark.parametrize("value", [0x1A1A1A, ["#1A1A1A"], None, "0x1A1A", "1A1A1A ", "#12_345"])
+def test_bad_theme_color_is_spec_error(value):
+    with pytest.raises(SpecError, match="테마 broken: .*DARK_BG"):
+        deck_theme.Theme("broken", {"DARK_BG": value})
+
+
+@pytest.mark.parametrize("value", [0x1A1A1A, ["DARK_BG"], "0x1A1A"])
+def test_bad_color_value_is_spec_error(value):
+    with pytest.raises(SpecError, match="테마 plain: 알 수 없는 색상"):
+        deck_theme.Theme("plain").color(value)
+
+
+def test_color_forms():
+    theme = deck_theme.Theme("plain", {"DARK_BG": "#0a0b0c"})
+    assert theme.color("DARK_BG") == "0A0B0C"
+    assert theme.color("#ff8800") == theme.color("ff8800") == "FF8800"
@@ -0,0 +1,53 @@
+import json
+import random
+
+import pytest
+
+import deck_trend_stats
+
+
+@pytest.fixture
+def trends_file(tmp_path):
+    """출처/분류/날짜가 섞인 기사 (빈 값, 기사가 없는 날 포함)"""
+    rng = random.Random(7)
+    sources = ["Ad Age", "Campaign", "AdWeek", "The Drum", "Marketing Week", "Digiday", "Contagious"]
+    categories = ["AI", "Retail", "Media", "Brand", ""]
+    days = ["2026.02.%02d" % day for day in (1, 2, 3, 5, 6, 9)]
+    articles = [{"title": f"article {i}", "source": rng.choice(sources), "category": rng.choice(categories),
+                 "date": rng.choice(days + [""])} for i in range(500)]
+    path = tmp_path / "trends.json"
+    path.write_text(json.dumps({"trends": articles}, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def _all_counts(path):
+    return {(field, limit): deck_trend_stats.count_by(path, field, limit)
+            for field in deck_trend_stats.GROUP_FIELDS for limit in (0, 3, 4)}
+
+
+def test_numpy_matches_counter(trends_file, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(deck_trend_stats, "_COLUMNS", {})
+    with_numpy = _all_counts(trends_file)
+    monkeypatch.setattr(deck_trend_stats, "USE_NUMPY", False)
+    with_counter = _all_counts(trends_file)
+    assert with_numpy == with_counter
+    for categories, values in with_numpy.values():
+        assert all(type(name) is str for name in categories)
+        assert all(type(value) is int for value in values)
+
+
+def test_counts(trends_file, monkeypatch):
+    monkeypatch.setattr(deck_trend_stats, "USE_NUMPY", False)
+    with open(trends_file, encoding="utf-8") as f:
+        articles = json.load(f)["trends"]
+    categories, values = deck_trend_stats.count_by(trends_file, "source", 4)
+    assert categories[-1] == deck_trend_stats.OTHERS
+    assert sum(values) == len(articles)
+    assert values[:3] == sorted(values[:3], reverse=True)
+
+    days, counts = deck_trend_stats.count_by(trends_file, "date")
+    # 기사가 없는 날(4, 7, 8일)도 0으로 채움
+    assert days == ["2026.02.%02d" % day for day in range(1, 10)]
+    assert counts[3] == counts[6] == counts[7] == 0
+    assert sum(counts) == sum(1 for article in articles if article["date"])
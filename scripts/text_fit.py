@@ -0,0 +1,182 @@
+"""텍스트 박스 자동 맞춤 (폰트 메트릭 캐시)
+
+한글은 Noto Sans KR, 그 외 문자는 Inter의 글자 폭(advance width)으로 문자열 폭을
+계산해 박스에 들어가는 가장 큰 글자 크기를 고르거나 줄을 나눈다.
+폰트 파일은 DECK_FONT_DIR 환경 변수 또는 시스템 폰트 폴더에서 찾고,
+Pillow나 폰트 파일이 없으면 두 폰트의 평균 폭을 근사한 표를 사용한다.
+글자 폭은 LRU 캐시에 보관되므로 덱 하나에서 수천 개 문자열을 맞춰도 빠르다.
+"""
+import glob
+import os
+import unicodedata
+from functools import lru_cache
+
+# 텍스트 박스 기본 좌우/상하 여백 (python-pptx 기본값, 인치)
+INSET_X = 0.1 * 2
+INSET_Y = 0.05 * 2
+
+# 폰트 이름 -> (보통, 굵게) 파일 이름 패턴
+FONT_FILES = {
+    "Noto Sans KR": ("NotoSansKR-Regular.*", "NotoSansKR-Bold.*"),
+    "Inter": ("Inter-Regular.*", "Inter-Bold.*"),
+}
+
+FONT_DIRS = [
+    os.environ.get("DECK_FONT_DIR", ""),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts"),
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "/Library/Fonts",
+    "C:/Windows/Fonts",
+]
+
+# 메트릭을 잴 때 쓰는 기준 크기 (폭은 em 비율로 저장)
+_UNITS = 1000
+
+
+@lru_cache(maxsize=None)
+def _font_file(name, bold):
+    """폰트 파일 경로 찾기 (없으면 None)"""
+    pattern = FONT_FILES[name][1 if bold else 0]
+    for folder in FONT_DIRS:
+        if folder and os.path.isdir(folder):
+            found = glob.glob(os.path.join(folder, "**", pattern), recursive=True)
+            if found:
+                return sorted(found)[0]
+    return None
+
+
+@lru_cache(maxsize=None)
+def _load_font(name, bold):
+    """Pillow 폰트 객체 (Pillow나 폰트 파일이 없으면 None)"""
+    path = _font_file(name, bold)
+    if path is None:
+        return None
+    try:
+        from PIL import ImageFont
+        return ImageFont.truetype(path, _UNITS)
+    except (ImportError, OSError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def truetype(name, size, bold=False):
+    """렌더링용 Pillow 폰트 (size는 픽셀, Pillow나 폰트 파일이 없으면 None)"""
+    path = _font_file(name, bold)
+    if path is None:
+        return None
+    try:
+        from PIL import ImageFont
+        return ImageFont.truetype(path, size)
+    except (ImportError, OSError):
+        return None
+
+
+def font_file(name, bold=False):
+    """폰트 이름(FONT_FILES의 키)의 파일 경로 (없으면 None)"""
+    return _font_file(name, bold)
+
+
+def font_files():
+    """찾은 폰트 파일 경로 목록 (없는 폰트는 None) — 렌더링 결과 캐시 키용"""
+    return [_font_file(name, bold) for name in sorted(FONT_FILES) for bold in (False, True)]
+
+
+def _is_hangul(ch):
+    code = ord(ch)
+    return 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F
+
+
+def font_for(ch):
+    """문자에 쓰이는 폰트 이름"""
+    return "Noto Sans KR" if _is_hangul(ch) or unicodedata.east_asian_width(ch) in "WF" else "Inter"
+
+
+def _approx_advance(ch, bold):
+    """폰트 파일이 없을 때 쓰는 근사 글자 폭 (em 비율)"""
+    if ch == " ":
+        width = 0.26
+    elif unicodedata.east_asian_width(ch) in "WF":
+        width = 0.92 if _is_hangul(ch) else 1.0
+    elif ch in "il.,:;'|!":
+        width = 0.26
+    elif ch in "mwMW":
+        width = 0.86
+    elif ch.isupper() or ch.isdigit():
+        width = 0.66
+    else:
+        width = 0.54
+    return width * 1.05 if bold else width
+
+
+@lru_cache(maxsize=65536)
+def advance(ch, bold=False):
+    """글자 하나의 폭 (em 비율)"""
+    font = _load_font(font_for(ch), bold)
+    if font is None:
+        return _approx_advance(ch, bold)
+    return font.getlength(ch) / _UNITS
+
+
+@lru_cache(maxsize=8192)
+def text_width(text, size, bold=False):
+    """한 줄 문자열의 폭 (인치, size는 pt)"""
+    return sum(advance(ch, bold) for ch in text) * size / 72
+
+
+def wrap_lines(text, size, width, bold=False):
+    """박스 폭(인치)에 맞게 줄 나누기 — 단어 단위, 단어가 너무 길면 글자 단위"""
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if text_width(candidate, size, bold) <= width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            line = ""
+            for ch in word:
+                if line and text_width(line + ch, size, bold) > width:
+                    lines.append(line)
+                    line = ""
+                line += ch
+        lines.append(line)
+    return lines
+
+
+def fit_font_size(text, width, height, max_size, min_size=8, bold=False,
+                  line_spacing=1.2, wrap=True):
+    """박스(인치)에 들어가는 가장 큰 글자 크기(pt, 정수) 반환
+
+    wrap이 False면 줄바꿈 없이 한 줄 폭만 본다. min_size에서도 넘치면 min_size를 반환한다.
+    """
+    width -= INSET_X
+    height -= INSET_Y
+    for size in range(int(max_size), int(min_size) - 1, -1):
+        if wrap:
+            lines = wrap_lines(text, size, width, bold)
+        else:
+            lines = text.split("\n")
+            if max(text_width(line, size, bold) for line in lines) > width:
+                continue
+        if len(lines) * size * line_spacing / 72 <= height:
+            return size
+    return int(min_size)
+
+
+def truncate_to_width(text, size, width, bold=False):
+    """한 줄 폭(인치)을 넘으면 말줄임표를 붙여 자르기"""
+    width -= INSET_X
+    if text_width(text, size, bold) <= width:
+        return text
+    ellipsis = advance("…", bold) * size / 72
+    total = 0.0
+    for i, ch in enumerate(text):
+        total += advance(ch, bold) * size / 72
+        if total + ellipsis > width:
+            return text[:i].rstrip() + "…"
+    return text
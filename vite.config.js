@@ -7,5 +7,12 @@ export default defineConfig({
   server: {
     host: '0.0.0.0',
     port: 5173,
+    // 덱 생성 서비스 (python scripts/deck_server.py)
+    proxy: {
+      '/api/decks': {
+        target: 'http://127.0.0.1:8765',
+        rewrite: (path) => path.replace(/^\/api/, ''),
+      },
+    },
   },
 })